@@ -2,48 +2,153 @@
 # SPDX-License-Identifier: BSD-4-Clause
 from __future__ import annotations
 
+import importlib
+import importlib.abc
+import importlib.machinery
 import sys
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
 
-from . import config as parserconfig, input as tokenizing
-from ._grammar import grammar, grammar_path
-from ._version import __toolname__, __version__, version, version_info
-from .api import (
-    compile,
-    compile_to_parser,
-    gencode,
-    genmodel,
-    parse,
-    to_grammar_json,
-    to_python_model,
-    to_python_sourcecode,
-)  # pylint: disable=W0622
-from .contexts import ast as ast
-from .contexts.decorator import isname, leftrec, name, nomemo, rule, tatsumasu
-from .input import buffer as buffer, buffer as buffering, textlines as textlines
-from .objectmodel import (
-    NodeDataclassParams,
-    NodeDataclassParams as TatSuDataclassParams,
-    builder as builder,
-    nodedataclass,
-    nodedataclass as dataclass,
-    nodedataclass as tatsudataclass,
-)
-from .tool.cli import tatsu_main
+
+# NOTE:
+#   The core packages import each other, and they only load cleanly when
+#   `util` comes before `contexts`. Loading them here keeps any submodule
+#   importable on its own.
+from . import contexts as contexts, util as util  # isort: skip
+
+
+if TYPE_CHECKING:
+    from . import config as parserconfig, input as tokenizing  # noqa: F401
+    from ._grammar import grammar, grammar_path
+    from ._version import __toolname__, __version__, version, version_info
+    from .api import (
+        compile,
+        compile_to_parser,
+        gencode,
+        genmodel,
+        parse,
+        parse_many,
+        to_grammar_json,
+        to_python_model,
+        to_python_parser,
+        to_python_sourcecode,
+    )  # pylint: disable=W0622
+    from .contexts import ast as ast
+    from .contexts.decorator import isname, leftrec, name, nomemo, rule, tatsumasu
+    from .input import (
+        buffer as buffer,
+        buffer as buffering,  # noqa: F401
+        textlines as textlines,
+    )
+    from .objectmodel import (
+        NodeDataclassParams,
+        NodeDataclassParams as TatSuDataclassParams,
+        builder as builder,
+        nodedataclass,
+        nodedataclass as dataclass,
+        nodedataclass as tatsudataclass,
+    )
+    from .tool.cli import tatsu_main
+
+
+# NOTE:
+#   Public names are imported on first use, so `import tatsu` does not pay
+#   for the whole toolchain. Each entry is `name: (module, attribute)`, and
+#   an attribute of `None` means the module itself.
+_LAZY: dict[str, tuple[str, str | None]] = {
+    'parserconfig': ('.config', None),
+    'tokenizing': ('.input', None),
+    'grammar': ('._grammar', 'grammar'),
+    'grammar_path': ('._grammar', 'grammar_path'),
+    '__toolname__': ('._version', '__toolname__'),
+    '__version__': ('._version', '__version__'),
+    'version': ('._version', 'version'),
+    'version_info': ('._version', 'version_info'),
+    'compile': ('.api', 'compile'),
+    'compile_to_parser': ('.api', 'compile_to_parser'),
+    'gencode': ('.api', 'gencode'),
+    'genmodel': ('.api', 'genmodel'),
+    'parse': ('.api', 'parse'),
+    'parse_many': ('.api', 'parse_many'),
+    'to_grammar_json': ('.api', 'to_grammar_json'),
+    'to_python_model': ('.api', 'to_python_model'),
+    'to_python_parser': ('.api', 'to_python_parser'),
+    'to_python_sourcecode': ('.api', 'to_python_sourcecode'),
+    'ast': ('.contexts.ast', None),
+    'isname': ('.contexts.decorator', 'isname'),
+    'leftrec': ('.contexts.decorator', 'leftrec'),
+    'name': ('.contexts.decorator', 'name'),
+    'nomemo': ('.contexts.decorator', 'nomemo'),
+    'rule': ('.contexts.decorator', 'rule'),
+    'tatsumasu': ('.contexts.decorator', 'tatsumasu'),
+    'buffer': ('.input.buffer', None),
+    'buffering': ('.input.buffer', None),
+    'textlines': ('.input.textlines', None),
+    'NodeDataclassParams': ('.objectmodel', 'NodeDataclassParams'),
+    'TatSuDataclassParams': ('.objectmodel', 'NodeDataclassParams'),
+    'builder': ('.objectmodel.builder', None),
+    'nodedataclass': ('.objectmodel', 'nodedataclass'),
+    'dataclass': ('.objectmodel', 'nodedataclass'),
+    'tatsudataclass': ('.objectmodel', 'nodedataclass'),
+    'tatsu_main': ('.tool.cli', 'tatsu_main'),
+}
 
 
 # HACK!
 # NOTE: this is for backwrds compatibility with legacy generated parsers
-sys.modules.update(  # noqa: RUF067
-    {
-        'tatsu.ast': ast,
-        'tatsu.builder': builder,
-        'tatsu.buffering': buffering,
-        'tatsu.parserconfig': parserconfig,
-        'tatsu.tokenizing': tokenizing,
-        'tatsu.tokenizing.buffer': buffer,
-        'tatsu.tokenizing.textlines': textlines,
-    }
-)
+_ALIASES: dict[str, str] = {
+    'tatsu.ast': 'tatsu.contexts.ast',
+    'tatsu.builder': 'tatsu.objectmodel.builder',
+    'tatsu.buffering': 'tatsu.input.buffer',
+    'tatsu.parserconfig': 'tatsu.config',
+    'tatsu.tokenizing': 'tatsu.input',
+    'tatsu.tokenizing.buffer': 'tatsu.input.buffer',
+    'tatsu.tokenizing.textlines': 'tatsu.input.textlines',
+}
+
+
+class _AliasFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """A meta path finder and loader for the legacy module names."""
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Any = None,
+        target: ModuleType | None = None,
+    ) -> importlib.machinery.ModuleSpec | None:
+        _ = path, target
+        if fullname not in _ALIASES:
+            return None
+        return importlib.machinery.ModuleSpec(fullname, self)
+
+    def create_module(self, spec: importlib.machinery.ModuleSpec) -> ModuleType:
+        module = importlib.import_module(_ALIASES[spec.name])
+        spec.loader_state = module.__spec__
+        return module
+
+    def exec_module(self, module: ModuleType) -> None:
+        # NOTE: importlib gave the module the spec of its alias
+        assert module.__spec__ is not None
+        module.__spec__ = module.__spec__.loader_state
+
+
+if not any(isinstance(f, _AliasFinder) for f in sys.meta_path):
+    sys.meta_path.insert(0, _AliasFinder())
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    modname, attr = _LAZY[name]
+    module = importlib.import_module(modname, __name__)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY})
 
 
 __all__ = [
@@ -55,9 +160,11 @@ __all__ = [
     'gencode',
     'genmodel',
     'parse',
+    'parse_many',
     'tatsu_main',
     'to_grammar_json',
     'to_python_model',
+    'to_python_parser',
     'to_python_sourcecode',
     'version',
     'version_info',
@@ -3,3 +3,4 @@
 from __future__ import annotations
 
 from .api import *  # noqa: F403
+from .batch import BatchResult as BatchResult, parse_many as parse_many
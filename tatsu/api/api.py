@@ -2,9 +2,11 @@
 # SPDX-License-Identifier: BSD-4-Clause
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from collections.abc import Callable
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 from .. import peg as g
 from ..boot import TatSuParserGenerator
@@ -14,7 +16,7 @@ from ..exceptions import ParseException
 from ..input import Text
 from ..ngcodegen.grammar_gen import parsermodel_gen
 from ..ngcodegen.ngmodel_gen import modelgen
-from ..ngcodegen.ngparser_gen import pythongen
+from ..ngcodegen.ngparser_gen import pythongen, pythonparser
 from ..objectmodel import Node
 from ..objectmodel.builder import (
     BuilderConfig,
@@ -23,9 +25,92 @@ from ..objectmodel.builder import (
     TypeContainer,
 )
 from ..util import hasha
-
-
-__compiled_grammar_cache: dict[tuple[str | None, str, int], g.Grammar] = {}
+from .diskcache import GrammarCache
+
+
+DEFAULT_GRAMMAR_CACHE_SIZE = 128
+
+
+class GrammarCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class CompiledGrammarCache:
+    """
+    A bounded LRU cache of compiled grammars.
+
+    The cached grammars are never handed out or changed. `compile()` returns
+    a copy bound to the caller's semantics, so the cache does not keep
+    semantics objects alive, and callers do not see each other's.
+    The cache may be used from many threads.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_GRAMMAR_CACHE_SIZE) -> None:
+        self._grammars: OrderedDict[str, g.Grammar] = OrderedDict()
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int) -> None:
+        if value < 0:
+            raise ValueError(f'maxsize must not be negative: {value}')
+        with self._lock:
+            self._maxsize = value
+            self._evict()
+
+    @staticmethod
+    def key(grammar: str | Text, name: str | None, **settings: Any) -> str:
+        return hasha(f'{name!r}\n{sorted(settings.items())!r}\n{grammar}')
+
+    def get(self, key: str) -> g.Grammar | None:
+        with self._lock:
+            model = self._grammars.get(key)
+            if model is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._grammars.move_to_end(key)
+            return model
+
+    def put(self, key: str, model: g.Grammar) -> None:
+        with self._lock:
+            self._grammars[key] = model
+            self._grammars.move_to_end(key)
+            self._evict()
+
+    def _evict(self) -> None:
+        # NOTE: called with the lock held
+        while len(self._grammars) > self._maxsize:
+            self._grammars.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._grammars.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> GrammarCacheInfo:
+        with self._lock:
+            return GrammarCacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                maxsize=self.maxsize,
+                currsize=len(self._grammars),
+            )
+
+    def __len__(self) -> int:
+        return len(self._grammars)
+
+
+compiled_grammar_cache = CompiledGrammarCache()
 
 
 def boot_grammar() -> g.Grammar:
@@ -46,6 +131,7 @@ def compile(
     synthok: bool = True,
     typedefs: list[TypeContainer] | None = None,
     constructors: list[Constructor] | None = None,
+    cachedir: str | Path | None = None,
     **settings: Any,
 ) -> g.Grammar:
     filename = filename or settings.pop('source', None)
@@ -60,14 +146,11 @@ def compile(
         raise TypeError(
             f'semantics must be an object instance or None, not class {semantics!r}',
         )
-    cache = __compiled_grammar_cache
-
-    key = (name, hasha(grammar), id(semantics))
-    if key in cache:
-        model = cache[key]
-    else:
-        gen = TatSuParserGenerator(name, **settings)
-        model = cache[key] = gen.parse(grammar, **settings)
+    cache = compiled_grammar_cache
+    key = cache.key(grammar, name, **settings)
+    if (model := cache.get(key)) is None:
+        model = _generate(grammar, name, cachedir, **settings)
+        cache.put(key, model)
 
     asmodel = not semantics and (
         asmodel
@@ -76,9 +159,7 @@ def compile(
         or typedefs is not None
         or constructors is not None
     )
-    if semantics is not None:
-        model.semantics = semantics
-    elif asmodel:
+    if semantics is None and asmodel:
         # HACK: cheating, but necessary for bw-compatibility
         builderconfig = BuilderConfig.new(
             config=builderconfig,
@@ -87,9 +168,30 @@ def compile(
             typedefs=typedefs,
             constructors=constructors,
         )
-        model.semantics = ModelBuilderSemantics(config=builderconfig)
+        semantics = ModelBuilderSemantics(config=builderconfig)
+
+    return model.with_semantics(semantics)
+
+
+def _generate(
+    grammar: str | Text,
+    name: str | None,
+    cachedir: str | Path | None,
+    **settings: Any,
+) -> g.Grammar:
+    cachedir = cachedir or GrammarCache.default_cachedir()
+    if not cachedir:
+        gen = TatSuParserGenerator(name, **settings)
+        return gen.parse(grammar, **settings)
+
+    store = GrammarCache(cachedir)
+    key = store.key(grammar, name, **settings)
+    if (model := store.load(key)) is not None:
+        return model
 
-    model.initialize()
+    gen = TatSuParserGenerator(name, **settings)
+    model = gen.parse(grammar, **settings)
+    store.save(key, model)
     return model
 
 
@@ -179,12 +281,37 @@ def to_python_sourcecode(
     name: str | None = None,
     filename: str | None = None,
     config: ParserConfig | None = None,
+    fast: bool = False,
     **settings: Any,
 ) -> str:
     filename = filename or settings.pop('source', None)
     config = ParserConfig.new(config=config, name=name, source=filename, **settings)
     model = compile(grammar, config=config, name=name, source=filename)
-    return pythongen(model)
+    return pythongen(model, fast=fast)
+
+
+def to_python_parser(
+    grammar: str,
+    /,
+    *,
+    name: str | None = None,
+    filename: str | None = None,
+    config: ParserConfig | None = None,
+    fast: bool = False,
+    **settings: Any,
+) -> type:
+    """
+    Generate the Python parser for a grammar and load it in memory.
+
+    The generated code is compiled and run in a new module without going
+    through the file system, and the parser class is returned. The code is
+    generated as text first, so generation is no faster than with
+    `to_python_sourcecode()`.
+    """
+    filename = filename or settings.pop('source', None)
+    config = ParserConfig.new(config=config, name=name, source=filename, **settings)
+    model = compile(grammar, config=config, name=name, source=filename)
+    return pythonparser(model, parser_name=name or '', fast=fast)
 
 
 def to_python_model(
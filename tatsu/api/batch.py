@@ -0,0 +1,135 @@
+# Copyright (c) 2017-2026 Juancarlo Añez (apalala@gmail.com)
+# SPDX-License-Identifier: BSD-4-Clause
+from __future__ import annotations
+
+import multiprocessing
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from .. import peg as g
+from ..exceptions import ParseException
+from ..parproc import HAS_MULTITHREADING_SUPPORT
+
+
+__all__ = ['BatchResult', 'parse_many']
+
+
+class BatchResult(NamedTuple):
+    number: int
+    path: Path | None
+    ast: Any = None
+    exception: Exception | None = None
+
+    @property
+    def success(self) -> bool:
+        return self.exception is None
+
+
+type _Task = tuple[int, str | Path]
+type _Worker = tuple[g.Grammar, str | None, dict[str, Any]]
+
+# NOTE: what each worker process parses with, set once by _initialize()
+_worker: _Worker | None = None
+
+
+def _newworker(grammar: g.Grammar | str, start: str | None, settings: dict) -> _Worker:
+    if isinstance(grammar, str):
+        # NOTE: a worker that compiles finds the grammar in the on-disk cache
+        from .api import compile
+
+        grammar = compile(grammar)
+    return (grammar, start, settings)
+
+
+def _initialize(grammar: g.Grammar | str, start: str | None, settings: dict) -> None:
+    global _worker  # noqa: PLW0603
+    _worker = _newworker(grammar, start, settings)
+
+
+def _parse_in_process(task: _Task) -> BatchResult:
+    assert _worker is not None
+    return _parse(_worker, task)
+
+
+def _parse(worker: _Worker, task: _Task) -> BatchResult:
+    grammar, start, settings = worker
+    number, source = task
+    path = source if isinstance(source, Path) else None
+    try:
+        if path is not None:
+            text = path.read_text()
+            settings = {**settings, 'source': str(path)}
+        else:
+            text = str(source)
+        return BatchResult(number, path, grammar.parse(text, start=start, **settings))
+    except (ParseException, RecursionError, OSError) as e:
+        return BatchResult(number, path, exception=e)
+
+
+def parse_many(
+    grammar: g.Grammar | str,
+    sources: Iterable[str | Path],
+    /,
+    *,
+    start: str | None = None,
+    parallel: bool = True,
+    max_workers: int | None = None,
+    **settings: Any,
+) -> Iterator[BatchResult]:
+    """
+    Parse each of `sources` with `grammar`, yielding the results as they are
+    done, which may not be in the order of the sources.
+
+    A `Path` source is read by the worker that parses it, and any other is
+    the text to parse. The grammar is sent once to each worker process, or
+    its text, which the workers compile, finding it in the on-disk cache of
+    compiled grammars if there is one. Then the tasks carry only the paths
+    or the texts. The threads, and the parse when not `parallel`, share the
+    grammar of the call.
+
+    Parse errors don't stop the batch. They are in `BatchResult.exception`.
+    """
+    tasks: Iterator[_Task] = iter(enumerate(sources))
+    initargs = (grammar, start, settings)
+    if not parallel:
+        yield from map(partial(_parse, _newworker(*initargs)), tasks)
+        return
+
+    max_workers = max_workers or multiprocessing.cpu_count()
+    executor: Executor
+    parse: Callable[[_Task], BatchResult]
+    if HAS_MULTITHREADING_SUPPORT:
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        parse = partial(_parse, _newworker(*initargs))
+    else:
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_initialize,
+            initargs=initargs,
+        )
+        parse = _parse_in_process
+    with executor:
+        # NOTE: only a few tasks per worker are in flight at any time
+        pending: set[Future[BatchResult]] = {
+            executor.submit(parse, task) for task in islice(tasks, 2 * max_workers)
+        }
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.update(executor.submit(parse, t) for t in islice(tasks, 1))
+                    yield future.result()
+        except (KeyboardInterrupt, GeneratorExit):
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
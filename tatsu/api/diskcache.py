@@ -0,0 +1,99 @@
+# Copyright (c) 2017-2026 Juancarlo Añez (apalala@gmail.com)
+# SPDX-License-Identifier: BSD-4-Clause
+from __future__ import annotations
+
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from .. import peg as g
+from .._version import __version__
+from ..util import hasha
+
+
+__all__ = ['CACHEDIR_ENV', 'GrammarCache']
+
+
+CACHEDIR_ENV = 'TATSU_CACHE_DIR'
+
+_MAGIC = 'tatsu-grammar-cache-1'
+
+
+class GrammarCache:
+    """
+    An on-disk store of compiled grammars.
+
+    Entries are keyed on a hash of the grammar text, the grammar name, the
+    settings used to compile it, the TatSu version, and the Python version,
+    so any change to those makes for a new entry. An entry holds the linked
+    and optimized `Grammar` together with the first and follow sets of its
+    rules, so loading it skips the analysis done by `Grammar.initialize()`.
+
+    Entries are pickles. The cache directory must be as trusted as the
+    code that uses it.
+    """
+
+    def __init__(self, cachedir: str | Path) -> None:
+        self.cachedir = Path(cachedir)
+
+    @staticmethod
+    def default_cachedir() -> str | None:
+        return os.environ.get(CACHEDIR_ENV) or None
+
+    def key(self, grammar: Any, name: str | None = None, **settings: Any) -> str:
+        settings_repr = repr(sorted(settings.items()))
+        version = f'{__version__} {sys.version_info[:2]}'
+        return hasha(f'{_MAGIC}\n{version}\n{name!r}\n{settings_repr}\n{grammar}')
+
+    def path(self, key: str) -> Path:
+        return self.cachedir / f'{key}.grammar.pickle'
+
+    def load(self, key: str) -> g.Grammar | None:
+        path = self.path(key)
+        try:
+            magic, stored_key, grammar, analysis = pickle.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception:  # noqa: BLE001
+            # NOTE: a stale or broken entry is just a miss
+            path.unlink(missing_ok=True)
+            return None
+
+        if magic != _MAGIC or stored_key != key or not isinstance(grammar, g.Grammar):
+            return None
+
+        optimized = grammar._optimized
+        grammar.relink(analysis[0])
+        if isinstance(optimized, g.Grammar) and optimized is not grammar:
+            optimized.relink(analysis[1])
+        return grammar
+
+    def save(self, key: str, grammar: g.Grammar) -> bool:
+        optimized = grammar.optimized()
+        analysis = (grammar.analysis(), optimized.analysis())
+        try:
+            data = pickle.dumps(
+                (_MAGIC, key, grammar, analysis),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False
+
+        # NOTE: write and rename so readers never see a partial entry
+        try:
+            self.cachedir.mkdir(parents=True, exist_ok=True)
+            fd, tmpname = tempfile.mkstemp(dir=self.cachedir, suffix='.tmp')
+        except OSError:
+            return False
+        tmp = Path(tmpname)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            tmp.replace(self.path(key))
+        except OSError:
+            tmp.unlink(missing_ok=True)
+            return False
+        return True
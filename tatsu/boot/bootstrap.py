@@ -129,6 +129,7 @@ class TatSuBootstrapRules:
             def _(ctx: Ctx) -> Any:
                 with ctx.choice() as α:
                     α.expecting('@@', '@@keyword', '→directive', '→keyword')
+                    α.firstchars('@', '@')
 
                     @α.option
                     def _(ctx: Ctx) -> Any:
@@ -145,6 +146,7 @@ class TatSuBootstrapRules:
             def _(ctx: Ctx) -> Any:
                 with ctx.choice() as α:
                     α.expecting('<', '=|::=|:=?', '@@keyword', '→decorator', '→keyword', '→rule')
+                    α.firstchars(None, '@')
 
                     @α.option
                     def _(ctx: Ctx) -> Any:
@@ -177,21 +179,14 @@ class TatSuBootstrapRules:
                   'parseinfo',
                   'whitespace'
                 )
+                α.firstchars('ce', 'w', 'ilmnp', 'g', 'n')
 
                 @α.option
                 def _(ctx: Ctx) -> Any:
                     ctx.define(['name', 'value'], [])
                     with ctx.nameset('name'):
                         with ctx.group():
-                            with ctx.choice() as β:
-                                β.expecting('comments', 'eol_comments')
-
-                                @β.option
-                                def _(ctx: Ctx) -> Any:
-                                    ctx.token('comments')
-                                @β.option
-                                def _(ctx: Ctx) -> Any:
-                                    ctx.token('eol_comments')
+                            ctx.tokens('comments', 'eol_comments')
                     ctx.cut()
                     ctx.token('::')
                     ctx.cut()
@@ -209,6 +204,7 @@ class TatSuBootstrapRules:
                         with ctx.group():
                             with ctx.choice() as β:
                                 β.expecting('False', 'None', '→regex', '→string')
+                                β.firstchars('/?', '"\'', 'N', 'F', None)
 
                                 @β.option
                                 def _(ctx: Ctx) -> Any:
@@ -230,28 +226,12 @@ class TatSuBootstrapRules:
                     ctx.define(['name', 'value'], [])
                     with ctx.nameset('name'):
                         with ctx.group():
-                            with ctx.choice() as β:
-                                β.expecting('ignorecase', 'left_recursion', 'memoization', 'nameguard', 'parseinfo')
-
-                                @β.option
-                                def _(ctx: Ctx) -> Any:
-                                    ctx.token('nameguard')
-                                @β.option
-                                def _(ctx: Ctx) -> Any:
-                                    ctx.token('ignorecase')
-                                @β.option
-                                def _(ctx: Ctx) -> Any:
-                                    ctx.token('left_recursion')
-                                @β.option
-                                def _(ctx: Ctx) -> Any:
-                                    ctx.token('parseinfo')
-                                @β.option
-                                def _(ctx: Ctx) -> Any:
-                                    ctx.token('memoization')
+                            ctx.tokens('nameguard', 'ignorecase', 'left_recursion', 'parseinfo', 'memoization')
                     ctx.cut()
                     with ctx.group():
                         with ctx.choice() as β:
                             β.expecting('::')
+                            β.firstchars(':', None)
 
                             @β.option
                             def _(ctx: Ctx) -> Any:
@@ -301,6 +281,7 @@ class TatSuBootstrapRules:
         with ctx.group():
             with ctx.choice() as α:
                 α.expecting('(', '→string', '→word')
+                α.firstchars('(', None)
 
                 @α.option
                 def _(ctx: Ctx) -> Any:
@@ -312,6 +293,7 @@ class TatSuBootstrapRules:
                             def _(ctx: Ctx) -> Any:
                                 with ctx.choice() as β:
                                     β.expecting('→string', '→word')
+                                    β.firstchars(None, '"\'')
 
                                     @β.option
                                     def _(ctx: Ctx) -> Any:
@@ -329,6 +311,7 @@ class TatSuBootstrapRules:
                                 with ctx.group():
                                     with ctx.choice() as β:
                                         β.expecting('→string', '→word')
+                                        β.firstchars(None, '"\'')
 
                                         @β.option
                                         def _(ctx: Ctx) -> Any:
@@ -338,15 +321,7 @@ class TatSuBootstrapRules:
                                             self.string(ctx)
                             with ctx.ifnot_():
                                 with ctx.group():
-                                    with ctx.choice() as β:
-                                        β.expecting(':', '=')
-
-                                        @β.option
-                                        def _(ctx: Ctx) -> Any:
-                                            ctx.token(':')
-                                        @β.option
-                                        def _(ctx: Ctx) -> Any:
-                                            ctx.token('=')
+                                    ctx.tokens(':', '=')
 
     @tatsu.rule
     def params(self, ctx: Ctx) -> Any:
@@ -432,6 +407,7 @@ class TatSuBootstrapRules:
     def paramdef(self, ctx: Ctx) -> Any:
         with ctx.choice() as α:
             α.expecting('(', '::', '[')
+            α.firstchars('[', '(', ':')
 
             @α.option
             def _(ctx: Ctx) -> Any:
@@ -523,6 +499,7 @@ class TatSuBootstrapRules:
         with ctx.optional():
             with ctx.choice() as α:
                 α.expecting('(', '::', '[')
+                α.firstchars('[', '(', ':')
 
                 @α.option
                 def _(ctx: Ctx) -> Any:
@@ -618,6 +595,7 @@ class TatSuBootstrapRules:
     def ENDRULE(self, ctx: Ctx) -> Any:
         with ctx.choice() as α:
             α.expecting(';', '→BLANK', '→DEDENT', '→EOL')
+            α.firstchars(None, None, ';', None)
 
             @α.option
             def _(ctx: Ctx) -> Any:
@@ -781,6 +759,7 @@ class TatSuBootstrapRules:
               '→term',
               '→void'
             )
+            α.firstchars('+=@', '@', None, None, '>')
 
             @α.option
             def _(ctx: Ctx) -> Any:
@@ -841,6 +820,7 @@ class TatSuBootstrapRules:
     def override(self, ctx: Ctx) -> Any:
         with ctx.choice() as α:
             α.expecting('=|@:', '\\+=|@\\+:', '→override_list', '→override_single')
+            α.firstchars('+@', '=@')
 
             @α.option
             def _(ctx: Ctx) -> Any:
@@ -904,6 +884,23 @@ class TatSuBootstrapRules:
               '{}',
               '~'
             )
+            α.firstchars(
+              None,
+              None,
+              None,
+              None,
+              '{',
+              None,
+              None,
+              None,
+              None,
+              '(',
+              '-',
+              '&',
+              '!',
+              '~',
+              '>'
+            )
 
             @α.option
             def _(ctx: Ctx) -> Any:
@@ -1114,6 +1111,7 @@ class TatSuBootstrapRules:
               '→token',
               '{'
             )
+            α.firstchars('{', None)
 
             @α.option
             def _(ctx: Ctx) -> Any:
@@ -1153,6 +1151,7 @@ class TatSuBootstrapRules:
               '→token',
               '{'
             )
+            α.firstchars('{', None)
 
             @α.option
             def _(ctx: Ctx) -> Any:
@@ -1196,6 +1195,7 @@ class TatSuBootstrapRules:
               '→skip',
               '→token'
             )
+            α.firstchars('[', None)
 
             @α.option
             def _(ctx: Ctx) -> Any:
@@ -1211,18 +1211,7 @@ class TatSuBootstrapRules:
                     self.atom(ctx)
                 with ctx.ifnot_():
                     with ctx.group():
-                        with ctx.choice() as β:
-                            β.expecting('?"', "?'", '?/')
-
-                            @β.option
-                            def _(ctx: Ctx) -> Any:
-                                ctx.token('?"')
-                            @β.option
-                            def _(ctx: Ctx) -> Any:
-                                ctx.token("?'")
-                            @β.option
-                            def _(ctx: Ctx) -> Any:
-                                ctx.token('?/')
+                        ctx.tokens('?"', "?'", '?/')
                 ctx.token('?')
                 ctx.cut()
 
@@ -1273,6 +1262,7 @@ class TatSuBootstrapRules:
               '→string',
               '→token'
             )
+            α.firstchars('@', '"\'r', None, '/', '/?', '(', '(', '$', '$', '^', '`')
 
             @α.option
             def _(ctx: Ctx) -> Any:
@@ -1352,6 +1342,7 @@ class TatSuBootstrapRules:
         with ctx.group():
             with ctx.choice() as α:
                 α.expecting('(?ms)```((?:.|\\n)*?)```', '`', '`(.*?)`')
+                α.firstchars(None, '`', None)
 
                 @α.option
                 def _(ctx: Ctx) -> Any:
@@ -1378,6 +1369,7 @@ class TatSuBootstrapRules:
     def token(self, ctx: Ctx) -> Any:
         with ctx.choice() as α:
             α.expecting('"', "'", 'r["\\\']', '→raw_string', '→string')
+            α.firstchars('"\'', 'r')
 
             @α.option
             def _(ctx: Ctx) -> Any:
@@ -1414,6 +1406,7 @@ class TatSuBootstrapRules:
               '→value',
               '→word'
             )
+            α.firstchars('r', '"\'-0123456789fnt', 'FT', 'N', None, '0', None, None)
 
             @α.option
             def _(ctx: Ctx) -> Any:
@@ -1444,18 +1437,11 @@ class TatSuBootstrapRules:
     def string(self, ctx: Ctx) -> Any:
         with ctx.if_():
             with ctx.group():
-                with ctx.choice() as α:
-                    α.expecting('"', "'")
-
-                    @α.option
-                    def _(ctx: Ctx) -> Any:
-                        ctx.token('"')
-                    @α.option
-                    def _(ctx: Ctx) -> Any:
-                        ctx.token("'")
+                ctx.tokens('"', "'")
         with ctx.group():
             with ctx.choice() as α:
                 α.expecting('→doublequoted', '→multiline_string', '→singlequoted')
+                α.firstchars('"\'', "'", '"')
 
                 @α.option
                 def _(ctx: Ctx) -> Any:
@@ -1562,6 +1548,7 @@ class TatSuBootstrapRules:
     def regex(self, ctx: Ctx) -> Any:
         with ctx.choice() as α:
             α.expecting('?/', '→deprecated_regex')
+            α.firstchars('?', None)
 
             @α.option
             def _(ctx: Ctx) -> Any:
@@ -1573,6 +1560,7 @@ class TatSuBootstrapRules:
                 with ctx.group():
                     with ctx.choice() as β:
                         β.expecting('?', '→REGEX')
+                        β.firstchars(None, '?')
 
                         @β.option
                         def _(ctx: Ctx) -> Any:
@@ -1602,15 +1590,7 @@ class TatSuBootstrapRules:
 
     @tatsu.rule
     def boolean(self, ctx: Ctx) -> Any:
-        with ctx.choice() as α:
-            α.expecting('False', 'True')
-
-            @α.option
-            def _(ctx: Ctx) -> Any:
-                ctx.token('True')
-            @α.option
-            def _(ctx: Ctx) -> Any:
-                ctx.token('False')
+        ctx.tokens('True', 'False')
 
     @tatsu.rule
     def none(self, ctx: Ctx) -> Any:
@@ -1638,6 +1618,7 @@ class TatSuBootstrapRules:
               '→string',
               'true'
             )
+            α.firstchars('"\'', '-0123456789', 't', 'f', 'n')
 
             @α.option
             def _(ctx: Ctx) -> Any:
@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: BSD-4-Clause
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 from .ast import AST
 from .context import ParseContext
 from .ctx import CanParse, Ctx, Func
@@ -10,10 +12,15 @@ from .infos import RuleInfo
 from .state import _AT_, ParseState, ParseStateStack
 
 
+if TYPE_CHECKING:
+    from .session import ParseSession
+
+
 __all__ = [
     'AST',
     'ParseContext',
     'RuleInfo',
+    'ParseSession',
     'CanParse',
     'Ctx',
     'Func',
@@ -27,3 +34,12 @@ __all__ = [
     'ParseState',
     'ParseStateStack',
 ]
+
+
+def __getattr__(attr: str) -> Any:
+    # NOTE: the sessions are loaded on first use, as the public names of tatsu
+    if attr == 'ParseSession':
+        from .session import ParseSession
+
+        return ParseSession
+    raise AttributeError(f'module {__name__!r} has no attribute {attr!r}')
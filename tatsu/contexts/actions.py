@@ -0,0 +1,99 @@
+# Copyright (c) 2017-2026 Juancarlo Añez (apalala@gmail.com)
+# SPDX-License-Identifier: BSD-4-Clause
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from ..util import safe_name
+from ..util.typetools import BoundCallable
+
+
+__all__ = ['ActionCall', 'find_semantic_action']
+
+
+def find_semantic_action(semantics: Any, name: str) -> Callable[..., Any] | None:
+    if not semantics:
+        return None
+
+    for rulename in (name, safe_name(name), name.strip('_'), f'_{name}', f'_{name}_'):
+        action = getattr(semantics, safe_name(rulename), None)
+        if callable(action):
+            break
+    else:
+        action = None
+
+    if not callable(action):
+        action = getattr(semantics, '_default', None)
+
+    if not callable(action):
+        action = None
+
+    return action
+
+
+class _Slot:
+    __slots__ = ('name',)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+_NODE = _Slot('<node>')
+_PARSEINFO = _Slot('<parseinfo>')
+
+
+class ActionCall:
+    """
+    A semantic action with its calling convention resolved once.
+
+    The signature of the action is bound against placeholders for the node
+    and the parseinfo, with the rule parameters in place. Each call only
+    substitutes the placeholders, and `wants_parseinfo` tells the caller if
+    building a `ParseInfo` is needed at all.
+    """
+
+    __slots__ = ('action', 'args', 'kwargs', 'simple', 'wants_parseinfo')
+
+    def __init__(
+        self,
+        action: Callable[..., Any],
+        params: tuple[Any, ...] = (),
+        kwparams: dict[str, Any] | None = None,
+    ) -> None:
+        actual = BoundCallable._actual_bind(
+            action,
+            {},
+            _NODE,
+            *params,
+            parseinfo=_PARSEINFO,
+            **(kwparams or {}),
+        )
+        self.action = action
+        self.args: tuple[Any, ...] = tuple(actual.args)
+        self.kwargs: dict[str, Any] = actual.kwargs
+        self.simple: bool = self.args == (_NODE,) and not self.kwargs
+        self.wants_parseinfo: bool = any(
+            a is _PARSEINFO for a in (*self.args, *self.kwargs.values())
+        )
+
+    def __call__(self, node: Any, parseinfo: Any = None) -> Any:
+        if self.simple:
+            return self.action(node)
+
+        def fill(a: Any) -> Any:
+            if a is _NODE:
+                return node
+            elif a is _PARSEINFO:
+                return parseinfo
+            return a
+
+        args = [fill(a) for a in self.args]
+        kwargs = {k: fill(v) for k, v in self.kwargs.items()}
+        return self.action(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.action!r})'
@@ -0,0 +1,172 @@
+# Copyright (c) 2017-2026 Juancarlo Añez (apalala@gmail.com)
+# SPDX-License-Identifier: BSD-4-Clause
+from __future__ import annotations
+
+import ast as stdlib_ast
+from collections.abc import Mapping
+from contextlib import suppress
+from functools import lru_cache
+from types import CodeType
+from typing import Any, NamedTuple
+
+from ..util import Undefined, trim
+from ..util.safeeval import SecurityError, check_eval_context, check_safe_eval
+
+
+__all__ = ['CompiledConstant', 'Scopes', 'compile_constant']
+
+
+type Scopes = tuple[Mapping[str, Any], ...]
+
+
+class _Expression(NamedTuple):
+    code: CodeType | None
+    names: tuple[str, ...]
+
+    def evaluate(self, scopes: Scopes) -> Any:
+        if self.code is None:
+            return Undefined
+
+        context: dict[str, Any] = {}
+        for name in self.names:
+            for scope in scopes:
+                if name in scope:
+                    context[name] = scope[name]
+                    break
+            else:
+                return Undefined
+
+        # NOTE: only what the expression can reach needs to be safe
+        try:
+            check_eval_context(context)
+        except SecurityError:
+            return Undefined
+        try:
+            return eval(self.code, {'__builtins__': {}}, context)  # noqa: S307
+        except (ValueError, SyntaxError, TypeError, AttributeError):
+            raise
+        except BaseException as e:
+            raise SecurityError(
+                f'Unexpected exception type {type(e).__name__}: {e}',
+            ) from e
+
+
+def _expression(source: str) -> _Expression:
+    try:
+        tree = stdlib_ast.parse(source, mode='eval')
+    except (ValueError, SyntaxError):
+        return _Expression(None, ())
+
+    names = tuple(
+        sorted(
+            {
+                node.id
+                for node in stdlib_ast.walk(tree)
+                if isinstance(node, stdlib_ast.Name)
+                and isinstance(node.ctx, stdlib_ast.Load)
+            },
+        ),
+    )
+    try:
+        check_safe_eval(source, dict.fromkeys(names))
+    except SecurityError:
+        return _Expression(None, names)
+    return _Expression(compile(tree, '<constant>', 'eval'), names)
+
+
+class _Step(NamedTuple):
+    """One round of the evaluation of a constant that is a string."""
+
+    expression: str
+    literal: Any
+    fstring: _Expression
+    plain: _Expression
+
+    @property
+    def is_static(self) -> bool:
+        return self.literal is not Undefined or not (
+            self.fstring.names or self.plain.names
+        )
+
+    def evaluate(self, scopes: Scopes) -> Any:
+        if self.literal is not Undefined:
+            return self.literal
+
+        result = self.fstring.evaluate(scopes)
+        if result is Undefined:
+            result = self.expression
+        if result == self.expression:
+            value = self.plain.evaluate(scopes)
+            if value is not Undefined:
+                result = value
+        return result
+
+
+@lru_cache(maxsize=1024)
+def _step(expression: str) -> _Step:
+    expression = trim(expression)
+    literal = Undefined
+    with suppress(ValueError, SyntaxError):
+        literal = stdlib_ast.literal_eval(expression.strip())
+
+    if literal is not Undefined:
+        fstring = plain = _Expression(None, ())
+    else:
+        fstring = _expression(f'''f{expression!r}''')
+        plain = _expression(expression)
+    return _Step(expression, literal, fstring, plain)
+
+
+def _evaluate(value: Any, scopes: Scopes, static: bool = False) -> tuple[Any, bool]:
+    previous = Undefined
+    while value != previous:
+        previous = value
+        if not isinstance(value, str):
+            break
+
+        step = _step(value)
+        if static and not step.is_static:
+            return value, False
+        value = step.evaluate(scopes)
+    return value, True
+
+
+class CompiledConstant:
+    """
+    A `constant` or `alert` literal analysed once.
+
+    The rounds of evaluation that do not depend on names are done here, so
+    pure literals become prebuilt values. The rounds that do depend on names
+    have their code compiled and their free names known, and they are done
+    on each `evaluate()` against the scopes of the parse.
+    """
+
+    __slots__ = ('is_static', 'literal', 'pending', 'value')
+
+    def __init__(self, literal: Any) -> None:
+        self.literal = literal
+        self.value: Any = Undefined
+        self.pending: Any = literal
+        try:
+            self.pending, self.is_static = _evaluate(literal, (), static=True)
+        except Exception:
+            # NOTE: errors are reported when the constant is parsed
+            self.is_static = False
+        if self.is_static:
+            self.value = self.pending
+
+    def evaluate(self, scopes: Scopes) -> Any:
+        if self.is_static:
+            return self.value
+        return _evaluate(self.pending, scopes)[0]
+
+    def __str__(self) -> str:
+        return str(self.literal)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.literal!r})'
+
+
+@lru_cache(maxsize=1024)
+def compile_constant(literal: str) -> CompiledConstant:
+    return CompiledConstant(literal)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Generator
 from contextlib import contextmanager, suppress
+from functools import cache
 from typing import Any
 
 from ..exceptions import (
@@ -17,7 +18,7 @@ from ..exceptions import (
     OptionSucceeded,
     ParseException,
 )
-from ..util import boundcall, deprecated, left_assoc, regexpp, right_assoc
+from ..util import boundcall, deprecated, left_assoc, right_assoc
 from .cst import closedlist, cstfinal
 from .ctx import Func
 from .ctxlib import (
@@ -31,6 +32,15 @@ from .engine import ParserEngine
 from .state import _AT_
 
 
+@cache
+def tokentable(tokens: tuple[str, ...]) -> dict[str, tuple[str, ...]]:
+    table: dict[str, tuple[str, ...]] = {}
+    for token in tokens:
+        if token:
+            table[token[0]] = (*table.get(token[0], ()), token)
+    return table
+
+
 class ParseContext(ParserEngine):
     # bw compatibility
     @deprecated(replacement=ParserEngine.newexcept)
@@ -61,7 +71,7 @@ class ParseContext(ParserEngine):
 
     _fail = fail
 
-    def alert(self, message: str, level: int) -> None:
+    def alert(self, message: Any, level: int) -> None:
         self.next_token()
         self.tracer.trace_match(self, f'{"^" * level}`{message}`', failed=True)
         # note: capture=False, nothing appended to state
@@ -81,10 +91,43 @@ class ParseContext(ParserEngine):
 
     _token = token
 
+    def tokens(self, *tokens: str) -> str:
+        # NOTE:
+        #   The same as trying ctx.token() on each of the tokens in order,
+        #   but with a single skip of whitespace, and only over the tokens
+        #   that start with the next character.
+        self.next_token()
+        cursor = self.cursor
+        candidates = tokens
+        if self._charinput:
+            candidates = tokentable(tokens).get(cursor.current or '', ())
+        for token in candidates:
+            if cursor.match(token) is not None:
+                self.tracer.trace_match(self, token)
+                self.state.append(token)
+                return token
+        self.tracer.trace_match(self, '|'.join(tokens), failed=True)
+        raise self.newexcept(
+            lambda: f'expecting one of {' '.join(repr(t) for t in sorted(tokens))}',
+        )
+
+    def nextchar(self) -> str | None:
+        # NOTE:
+        #   The character the next token starts at, without moving,
+        #   or None when there is none, or it cannot be relied upon.
+        if not self._charinput:
+            return None
+        cursor = self.cursor
+        pos = cursor.pos
+        cursor.next_token()
+        c = cursor.current
+        cursor.goto(pos)
+        return c
+
     def pattern(self, pattern: str) -> Any:
         if (token := self.cursor.matchre(pattern)) is None:
             self.tracer.trace_match(self, '', pattern, failed=True)
-            raise self.newexcept(f'Expecting {regexpp(pattern)}', excls=FailedPattern)
+            raise self.newexcept(pattern, excls=FailedPattern)
         self.tracer.trace_match(self, token, pattern)
         self.state.append(token)
         return token
@@ -175,6 +218,10 @@ class ParseContext(ParserEngine):
 
     @contextmanager
     def option(self) -> Any:
+        # NOTE:
+        #   Legacy parsers place the options of a choice one after the other
+        #   inside a `with ctx.choice():` block, so success must be signaled
+        #   with an exception that skips the remaining options.
         self.states.push()
         try:
             yield
@@ -186,6 +233,20 @@ class ParseContext(ParserEngine):
 
     _option = option
 
+    def optionexp(self, exp: Func) -> bool:
+        # NOTE:
+        #   The exception-free version of option(): True on success,
+        #   False when `exp` failed without seeing a cut.
+        self.states.push()
+        try:
+            self.expcall(exp)
+        except FailedParse:
+            if self.states.undo().cutseen:
+                raise
+            return False
+        self.states.merge()
+        return True
+
     @contextmanager
     def choice(self) -> Generator[ChoiceContext, Any, Any]:
         chc = ChoiceContext(self)
@@ -304,26 +365,31 @@ class ParseContext(ParserEngine):
         prefix: Func | None = None,
         omitsep: bool = False,
     ) -> None:
+        states = self.states
         while True:
-            with suppress(OptionSucceeded):
-                with self.option():
-                    p = self.pos
-
-                    if prefix:
-                        pcst = self.isolate(prefix)
-                        if not omitsep:
-                            self.state.append(pcst)
-                        self.cut()
-
-                    cst = self.isolate(exp)
-                    self.state.append(cst)
-
-                    if self.pos == p:
-                        raise self.newexcept(
-                            f'{self.repeat.__name__} matched on no input',
-                        )
+            states.push()
+            try:
+                p = self.pos
+
+                if prefix:
+                    pcst = self.isolate(prefix)
+                    if not omitsep:
+                        self.state.append(pcst)
+                    self.cut()
+
+                cst = self.isolate(exp)
+                self.state.append(cst)
+
+                if self.pos == p:
+                    raise self.newexcept(
+                        f'{self.repeat.__name__} matched on no input',
+                    )
+            except FailedParse:
+                if states.undo().cutseen:
+                    raise
                 # note: dit not match sep? exp, so quit
                 break
+            states.merge()
 
     def closure(
         self,
@@ -5,54 +5,29 @@ from __future__ import annotations
 import time
 from collections.abc import Callable, Generator
 from contextlib import contextmanager
-from functools import cache
 from typing import Any
 
 from ..config import ParserConfig
 from ..exceptions import (
-    FailedLeftRecursion,
     FailedParse,
     HeartDied,
-    ParseException,
 )
 from ..input import Cursor, NullText, Text
+from ..input.buffer import Buffer
+from ..input.textlines import TextLines
 from ..objectmodel import ModelBuilderSemantics
-from ..util import (
-    prune_dict,
-    safe_name,
-)
-from ..util.boundeddict import BoundedDict
 from ..util.heart import Heart
+from .actions import ActionCall, find_semantic_action
 from .ast import AST
 from .ctx import Ctx, Func
-from .infos import MemoKey, RuleInfo, RuleResult
+from .infos import MemoKey, RuleInfo, memokey, memopos
+from .memos import MemoTable, RuleOutcome
 from .state import ParseState, ParseStateStack
 from .tracing import ConsoleTracer, NullTracer, Tracer
 
 
-type RuleOutcome = RuleResult | ParseException
-type MemoCache = dict[MemoKey, RuleOutcome]
-
-
-@cache
-def find_cached_semantic_action(semantics: Any, name: str) -> Callable[..., Any] | None:
-    if not semantics:
-        return None
-
-    for rulename in (name, safe_name(name), name.strip('_'), f'_{name}', f'_{name}_'):
-        action = getattr(semantics, safe_name(rulename), None)
-        if callable(action):
-            break
-    else:
-        action = None
-
-    if not callable(action):
-        action = getattr(semantics, '_default', None)
-
-    if not callable(action):
-        action = None
-
-    return action
+# NOTE: marks the rule ids for which no semantic action was looked up yet
+_UNBOUND: Any = object()
 
 
 class ParserCore(Ctx):
@@ -80,6 +55,8 @@ class ParserCore(Ctx):
             self.config.semantics = ModelBuilderSemantics()
         self.semantics: type | None = config.semantics
         self._furthest_exception: FailedParse | None = None
+        self._ruleids: dict[str, int] = {}
+        self._charinput: bool = False
 
         self._initialize_caches()
         self.tracer: Tracer = NullTracer()
@@ -90,14 +67,25 @@ class ParserCore(Ctx):
 
     def _initialize_caches(self) -> None:
         self._furthest_exception = None
-        self._memos: MemoCache = BoundedDict(
-            int(max(1.0, self.config.perlinememos) * self.cursor.linecount)
-        )
-        self._results: MemoCache = {}
+        self._memos: MemoTable = MemoTable(self._memo_capacity())
+        self._results: dict[MemoKey, RuleOutcome] = {}
+        self._actions: list[ActionCall | None] = []
         self.states = ParseStateStack(cursor=self.input.newcursor())
 
+    def _memo_capacity(self) -> int:
+        return int(max(1.0, self.config.perlinememos) * self.cursor.linecount)
+
     def _reset(self) -> None:
+        # NOTE: imported here so that only the parses over them load them
+        from ..input.mmaptext import MmapText
+        from ..input.streamtext import StreamText
+
         self._initialize_caches()
+        # NOTE: dispatch on characters is safe only over plain text
+        self._charinput = (
+            isinstance(self.input, TextLines | Buffer | MmapText | StreamText)
+            and not self.input.ignorecase
+        )
         self.keywords: set[str] = set(self.config.keywords or ())
         self.semantics = self.config.semantics
         if self.semantics and hasattr(self.semantics, 'set_context'):
@@ -227,24 +215,44 @@ class ParserCore(Ctx):
         self.state.cutseen = True
         self.tracer.trace_cut(self)
 
-        if not self.config.prune_memos_on_cut:
-            return
+        if self.config.prune_memos_on_cut:
+            self._memos.prune_before(self.pos)
 
-        cutpos = self.pos
+    _cut = cut
 
-        def unwanted(key: MemoKey, value: RuleResult | ParseException) -> bool:
-            return key.pos < cutpos and not isinstance(value, FailedLeftRecursion)
+    def release_before(self, pos: int) -> None:
+        # NOTE: for when nothing before pos will be parsed again
+        self._memos.prune_before(pos)
+        for key in [key for key in self._results if memopos(key) < pos]:
+            del self._results[key]
 
-        prune_dict(self._memos, unwanted)
+        from ..input.streamtext import StreamText
 
-    _cut = cut
+        if isinstance(self.input, StreamText):
+            self.input.release(pos)
 
     def find_rule(self, name: str) -> Func:
         assert name
         raise NotImplementedError
 
     def find_semantic_action(self, name: str) -> Callable[..., Any] | None:
-        return find_cached_semantic_action(self.semantics, name)
+        return find_semantic_action(self.semantics, name)
+
+    def semantic_action(self, ri: RuleInfo) -> ActionCall | None:
+        # NOTE:
+        #   actions are resolved once per rule id and binding, and they are
+        #   released with the rest of the caches when the binding ends
+        rid = self.ruleid(ri)
+        actions = self._actions
+        if rid < len(actions) and (call := actions[rid]) is not _UNBOUND:
+            return call
+
+        if rid >= len(actions):
+            actions.extend([_UNBOUND] * (rid + 1 - len(actions)))
+        action = self.find_semantic_action(ri.name)
+        call = ActionCall(action, ri.params, ri.kwparams) if action else None
+        actions[rid] = call
+        return call
 
     def newexcept(
         self,
@@ -257,17 +265,25 @@ class ParserCore(Ctx):
     def ruleinfo(self) -> RuleInfo:
         return self.callstack[-1]
 
-    def memokey(self) -> MemoKey:
-        return MemoKey(self.pos, self.ruleinfo)
+    def ruleid(self, ri: RuleInfo) -> int:
+        # NOTE: ids are assigned on first use and survive across parses,
+        #   so they are stable for the lifetime of the parser/grammar
+        if (rid := self._ruleids.get(ri.name)) is None:
+            rid = self._ruleids[ri.name] = len(self._ruleids)
+        return rid
+
+    def memokey(self, ri: RuleInfo | None = None) -> MemoKey:
+        return memokey(self.pos, self.ruleid(ri or self.ruleinfo))
 
     def memo(self, key: MemoKey) -> RuleOutcome | None:
         return self._memos.get(key)
 
     def memoize(
         self,
+        ri: RuleInfo,
         key: MemoKey,
-        memo: RuleResult | ParseException,
-    ) -> RuleResult | ParseException:
-        if key.ruleinfo.memoizable and self.config.memoization:
-            self._memos[key] = memo
+        memo: RuleOutcome,
+    ) -> RuleOutcome:
+        if ri.memoizable and self.config.memoization:
+            self._memos.set(key, memo)
         return memo
@@ -47,6 +47,7 @@ class CanParse(Protocol):
 @runtime_checkable
 class Ctx(CanParse, Protocol):
     states: ParseStateStack
+    semantics: Any
 
     @property
     def ast(self) -> AST: ...
@@ -73,9 +74,11 @@ class Ctx(CanParse, Protocol):
     ) -> FailedParse: ...
 
     def call(self, ri: RuleInfo) -> Any: ...
+    def next_token(self, ri: RuleInfo | None = None) -> None: ...
+    def set_furthest_exception(self, e: FailedParse) -> None: ...
     def find_rule(self, name: str) -> Func: ...
 
-    def alert(self, message: str, level: int) -> None: ...
+    def alert(self, message: Any, level: int) -> None: ...
     def choice(self) -> Any: ...
     def constant(self, literal: Any) -> Any: ...
     def cut(self) -> None: ...
@@ -103,8 +106,11 @@ class Ctx(CanParse, Protocol):
     def result(self) -> Any: ...
     def resultadd(self) -> Any: ...
     def option(self) -> Any: ...
+    def optionexp(self, exp: Func) -> bool: ...
     def optional(self) -> Any: ...
     def token(self, token: str) -> str: ...
+    def tokens(self, *tokens: str) -> str: ...
+    def nextchar(self) -> str | None: ...
     def pattern(self, pattern: str) -> Any: ...
     def matchname(self) -> str | None: ...
     def matchint(self) -> int | None: ...
@@ -17,10 +17,10 @@ class ContextBase:
         self.expected.extend(tokens)
 
     def expectedexcept(self, ctx: Ctx) -> Exception:
-        msg = 'Failed'
-        if self.expected:
-            msg = f'Expected one of: {' '.join(self.expected)}'
-        return ctx.newexcept(msg)
+        if not self.expected:
+            return ctx.newexcept('Failed')
+        expected = self.expected
+        return ctx.newexcept(lambda: f'Expected one of: {' '.join(expected)}')
 
     def parse(self, ctx: Ctx) -> Any:
         _ = ctx
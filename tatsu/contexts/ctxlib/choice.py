@@ -12,8 +12,13 @@ class ChoiceContext(ContextBase):
     def __init__(self, ctx: Ctx):
         super().__init__(ctx)
         self.options: list[Func] = []
+        self.firsts: tuple[str | None, ...] = ()
         self.result: Any = None
 
+    def firstchars(self, *firsts: str | None) -> None:
+        # NOTE: the characters each option may start with, None for any
+        self.firsts = firsts
+
     def option(self, func: Func) -> Func:
         self.options.append(func)
         return func
@@ -21,7 +26,14 @@ class ChoiceContext(ContextBase):
     def parse(self, ctx: Ctx) -> Any:
         if not self.options:
             return None
-        for opt in self.options:
-            with ctx.option():
-                ctx.expcall(opt)
+        options = self.options
+        if self.firsts and (c := ctx.nextchar()) is not None:
+            options = [
+                opt
+                for opt, first in zip(options, self.firsts, strict=True)
+                if first is None or c in first
+            ]
+        for opt in options:
+            if ctx.optionexp(opt):
+                return None
         raise self.expectedexcept(ctx)
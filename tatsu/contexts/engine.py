@@ -2,10 +2,9 @@
 # SPDX-License-Identifier: BSD-4-Clause
 from __future__ import annotations
 
-import ast as stdlib_ast
 import inspect
-from collections.abc import Generator
-from contextlib import contextmanager, suppress
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
 from typing import Any
 
 from ..config import ParserConfig
@@ -19,27 +18,17 @@ from ..exceptions import (
 from ..input import NullCursor, NullText, Text
 from ..input.textlines import TextLines
 from ..objectmodel import ModelBuilderSemantics
-from ..util import (
-    Undefined,
-    boundcall,
-    is_eval_safe,
-    prune_dict,
-    safe_builtins,
-    safe_eval,
-    trim,
-)
+from ..util import safe_builtins_view
 from .ast import AST
+from .constants import CompiledConstant, Scopes, compile_constant
 from .core import ParserCore
 from .cst import closedlist, islist
 from .ctx import CanParse, Ctx, is_func
-from .infos import MemoKey, ParseInfo, RuleInfo, RuleResult
+from .infos import MemoKey, ParseInfo, RuleInfo, RuleResult, memopos
+from .memos import MemoTable, RuleOutcome
 from .state import ParseStateStack
 
 
-type RuleOutcome = RuleResult | ParseException
-type MemoCache = dict[MemoKey, RuleOutcome]
-
-
 class ParserEngine(ParserCore, CanParse):
     def parse(
         self,
@@ -71,6 +60,7 @@ class ParserEngine(ParserCore, CanParse):
         start: str | None = None,
         config: Any = None,
         asmodel: bool = False,
+        memos: MemoTable | None = None,
         **settings: Any,
     ) -> Generator[Ctx, None, None]:
         config = self.config.override_config(config)
@@ -95,6 +85,8 @@ class ParserEngine(ParserCore, CanParse):
             self.states = ParseStateStack(cursor=input.newcursor())
             assert not isinstance(self.state.cursor, NullCursor)
             self._reset()
+            if memos is not None:
+                self._memos = memos
 
             if not self.config.semantics and asmodel:
                 self.config.semantics = ModelBuilderSemantics()
@@ -115,12 +107,66 @@ class ParserEngine(ParserCore, CanParse):
             if self.config.semantics and hasattr(self.config.semantics, 'set_context'):
                 self.config.semantics.set_context(None)  # ty: ignore[call-non-callable]
 
+    def parse_stream(
+        self,
+        text: Any,
+        /,
+        *,
+        start: str | None = None,
+        config: Any = None,
+        asmodel: bool = False,
+        **settings: Any,
+    ) -> Iterator[Any]:
+        """
+        Parse the start rule over and over, yielding each result as soon as it
+        is parsed, until only whitespace and comments are left in the input.
+
+        `text` is a `StreamText`, or anything a `StreamText` may be made from,
+        like an open file or an iterable of strings.
+        """
+        if not isinstance(text, Text):
+            from ..input.streamtext import StreamText
+
+            effective = self.config.override_config(config)
+            assert isinstance(effective, ParserConfig)
+            text = StreamText(text, config=effective.override(start=start, **settings))
+
+        with self.bound(
+            text,
+            start=start,
+            config=config,
+            asmodel=asmodel,
+            **settings,
+        ):
+            actual_start: str = self.config.effective_start_rule_name() or 'start'
+            rule = self.find_rule(actual_start)
+            cursor = self.cursor
+            while True:
+                # NOTE:
+                #   A cut only commits the option it is in, so a cut within a
+                #   result does not stop the parser from going back before it.
+                #   The results are the cuts that commit all that was parsed.
+                pos = cursor.pos
+                self.release_before(pos)
+                cursor.next_token()
+                if cursor.atend():
+                    return
+                cursor.goto(pos)
+
+                self._memos.capacity = max(self._memos.capacity, self._memo_capacity())
+                self._furthest_exception = None
+                self.states = ParseStateStack(cursor=cursor)
+                result = rule(self)
+                if cursor.pos == pos:
+                    raise self.newexcept(f'{actual_start} matched on no input')
+                yield result
+
     def call(self, ri: RuleInfo) -> Any:
         self.heartbeat()
         if ri.should_trace:
             self.callstack.append(ri)
         self.next_token(ri)
-        key = self.memokey()
+        key = self.memokey(ri)
 
         pos = self.pos
         try:
@@ -152,32 +198,39 @@ class ParserEngine(ParserCore, CanParse):
         elif not self.config.left_recursion:
             raise self.newexcept('Left recursion detected', excls=FailedLeftRecursion)
 
-        result: RuleResult | ParseException | None = self._results.get(key)
+        result: RuleOutcome | None = self._results.get(key)
         if isinstance(result, RuleResult):
             return result
         elif isinstance(result, Exception):
             raise result
 
         result = self.newexcept(ri.name, FailedLeftRecursion)
-        assert isinstance(result, RuleResult | ParseException)
         self._results[key] = result
 
+        # NOTE:
+        #   The other rules in the SCC of a leader are never memoized
+        #   (see mark_left_recursion), so the only memos that depend on the
+        #   seed are the left-recursion guards set while it grows
         initial = self.pos
         lastpos = -1
-        while True:
-            self.clear_recursion_errors()
-            try:
-                new_result = self.rule_call(ri, key)
-                self.goto(initial)
-            except FailedParse:
-                break
-
-            if new_result.newpos > lastpos:
-                self.save_result(key, new_result)
-                lastpos = new_result.newpos
-                result = new_result
-            else:
-                break
+        self._memos.track()
+        try:
+            while True:
+                self.clear_recursion_errors()
+                try:
+                    new_result = self.rule_call(ri, key)
+                    self.goto(initial)
+                except FailedParse:
+                    break
+
+                if new_result.newpos > lastpos:
+                    self.save_result(key, new_result)
+                    lastpos = new_result.newpos
+                    result = new_result
+                else:
+                    break
+        finally:
+            self._memos.untrack()
 
         if isinstance(result, Exception):
             raise result
@@ -192,26 +245,27 @@ class ParserEngine(ParserCore, CanParse):
         if isinstance(result, RuleResult):
             return result
 
-        self.set_left_recursion_guard(key)
+        self.set_left_recursion_guard(ri, key)
 
         self.states.new()
         try:
             self.next_token(ri)
 
             node = self.func_call(ri)
-            node = self.semantics_call(ri, node, pos=key.pos)
-            self.set_parseinfo(node, ri.name, key.pos)
+            pos = memopos(key)
+            node = self.semantics_call(ri, node, pos=pos)
+            self.set_parseinfo(node, ri.name, pos)
 
             result = RuleResult(node, self.pos)
-            self.memoize(key, result)
+            self.memoize(ri, key, result)
 
             return result
         except FailedSemantics as e:
             ex = self.newexcept(str(e))
-            self.memoize(key, ex)
+            self.memoize(ri, key, ex)
             raise ex from e
         except ParseException as e:
-            self.memoize(key, e)
+            self.memoize(ri, key, e)
             raise
         finally:
             self.states.undo()
@@ -231,19 +285,13 @@ class ParserEngine(ParserCore, CanParse):
         if ri.is_name:
             self.validate_is_not_keyword(node)
 
-        action = self.find_semantic_action(ri.name)
-        if action:
-            parseinfo = self.make_parseinfo(node, pos)
-            return boundcall(
-                action,
-                {},
-                node,
-                *ri.params,
-                parseinfo=parseinfo,
-                **ri.kwparams,
-            )
-        else:
+        call = self.semantic_action(ri)
+        if call is None:
             return node
+        elif call.wants_parseinfo:
+            return call(node, self.make_parseinfo(node, pos))
+        else:
+            return call(node)
 
     def validate_is_not_keyword(self, name: Any) -> None:
         name_str = str(name)
@@ -257,7 +305,7 @@ class ParserEngine(ParserCore, CanParse):
             return None
         endpos = self.pos
         return ParseInfo(
-            cursor=self.cursor,
+            cursor=self.cursor.clone(),
             rule=name,
             pos=pos,
             endpos=endpos,
@@ -280,20 +328,22 @@ class ParserEngine(ParserCore, CanParse):
             result = result._replace(node=closedlist(result.node))
         self._results[key] = result
 
-    def set_left_recursion_guard(self, key: MemoKey) -> None:
+    def set_left_recursion_guard(self, ri: RuleInfo, key: MemoKey) -> None:
         if not self.config.left_recursion:
             return
-        ex = self.newexcept(key.ruleinfo.name, excls=FailedLeftRecursion)
-        self.memoize(key, ex)
+        ex = self.newexcept(ri.name, excls=FailedLeftRecursion)
+        self.memoize(ri, key, ex)
 
     def clear_recursion_errors(self) -> None:
-        def filter_func(_key: MemoKey, value: Any) -> bool:
-            return isinstance(value, FailedLeftRecursion)
-
-        prune_dict(self._memos, filter_func)
+        self._memos.clear_tracked()
 
     def constant(self, literal: Any, capture: bool = True) -> Any:
         self.next_token()
+
+        compiled = None
+        if isinstance(literal, CompiledConstant):
+            compiled = literal
+            literal = compiled.literal
         self.tracer.trace_match(self, literal)
 
         if not isinstance(literal, str):
@@ -301,36 +351,13 @@ class ParserEngine(ParserCore, CanParse):
             return literal
         literal = str(literal)  # for type linters
 
-        context: dict[str, Any] = (
-            safe_builtins()
-            | getattr(self.semantics, 'safe_context', lambda: {})()
-            | self.ast
-            if isinstance(self.ast, AST)
-            else {}
-        )
-
-        expression = Undefined
-        result = literal
-        while result != expression:
-            expression = result
-            if not isinstance(expression, str):
-                break
-
-            expression = trim(expression)
-            with suppress(ValueError, SyntaxError):
-                result = stdlib_ast.literal_eval(expression.strip())
-                assert result is not Undefined
-                continue
-
+        if compiled is None:
+            compiled = compile_constant(literal)
+        if compiled.is_static:
+            result = compiled.value
+        else:
             try:
-                fstr_expression = f'''f{expression!r}'''
-
-                if is_eval_safe(fstr_expression, context):
-                    result = safe_eval(fstr_expression, context)
-
-                if result == expression and is_eval_safe(expression, context):
-                    # NOTE: No f'{xyz}' evaluations occurred
-                    result = safe_eval(expression, context)
+                result = compiled.evaluate(self.constant_scopes())
             except Exception as e:
                 raise FailedSemantics(
                     f'Error evaluating constant {literal!r}: {e}',
@@ -341,3 +368,12 @@ class ParserEngine(ParserCore, CanParse):
         return result
 
     _constant = constant
+
+    def constant_scopes(self) -> Scopes:
+        if not isinstance(self.ast, AST):
+            return ()
+        return (
+            self.ast,
+            getattr(self.semantics, 'safe_context', lambda: {})(),
+            safe_builtins_view(),
+        )
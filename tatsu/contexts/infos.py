@@ -12,9 +12,25 @@ from ..input import Cursor
 type Func = Callable[[Any], Any]
 
 
-class MemoKey(NamedTuple):
-    pos: int
-    ruleinfo: RuleInfo
+# NOTE:
+#   A memo key packs the input position and the per-grammar rule id into a
+#   single int, so memo lookups hash an int instead of a tuple of objects.
+#   Keys sort by position, so `key < memokey(pos, 0)` means "before pos".
+type MemoKey = int
+
+MEMO_RULEID_BITS = 20
+
+
+def memokey(pos: int, ruleid: int) -> MemoKey:
+    return (pos << MEMO_RULEID_BITS) | ruleid
+
+
+def memopos(key: MemoKey) -> int:
+    return key >> MEMO_RULEID_BITS
+
+
+def memoruleid(key: MemoKey) -> int:
+    return key & ((1 << MEMO_RULEID_BITS) - 1)
 
 
 class RuleResult(NamedTuple):
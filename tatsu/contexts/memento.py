@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from io import StringIO
 
-from ..input import LineInfo
+from ..input import LineInfo, TextStr
 from ..util.strtools import slicetowidth
 from ..ztyle import Color, Style
 
@@ -25,10 +25,11 @@ class _ColorSet:
 
 def memento(
     msg: str,
-    text: str,
+    text: TextStr,
     info: LineInfo,
     rulestack: list[str],
     color: Color = MEMENTO_DEFAULT_COLOR,
+    firstline: int = 0,
 ) -> str:
     c = _ColorSet(color)
     line, col = info.line, info.col
@@ -49,7 +50,7 @@ def memento(
     print(f'   {gut}', file=out)
 
     max_line_digits = len(str(line + 1))
-    start_line_idx = max(0, line - 4)
+    start_line_idx = max(firstline, line - 4)
 
     for i in range(start_line_idx, min(line + 1, len(lines))):
         current_line_num = i + 1
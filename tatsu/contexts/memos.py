@@ -0,0 +1,155 @@
+# Copyright (c) 2017-2026 Juancarlo Añez (apalala@gmail.com)
+# SPDX-License-Identifier: BSD-4-Clause
+from __future__ import annotations
+
+import heapq
+import itertools
+from collections.abc import Iterator
+
+from ..exceptions import FailedLeftRecursion, ParseException
+from .infos import MemoKey, RuleResult, memopos
+
+
+__all__ = ['MemoTable', 'RuleOutcome']
+
+
+type RuleOutcome = RuleResult | ParseException
+
+
+class MemoTable:
+    """
+    The packrat memo store.
+
+    Entries are keyed on the `int` produced by `memokey(pos, ruleid)`, where
+    `ruleid` is the compact id the parser assigned to the rule name. Entries
+    are kept in per-position buckets, with a heap of the bucket positions, so
+    releasing everything before a position costs only what is released.
+    The table keeps at most `capacity` entries, evicting the oldest ones first,
+    one at a time.
+
+    Left-recursion failures are kept in a separate index of `guards`. They
+    survive `prune_before()`, and are dropped only by `clear()`. While a
+    left-recursive seed grows, `track()` records the guards set on its
+    behalf, so `clear_tracked()` invalidates only those.
+    """
+
+    __slots__ = (
+        'buckets',
+        'capacity',
+        'guards',
+        'order',
+        'positions',
+        'size',
+        'tracking',
+    )
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity: int = capacity
+        self.buckets: dict[int, dict[MemoKey, RuleOutcome]] = {}
+        self.positions: list[int] = []
+        # NOTE: the keys of the entries, oldest first
+        self.order: dict[MemoKey, None] = {}
+        self.guards: dict[MemoKey, FailedLeftRecursion] = {}
+        self.size: int = 0
+        self.tracking: list[set[MemoKey]] = []
+
+    def get(self, key: MemoKey) -> RuleOutcome | None:
+        bucket = self.buckets.get(memopos(key))
+        if bucket is not None and (value := bucket.get(key)) is not None:
+            return value
+        return self.guards.get(key)
+
+    def set(self, key: MemoKey, value: RuleOutcome) -> None:
+        if isinstance(value, FailedLeftRecursion):
+            self.discard(key)
+            self.guards[key] = value
+            if self.tracking:
+                self.tracking[-1].add(key)
+            return
+
+        self.guards.pop(key, None)
+        pos = memopos(key)
+        bucket = self.buckets.get(pos)
+        if bucket is None:
+            bucket = self.buckets[pos] = {}
+            heapq.heappush(self.positions, pos)
+        elif key in bucket:
+            self.size -= 1
+        bucket[key] = value
+        self.size += 1
+
+        order = self.order
+        order.pop(key, None)
+        order[key] = None
+        if self.size > self.capacity:
+            # NOTE: a whole bucket may be where the parse backtracks to
+            self.discard(next(iter(order)))
+
+    def discard(self, key: MemoKey) -> None:
+        bucket = self.buckets.get(memopos(key))
+        if bucket is not None and bucket.pop(key, None) is not None:
+            del self.order[key]
+            self.size -= 1
+
+    def prune_before(self, pos: int) -> None:
+        """Remove the entries for positions before `pos`, but not the guards."""
+        positions = self.positions
+        while positions and positions[0] < pos:
+            self._release(heapq.heappop(positions))
+
+    def track(self) -> None:
+        self.tracking.append(set())
+
+    def untrack(self) -> None:
+        keys = self.tracking.pop()
+        if self.tracking:
+            self.tracking[-1] |= keys
+
+    def clear_tracked(self) -> None:
+        keys = self.tracking[-1]
+        guards = self.guards
+        for key in keys:
+            guards.pop(key, None)
+        keys.clear()
+
+    def _release(self, pos: int) -> None:
+        bucket = self.buckets.pop(pos, None)
+        if bucket is not None:
+            self.size -= len(bucket)
+            order = self.order
+            for key in bucket:
+                del order[key]
+
+    def clear(self) -> None:
+        self.buckets.clear()
+        self.positions.clear()
+        self.order.clear()
+        self.guards.clear()
+        self.tracking.clear()
+        self.size = 0
+
+    def items(self) -> Iterator[tuple[MemoKey, RuleOutcome]]:
+        buckets = (bucket.items() for bucket in self.buckets.values())
+        return itertools.chain(*buckets, self.guards.items())
+
+    def __contains__(self, key: MemoKey) -> bool:
+        return self.get(key) is not None
+
+    def __getitem__(self, key: MemoKey) -> RuleOutcome:
+        if (value := self.get(key)) is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: MemoKey, value: RuleOutcome) -> None:
+        self.set(key, value)
+
+    def __iter__(self) -> Iterator[MemoKey]:
+        return (key for key, _ in self.items())
+
+    def __len__(self) -> int:
+        return self.size + len(self.guards)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}[{len(self)}/{self.capacity}]'
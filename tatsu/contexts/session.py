@@ -0,0 +1,218 @@
+# Copyright (c) 2017-2026 Juancarlo Añez (apalala@gmail.com)
+# SPDX-License-Identifier: BSD-4-Clause
+from __future__ import annotations
+
+import copy
+import sys
+from collections.abc import Iterator
+from typing import Any
+
+from ..config import ParserConfig
+from ..exceptions import FailedLeftRecursion, FailedParse
+from ..input.edittext import EditText
+from .engine import ParserEngine
+from .infos import MemoKey, RuleResult, memokey, memopos, memoruleid
+from .memos import MemoTable, RuleOutcome
+
+
+__all__ = ['ParseSession', 'SessionMemos']
+
+
+def _relocated[T: RuleOutcome](value: T, shift: int) -> T:
+    if isinstance(value, RuleResult):
+        return value._replace(newpos=value.newpos + shift)
+    value = copy.copy(value)
+    value._pos += shift  # type: ignore[attr-defined]
+    value.__dict__.pop('cursor', None)
+    value.__dict__.pop('info', None)
+    return value
+
+
+class MemoEntry:
+    __slots__ = ('furthest', 'pos', 'span', 'value')
+
+    def __init__(
+        self,
+        value: RuleOutcome,
+        furthest: FailedParse | None,
+        pos: int,
+        span: int,
+    ):
+        self.value = value
+        self.furthest = furthest
+        self.pos = pos
+        self.span = span
+
+    def relocate(self, pos: int) -> None:
+        # NOTE: the entries moved by edits are relocated when they are used
+        if (shift := pos - self.pos) == 0:
+            return
+        self.value = _relocated(self.value, shift)
+        if self.furthest is not None:
+            self.furthest = _relocated(self.furthest, shift)
+        self.pos = pos
+
+
+class SessionMemos(MemoTable):
+    """
+    The memos of a `ParseSession`, kept in the blocks of its `EditText`.
+
+    Each entry records how far past its position the parse looked at the
+    text, so the edits can tell which entries they invalidate. A miss starts
+    measuring from its position, and `set()` closes the measure, which also
+    counts towards the rules that called it. The furthest failure within
+    each entry is recorded the same way, so the parses that reuse the entry
+    report the same errors as the parse that made it.
+    """
+
+    __slots__ = ('ctx', 'frames', 'text')
+
+    def __init__(self, ctx: ParserEngine, text: EditText) -> None:
+        super().__init__(sys.maxsize)
+        self.ctx = ctx
+        self.text = text
+        self.frames: list[tuple[MemoKey, int, FailedParse | None]] = []
+
+    def begin(self) -> None:
+        self.frames.clear()
+        self.guards.clear()
+        self.tracking.clear()
+        self.text.reach = 0
+
+    def end(self) -> None:
+        ctx = self.ctx
+        furthest = ctx._furthest_exception
+        for _, _, saved in reversed(self.frames):
+            if furthest is None or (saved is not None and saved.pos > furthest.pos):
+                furthest = saved
+        self.frames.clear()
+        ctx._furthest_exception = furthest
+
+    def get(self, key: MemoKey) -> RuleOutcome | None:
+        pos = memopos(key)
+        text = self.text
+        entry = text.getmemo(pos, memoruleid(key))
+        if isinstance(entry, MemoEntry):
+            entry.relocate(pos)
+            text.reach = max(text.reach, pos + entry.span)
+            if entry.furthest is not None:
+                self.ctx.set_furthest_exception(entry.furthest)
+            return entry.value
+        if (guard := self.guards.get(key)) is not None:
+            return guard
+        self.frames.append((key, text.reach, self.ctx._furthest_exception))
+        text.reach = pos
+        self.ctx._furthest_exception = None
+        return None
+
+    def set(self, key: MemoKey, value: RuleOutcome) -> None:
+        if isinstance(value, FailedLeftRecursion):
+            super().set(key, value)
+            return
+
+        self.guards.pop(key, None)
+        ctx = self.ctx
+        text = self.text
+        reach = text.reach
+        furthest = ctx._furthest_exception
+        frames = self.frames
+        for i in range(len(frames) - 1, -1, -1):
+            if frames[i][0] != key:
+                continue
+            # NOTE: the rules without memos in between count towards this one
+            for _, saved, failure in reversed(frames[i + 1 :]):
+                reach = max(reach, saved)
+                if furthest is None or (failure and failure.pos > furthest.pos):
+                    furthest = failure
+            _, saved, failure = frames[i]
+            del frames[i:]
+            text.reach = max(reach, saved)
+            ctx._furthest_exception = failure
+            if furthest is not None:
+                ctx.set_furthest_exception(furthest)
+            break
+
+        pos = memopos(key)
+        if isinstance(value, RuleResult):
+            reach = max(reach, value.newpos)
+        entry = MemoEntry(value, furthest, pos, reach - pos)
+        text.setmemo(pos, memoruleid(key), entry)
+
+    def discard(self, key: MemoKey) -> None:
+        self.text.delmemo(memopos(key), memoruleid(key))
+
+    def prune_before(self, pos: int) -> None:
+        # NOTE: the memos are kept for the parses after the next edit
+        pass
+
+    def clear(self) -> None:
+        self.text.clearmemos()
+        self.frames.clear()
+        super().clear()
+
+    def items(self) -> Iterator[tuple[MemoKey, RuleOutcome]]:
+        for pos, ruleid, entry in self.text.memos():
+            assert isinstance(entry, MemoEntry)
+            entry.relocate(pos)
+            yield memokey(pos, ruleid), entry.value
+        yield from self.guards.items()
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.items())
+
+
+class ParseSession:
+    """
+    Parse a text over and over as it is edited, reusing the memos of the
+    previous parses for the parts of the text that the edits didn't touch.
+
+    The memos, with the positions they record, are moved along with the text
+    by the edits, so a reparse calls the rules only over the edited region and
+    what depends on it, and takes the rest of the results from the memos.
+
+    The parse info of the nodes taken from the memos is not updated to the
+    positions they moved to.
+    """
+
+    def __init__(
+        self,
+        ctx: ParserEngine,
+        text: str | EditText,
+        /,
+        *,
+        config: ParserConfig | None = None,
+        **settings: Any,
+    ):
+        config = ctx.config.override_config(config)
+        assert isinstance(config, ParserConfig)
+        # NOTE: cuts must not prune the memos that the next parse reuses
+        config = config.override(prune_memos_on_cut=False, **settings)
+        assert isinstance(config, ParserConfig)
+
+        self.ctx = ctx
+        self.config = config
+        if not isinstance(text, EditText):
+            text = EditText(text, config=config)
+        self.text = text
+        self.memos = SessionMemos(ctx, text)
+        self.result: Any = None
+
+    @property
+    def textstr(self) -> str:
+        return self.text.textstr
+
+    def parse(self) -> Any:
+        self.memos.begin()
+        ctx = self.ctx
+        with ctx.bound(self.text, config=self.config, memos=self.memos):
+            start = ctx.config.effective_start_rule_name() or 'start'
+            rule = ctx.find_rule(start)
+            try:
+                self.result = rule(ctx)
+            finally:
+                self.memos.end()
+            return self.result
+
+    def edit(self, start: int, end: int, text: str) -> None:
+        """Replace `[start:end]` in the text with `text`."""
+        self.text.edit(start, end, text)
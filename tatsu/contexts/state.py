@@ -6,7 +6,7 @@ from collections.abc import Iterable
 from typing import Any, Self, overload
 
 from .ast import AST
-from .cst import cstadd, cstfinal, cstmerge
+from .cst import cstadd, cstfinal, cstmerge, islist
 from .infos import Alert, RuleInfo
 
 
@@ -20,23 +20,38 @@ _AT_ = '__vallue__'
 
 class ParseState:
     __slots__ = (
+        '_astown',
+        '_cstbuf',
         'alerts',
         'ast',
         'cst',
         'cursor',
         'cutseen',
         'last_node',
+        'startpos',
     )
 
     def __init__(self, base: Cursor | ParseState) -> None:
+        # NOTE:
+        #   All the states in a stack share the one cursor, and remember
+        #   only the position they started at, so backtracking is a goto().
+        #   A state pushed over another shares its AST until the first write.
         if isinstance(base, ParseState):
-            self.cursor: Cursor = base.cursor.clone()
-            self.ast: AST = AST(base.ast)
+            self.cursor: Cursor = base.cursor
+            self.ast: AST = base.ast
+            self._astown: AST | None = None
         else:
-            self.cursor = base.clone()
-            self.ast = AST()
+            self.cursor = base
+            self.ast = self._astown = AST()
+        self.startpos: int = self.cursor.pos
 
         self.cst: Any = None
+        # NOTE:
+        #   The list this state created for its CST, if any. Only that list
+        #   is grown in place: any other list in .cst may be shared with a
+        #   rule result, a semantic action, an enclosing state, or a name
+        #   bound to the result of a merged state.
+        self._cstbuf: list[Any] | None = None
         self.cutseen: bool = False
         self.last_node: Any = None
         self.alerts: list[Alert] = []
@@ -50,7 +65,9 @@ class ParseState:
         return new
 
     def merge(self, prev: ParseState) -> Self:
-        self.ast = prev.ast
+        if prev.ast is not self.ast:
+            self.ast = prev.ast
+            self._astown = prev._astown
         self.extend(prev.cst)
         self.alerts.extend(prev.alerts)
         self.cursor.goto(prev.cursor.pos)
@@ -68,19 +85,41 @@ class ParseState:
 
     def append(self, node: Any) -> Any:
         self.last_node = node
-        self.cst = cstadd(self.cst, node)
+        cst = self.cst
+        if cst is None:
+            self.cst = node
+        elif cst is self._cstbuf:
+            cst.append(node)
+        else:
+            self.cst = self._cstbuf = cstadd(cst, node)
         return node
 
     def extend(self, node: Any) -> Any:
         self.last_node = node
-        self.cst = cstmerge(self.cst, node)
+        cst = self.cst
+        if node is None:
+            pass
+        elif cst is None:
+            self.cst = node
+        elif cst is self._cstbuf:
+            if islist(node):
+                cst.extend(node)
+            else:
+                cst.append(node)
+        else:
+            self.cst = self._cstbuf = cstmerge(cst, node)
         return node
 
+    def ownast(self) -> AST:
+        if self.ast is not self._astown:
+            self.ast = self._astown = AST(self.ast)
+        return self.ast
+
     def nameset(self, name: str) -> None:
-        self.ast._set(name, self.last_node)
+        self.ownast()._set(name, self.last_node)
 
     def nameadd(self, name: str) -> None:
-        self.ast._setlist(name, self.last_node)
+        self.ownast()._setlist(name, self.last_node)
 
     def define(
         self,
@@ -90,7 +129,7 @@ class ParseState:
         ast = AST()
         ast._define(keys, list_keys=list_keys)
         ast.update(self.ast)
-        self.ast = ast
+        self.ast = self._astown = ast
         return self.ast
 
     @overload
@@ -144,7 +183,9 @@ class ParseStateStack:
         return self.state.fold()
 
     def undo(self) -> ParseState:
-        return self.state_stack.pop()
+        prev = self.state_stack.pop()
+        prev.cursor.goto(prev.startpos)
+        return prev
 
     def pop(self) -> ParseState:
         prev = self.state_stack.pop()
@@ -2,12 +2,19 @@
 # SPDX-License-Identifier: BSD-4-Clause
 from __future__ import annotations
 
-from .contexts.infos import RuleInfo
-from .contexts.memento import MEMENTO_DEFAULT_COLOR, memento
+from collections.abc import Sequence
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
 from .input import Cursor, LineInfo
+from .util.regextools import regexpp
 from .ztyle import Color, Style
 
 
+if TYPE_CHECKING:
+    from .contexts.infos import RuleInfo
+
+
 class TatSuException(Exception):
     pass
 
@@ -56,39 +63,75 @@ class FailedSemantics(ParseException):
 
 
 class FailedParse(ParseException):
-    def __init__(self, cursor: Cursor, stack: list[RuleInfo], msg: str):
+    def __init__(self, cursor: Cursor, stack: Sequence[RuleInfo], msg: Any):
         # NOTE:
         #  Pass all arguments to super() to avoid pickling problems
         #  https://stackoverflow.com/a/28335286/545637
+        # NOTE:
+        #  Most failures are discarded by backtracking, so only the position
+        #  and a snapshot of the rule stack are taken here. The cursor, the
+        #  line info, the stack names, and the message are computed on demand.
+        #  A callable `msg` is a thunk that produces the message.
+        stack = tuple(stack)
         super().__init__(cursor, stack, msg)
 
-        self.cursor = cursor.clone()
-        self.info: LineInfo = cursor.lineinfo()
-        self.stack = [ri.name for ri in stack]
+        self._cursor = cursor
+        self._pos = cursor.pos
+        self._rulestack = stack
         self.msg = msg
 
     @property
     def pos(self) -> int:
-        return self.cursor.pos
+        return self._pos
+
+    @cached_property
+    def cursor(self) -> Cursor:
+        cursor = self._cursor.clone()
+        cursor.goto(self._pos)
+        return cursor
+
+    @cached_property
+    def info(self) -> LineInfo:
+        return self._cursor.lineinfo(self._pos)
+
+    @cached_property
+    def stack(self) -> list[str]:
+        return [ri.name for ri in self._rulestack]
 
     @property
     def message(self):
-        return self.msg
+        return self.msg() if callable(self.msg) else self.msg
+
+    def __reduce__(self):
+        reduced = super().__reduce__()
+        if not callable(self.msg):
+            return reduced
+        # NOTE: a message thunk doesn't pickle, so its message goes instead
+        cls, args, state = reduced
+        msg = self.message
+        return cls, (*args[:-1], msg), {**state, 'msg': msg}
+
+    def render(self, color: Color | None = None) -> str:
+        # NOTE: imported here because .contexts imports this module
+        from .contexts.memento import MEMENTO_DEFAULT_COLOR, memento
 
-    def render(self, color: Color = MEMENTO_DEFAULT_COLOR) -> str:
+        if color is None:
+            color = MEMENTO_DEFAULT_COLOR
         text = self.cursor.textstr
         msg = self.message
         info = self.info
         stack = self.stack
+        # NOTE: the lines before the first one kept by the input are not shown
+        firstline = self._cursor.lineat(0)
 
-        return memento(msg, text, info, stack, color=color)
+        return memento(msg, text, info, stack, color=color, firstline=firstline)
 
     def __str__(self):
         return self.render()
 
 
 class FailedToken(FailedParse):
-    def __init__(self, cursor: Cursor, stack: list[RuleInfo], token: str):
+    def __init__(self, cursor: Cursor, stack: Sequence[RuleInfo], token: str):
         super().__init__(cursor, stack, token)
         self.token = token
 
@@ -98,7 +141,13 @@ class FailedToken(FailedParse):
 
 
 class FailedPattern(FailedParse):
-    pass
+    def __init__(self, cursor: Cursor, stack: Sequence[RuleInfo], pattern: str):
+        super().__init__(cursor, stack, pattern)
+        self.pattern = pattern
+
+    @property
+    def message(self):
+        return f'Expecting {regexpp(self.pattern)}'
 
 
 class FailedMeta(FailedParse):
@@ -106,7 +155,7 @@ class FailedMeta(FailedParse):
 
 
 class FailedRef(FailedParse):
-    def __init__(self, cursor: Cursor, stack: list[RuleInfo], name: str):
+    def __init__(self, cursor: Cursor, stack: Sequence[RuleInfo], name: str):
         super().__init__(cursor, stack, name)
         self.name = name
 
@@ -2,8 +2,8 @@
 # SPDX-License-Identifier: BSD-4-Clause
 from __future__ import annotations
 
-from .cursor import Cursor, Text, Tokenizer
-from .infos import LineIndexInfo, LineInfo, PosLine
+from .cursor import Cursor, Text, TextStr, Tokenizer
+from .infos import LineCache, LineIndexInfo, LineInfo, PosLine
 from .null import NullCursor, NullText
 
 
@@ -12,6 +12,8 @@ __all__ = [
     'NullCursor',
     'Text',
     'NullText',
+    'TextStr',
+    'LineCache',
     'LineIndexInfo',
     'LineInfo',
     'PosLine',
@@ -28,7 +28,7 @@ from ..util.newlines import take_linebreak_len, take_non_newline_whitespace_len
 from ..util.undefined import UndefinedType
 from . import LineInfo
 from .cursor import Cursor, Text, matchbool, matchfloat, matchint, matchname, matchuint
-from .infos import LineIndexInfo, PosLine
+from .infos import LineCache, LineIndexInfo, PosLine
 
 
 DEFAULT_WHITESPACE_RE = re.compile(r'(?m)\s+')
@@ -247,13 +247,12 @@ class BufferCursor(Cursor):
     def lineat(self, pos: int | None = None) -> int:
         if pos is None:
             pos = self.pos
-        return self.buffer.linecache[pos].lineno
+        return self.buffer.linecache.lineno(pos)
 
     def poscol(self, pos: int | None = None) -> int:
         if pos is None:
             pos = self.pos
-        start = self.buffer.linecache[pos].startpos
-        return pos - start
+        return pos - self.buffer.linecache.startpos(pos)
 
     def get_line(self, n: int | None = None) -> str:
         if n is None:
@@ -346,7 +345,7 @@ class Buffer(Text):
         self.pos = 0
         self.len = 0
         self.lines: list[str] = []
-        self.linecache: list[PosLine] = []
+        self.linecache: LineCache | list[PosLine] = []
         self.lineindex: list[LineIndexInfo] = []
 
         self._preprocess()
@@ -497,13 +496,12 @@ class Buffer(Text):
         if pos is None:
             pos = self.pos
         pos = max(0, min(pos, len(self.linecache) - 2))
-        return self.linecache[pos].lineno
+        return self.linecache.lineno(pos)
 
     def poscol(self, pos: int | None = None) -> int:
         if pos is None:
             pos = self.pos
-        start = self.linecache[pos].startpos
-        return pos - start
+        return pos - self.linecache.startpos(pos)
 
     def atend(self) -> bool:
         return self.pos >= self.len
@@ -2,17 +2,31 @@
 # SPDX-License-Identifier: BSD-4-Clause
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from functools import cached_property
-from typing import Protocol, Self, runtime_checkable
+from typing import Protocol, Self, overload, runtime_checkable
 
 from .infos import LineInfo
 
 
+class TextStr(Protocol):
+    # NOTE: the text of a cursor, which is a `str`, or a view that reads as one
+
+    def __len__(self) -> int: ...
+
+    @overload
+    def __getitem__(self, key: int) -> str: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> str: ...
+
+    def splitlines(self) -> Sequence[str]: ...
+
+
 @runtime_checkable
 class Cursor(Protocol):
     pos: int
-    textstr: str
+    textstr: TextStr
 
     def clone(self) -> Self: ...
 
@@ -75,7 +89,7 @@ class Text(Protocol):
 Tokenizer = Text
 
 
-def match_name(s: str, pos: int, namechars: set[str]) -> int:
+def match_name(s: TextStr, pos: int, namechars: set[str]) -> int:
     def is_name_char(c: str) -> bool:
         return bool(c) and (c == '_' or c.isalnum() or c in namechars)
 
@@ -103,7 +117,7 @@ def matchname(c: Cursor) -> str | None:
     return out
 
 
-def match_bool(s: str, pos: int) -> int:
+def match_bool(s: TextStr, pos: int) -> int:
     if not s or pos < 0 or pos >= len(s):
         return -1
     rest = s[pos:]
@@ -122,7 +136,7 @@ def matchbool(c: Cursor) -> bool | None:
     return bool(c.textstr[i:p].capitalize())
 
 
-def match_uint(s: str, pos: int) -> int:
+def match_uint(s: TextStr, pos: int) -> int:
     """Matches an integer with optional sign and internal underscores."""
     p = pos
     while p < len(s):
@@ -141,7 +155,7 @@ def match_uint(s: str, pos: int) -> int:
     return p
 
 
-def match_int(s: str, pos: int) -> int:
+def match_int(s: TextStr, pos: int) -> int:
     p = pos
     if p < len(s) and s[p] in {'+', '-'}:
         p += 1
@@ -152,7 +166,7 @@ def match_int(s: str, pos: int) -> int:
     return match_uint(s, p)
 
 
-def match_float(s: str, pos: int) -> int:
+def match_float(s: TextStr, pos: int) -> int:
     if not s or pos < 0 or pos >= len(s):
         return -1
 
@@ -172,7 +186,7 @@ def match_float(s: str, pos: int) -> int:
     return p
 
 
-def matchstr(c: Cursor, match: Callable[[str, int], int]) -> str | None:
+def matchstr(c: Cursor, match: Callable[[TextStr, int], int]) -> str | None:
     if (p := match(c.textstr, c.pos)) <= 0:
         return None
     i = c.pos
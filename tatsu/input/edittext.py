@@ -0,0 +1,321 @@
+# Copyright (c) 2017-2026 Juancarlo Añez (apalala@gmail.com)
+# SPDX-License-Identifier: BSD-4-Clause
+"""
+Input text that is edited in place between parses.
+
+The text is indexed in blocks of about `BLOCK_SIZE` characters. A block
+knows where its lines end, and holds the memos of the parser for the
+positions in it, keyed by their offset in the block, so an edit rebuilds
+only the blocks it touches, and only shifts where the blocks after it start.
+
+To know which memos an edit invalidates, the cursors keep the furthest
+position looked at in `EditText.reach`. A literal token looks at its own
+characters and the one after. Anything else, like patterns, names, numbers,
+and whitespace and comments, is taken to look as far as the end of the line
+it stops on. Lines end at ``\\n``.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from typing import Any, Protocol
+
+from ..config import ParserConfig
+from ..util import notnone
+from .cursor import Cursor
+from .infos import LineIndexInfo, LineInfo
+from .textlines import TextLines, TextLinesCursor
+
+
+BLOCK_SIZE = 1 << 12
+
+
+class Memo(Protocol):
+    # NOTE: how far past its position the memo depends on the text
+    span: int
+
+
+class TextBlock:
+    __slots__ = ('memos', 'newlines', 'reach')
+
+    def __init__(self, text: str):
+        self.newlines: list[int] = []
+        i = text.find('\n')
+        while i >= 0:
+            self.newlines.append(i)
+            i = text.find('\n', i + 1)
+
+        self.memos: dict[int, dict[int, Memo]] = {}
+        # NOTE: how far past the start of the block its memos depend on the text
+        self.reach: int = 0
+
+
+class EditTextCursor(TextLinesCursor):
+    __slots__ = ()
+
+    @property
+    def input(self) -> EditText:
+        return self._input  # type: ignore[return-value]
+
+    @property
+    def source(self) -> str:
+        return self.input.source
+
+    def _touch(self, end: int) -> None:
+        self.input.reach = max(self.input.reach, end)
+
+    def _touchline(self, pos: int) -> None:
+        end = self.textstr.find('\n', pos)
+        self._touch(self.len + 1 if end < 0 else end + 1)
+
+    @property
+    def current(self) -> str | None:
+        self._touch(self.pos + 1)
+        return super().current
+
+    def peek(self, n: int = 1) -> str | None:
+        self._touch(self.pos + n + 1)
+        return super().peek(n)
+
+    def atend(self) -> bool:
+        self._touch(self.pos + 1)
+        return super().atend()
+
+    def next_token(self) -> None:
+        super().next_token()
+        self._touchline(self.pos)
+
+    def matcheol(self) -> bool:
+        self._touchline(self.pos)
+        if not super().matcheol():
+            return False
+        self._touchline(self.pos)
+        return True
+
+    def match(self, token: str) -> str | None:
+        self._touch(self.pos + len(token) + 1)
+        return super().match(token)
+
+    def matchname(self) -> str | None:
+        self._touchline(self.pos)
+        return super().matchname()
+
+    def matchint(self) -> int | None:
+        self._touchline(self.pos)
+        return super().matchint()
+
+    def matchuint(self) -> int | None:
+        self._touchline(self.pos)
+        return super().matchuint()
+
+    def matchfloat(self) -> float | None:
+        self._touchline(self.pos)
+        return super().matchfloat()
+
+    def matchbool(self) -> bool | None:
+        self._touchline(self.pos)
+        return super().matchbool()
+
+    def _scanre(self, pattern: str | re.Pattern | None) -> re.Match[Any] | None:
+        match = super()._scanre(pattern)
+        self._touchline(match.end() if match else self.pos)
+        return match
+
+    def lineinfo(self, pos: int | None = None) -> LineInfo:
+        return self.input.lineinfo(notnone(pos, self.pos) or 0)
+
+    def lineat(self, pos: int | None = None) -> int:
+        return self.input.lineat(notnone(pos, self.pos) or 0)
+
+    def poscol(self, pos: int | None = None) -> int:
+        pos = notnone(pos, self.pos) or 0
+        return pos - self.input.linestart(self.lineat(pos))
+
+
+class EditText(TextLines):
+    """
+    A text that is edited with `edit(start, end, text)`.
+
+    The memos of a parse are kept with the text by `ParseSession`, and are
+    moved along with it by the edits that don't touch what they looked at.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        *,
+        config: ParserConfig | None = None,
+        **settings: Any,
+    ):
+        self.reach: int = 0
+        self._blocks: list[TextBlock] = []
+        self._starts: list[int] = []
+        self._linesbefore: list[int] = []
+        super().__init__(text, config=config, **settings)
+
+    def newcursor(self) -> Cursor:
+        return EditTextCursor(self)
+
+    def _preprocess(self):
+        self.textstr = self.original_text
+
+    def _postprocess(self):
+        self._blocks, self._starts = self._split(0, self.textstr)
+        self._count_lines(0)
+
+    @staticmethod
+    def _split(start: int, text: str) -> tuple[list[TextBlock], list[int]]:
+        offsets = range(0, len(text), BLOCK_SIZE)
+        blocks = [TextBlock(text[i : i + BLOCK_SIZE]) for i in offsets]
+        return blocks, [start + i for i in offsets]
+
+    def _count_lines(self, b: int) -> None:
+        blocks, linesbefore = self._blocks, self._linesbefore
+        if not blocks:
+            blocks.append(TextBlock(''))
+            self._starts.append(0)
+        del linesbefore[b:]
+        count = linesbefore[-1] + len(blocks[b - 1].newlines) if b else 0
+        for block in blocks[b:]:
+            linesbefore.append(count)
+            count += len(block.newlines)
+
+    @property
+    def linecount(self) -> int:
+        return self._linesbefore[-1] + len(self._blocks[-1].newlines) + 1
+
+    def _blockat(self, pos: int) -> int:
+        return max(0, bisect_right(self._starts, pos) - 1)
+
+    def lineat(self, pos: int) -> int:
+        pos = max(0, min(self.len, pos))
+        b = self._blockat(pos)
+        local = pos - self._starts[b]
+        return self._linesbefore[b] + bisect_left(self._blocks[b].newlines, local)
+
+    def linestart(self, n: int) -> int:
+        if n <= 0:
+            return 0
+        if n >= self.linecount:
+            return self.len
+        n -= 1
+        b = bisect_right(self._linesbefore, n) - 1
+        return self._starts[b] + self._blocks[b].newlines[n - self._linesbefore[b]] + 1
+
+    def lineinfo(self, pos: int) -> LineInfo:
+        pos = max(0, min(self.len, pos))
+        line = self.lineat(pos)
+        start = self.linestart(line)
+        end = self.linestart(line + 1)
+        return LineInfo(
+            source=self.source,
+            line=line,
+            col=pos - start,
+            start=start,
+            end=end,
+            text=self.textstr[start:end],
+        )
+
+    def get_line(self, n: int) -> str:
+        return self.textstr[self.linestart(n) : self.linestart(n + 1)]
+
+    def get_lines(self, start: int | None = None, end: int | None = None) -> list[str]:
+        if start is None:
+            start = 0
+        end = min(notnone(end, start + 1), self.linecount)
+        return [self.get_line(n) for n in range(start, end)]
+
+    def line_index_at(
+        self, start: int = 0, end: int | None = None
+    ) -> list[LineIndexInfo]:
+        if end is None:
+            end = self.linecount
+        end = min(end, self.linecount - 1)
+        return [LineIndexInfo(self.source, n) for n in range(start, 1 + end)]
+
+    def edit(self, start: int, end: int, text: str) -> None:
+        """Replace the text in `[start:end]` with `text`."""
+        if not 0 <= start <= end <= self.len:
+            raise ValueError(f'cannot replace [{start}:{end}] in a text of {self.len}')
+        delta = len(text) - (end - start)
+        blocks, starts = self._blocks, self._starts
+        b0 = self._blockat(start)
+        b1 = self._blockat(end)
+
+        # NOTE: the memos of earlier blocks may look into the edit
+        for b in range(b0):
+            if starts[b] + blocks[b].reach > start:
+                self._invalidate(b, start)
+
+        kept: list[tuple[int, int, Memo]] = []
+        for b in range(b0, b1 + 1):
+            for local, bucket in blocks[b].memos.items():
+                pos = starts[b] + local
+                for ruleid, memo in bucket.items():
+                    if pos + memo.span <= start:
+                        kept.append((pos, ruleid, memo))
+                    elif pos >= end:
+                        kept.append((pos + delta, ruleid, memo))
+
+        first = starts[b0]
+        last = starts[b1 + 1] if b1 + 1 < len(blocks) else self.len
+        self.textstr = self.textstr[:start] + text + self.textstr[end:]
+        self.skips.clear()
+
+        newblocks, newstarts = self._split(first, self.textstr[first : last + delta])
+        blocks[b0 : b1 + 1] = newblocks
+        starts[b0 : b1 + 1] = newstarts
+        for b in range(b0 + len(newblocks), len(starts)):
+            starts[b] += delta
+        self._count_lines(b0)
+
+        for pos, ruleid, memo in kept:
+            self.setmemo(pos, ruleid, memo)
+
+    def _invalidate(self, b: int, start: int) -> None:
+        block = self._blocks[b]
+        limit = start - self._starts[b]
+        reach = 0
+        for local in list(block.memos):
+            bucket = block.memos[local]
+            stale = [r for r, memo in bucket.items() if local + memo.span > limit]
+            for ruleid in stale:
+                del bucket[ruleid]
+            if not bucket:
+                del block.memos[local]
+            else:
+                reach = max(reach, *(local + memo.span for memo in bucket.values()))
+        block.reach = reach
+
+    def getmemo(self, pos: int, ruleid: int) -> Memo | None:
+        b = self._blockat(pos)
+        bucket = self._blocks[b].memos.get(pos - self._starts[b])
+        return bucket.get(ruleid) if bucket is not None else None
+
+    def setmemo(self, pos: int, ruleid: int, memo: Memo) -> None:
+        b = self._blockat(pos)
+        block = self._blocks[b]
+        local = pos - self._starts[b]
+        if (bucket := block.memos.get(local)) is None:
+            bucket = block.memos[local] = {}
+        bucket[ruleid] = memo
+        block.reach = max(block.reach, local + memo.span)
+
+    def delmemo(self, pos: int, ruleid: int) -> None:
+        b = self._blockat(pos)
+        bucket = self._blocks[b].memos.get(pos - self._starts[b])
+        if bucket is not None:
+            bucket.pop(ruleid, None)
+
+    def clearmemos(self) -> None:
+        for block in self._blocks:
+            block.memos.clear()
+            block.reach = 0
+
+    def memos(self) -> Iterator[tuple[int, int, Memo]]:
+        for start, block in zip(self._starts, self._blocks, strict=True):
+            for local, bucket in block.memos.items():
+                for ruleid, memo in bucket.items():
+                    yield start + local, ruleid, memo
@@ -2,6 +2,8 @@
 # SPDX-License-Identifier: BSD-4-Clause
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_right
 from itertools import starmap
 from typing import NamedTuple
 
@@ -33,21 +35,19 @@ class PosLine(NamedTuple):
     def build_line_cache(lines, size):
         # an index from original positions to PosLine entries
         if not lines:
-            return [], 1
+            return LineCache(array('q', [0]), 0, 0), 1
 
-        cache = []
-        n = 0
+        starts = array('q', [0])
         i = 0
-        for n, line in enumerate(lines):
-            pl = PosLine(i, n, len(line))
-            for _ in line:
-                cache.append(pl)  # noqa: PERF401
+        for line in lines:
             i += len(line)
+            starts.append(i)
 
-        n += 1
+        n = len(lines)
         if lines[-1][-1] in {'\r', '\n'}:
             n += 1
-        cache.append(PosLine(i, n, 0))
+
+        cache = LineCache(starts, size, n)
 
         # the range depends on line[-1] ending in a newline
         endrange = range(len(lines), 2 + len(lines))
@@ -55,3 +55,52 @@ class PosLine(NamedTuple):
         assert len(cache) == 1 + size
 
         return cache, n
+
+
+class LineCache:
+    """
+    Maps text positions to lines.
+
+    Only the start offset of each line is stored, so memory is proportional
+    to the number of lines, and lookups bisect over the offsets. Indexing with
+    a position returns the `PosLine` for it, as the per-character list this
+    replaces did, including the sentinel entry at the end of the text.
+    """
+
+    __slots__ = ('endline', 'size', 'starts')
+
+    def __init__(self, starts: array, size: int, endline: int):
+        # NOTE: starts[-1] == size
+        self.starts: array = starts
+        self.size: int = size
+        self.endline: int = endline
+
+    def lineno(self, pos: int) -> int:
+        if pos >= self.size:
+            if pos > self.size:
+                raise IndexError(f'position {pos} out of range')
+            return self.endline
+        return bisect_right(self.starts, pos) - 1
+
+    def startpos(self, pos: int) -> int:
+        if pos >= self.size:
+            return self.size
+        return self.starts[bisect_right(self.starts, pos) - 1]
+
+    def __getitem__(self, pos: int) -> PosLine:
+        if pos < 0:
+            pos += len(self)
+        if not 0 <= pos <= self.size:
+            raise IndexError(f'position {pos} out of range')
+        if pos == self.size:
+            return PosLine(self.size, self.endline, 0)
+
+        n = bisect_right(self.starts, pos) - 1
+        start = self.starts[n]
+        return PosLine(start, n, self.starts[n + 1] - start)
+
+    def __len__(self) -> int:
+        return 1 + self.size if self.size else 0
+
+    def __bool__(self) -> bool:
+        return self.size > 0
@@ -0,0 +1,592 @@
+# Copyright (c) 2017-2026 Juancarlo Añez (apalala@gmail.com)
+# SPDX-License-Identifier: BSD-4-Clause
+"""
+Input read through a memory map of a file.
+
+The file is never loaded as a whole. Tokens and patterns are matched on the
+mapped bytes, and only what is matched, and the line an error is reported
+at, are decoded. The starts of lines are found as far as positions ask for
+them. Positions are byte offsets into the file.
+
+Patterns are matched as bytes patterns, so the encoding must be compatible
+with ASCII, and ``\\w``, ``\\d`` and ``\\s`` match only ASCII characters.
+A pattern of the grammar with non-ASCII characters would match them byte
+by byte, so it is matched on the text decoded from where it starts, up to
+`DECODE_CHUNK` bytes ahead, and over more text if it matches up to the end
+of that. Whitespace and comments must be ASCII.
+Lines end at ``\\n``.
+"""
+
+from __future__ import annotations
+
+import codecs
+import mmap
+import re
+from array import array
+from bisect import bisect_right
+from collections.abc import Callable, Iterator, Sequence
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Self, overload
+
+from ..config import ParserConfig
+from ..util import notnone, str_from_match, typename
+from ..util.regextools import cached_re_compile, repeated_union_re
+from .cursor import Cursor, Text, match_bool, match_float, match_int, match_uint
+from .infos import LineInfo
+from .textlines import TextLines
+
+
+# NOTE: how much of the file is scanned at a time for line starts
+SCAN_CHUNK = 1 << 22
+
+# NOTE: how much of the file is decoded first for a pattern with non-ASCII
+DECODE_CHUNK = 1 << 12
+
+_NEWLINE = b'\n'
+_EOL_RE = re.compile(rb'[^\S\n]*(?:\n|\Z)')
+_SPACES_NO_NEWLINE_RE = re.compile(rb'[^\S\r\n]*')
+_LITERAL_RE = re.compile(rb'[\w.+-]*')
+
+
+class MmapCursor(Cursor):
+    __slots__ = ('_data', '_input', 'len', 'pos', 'textstr')
+
+    def __init__(self, input: MmapText, pos: int = 0):
+        self._input: MmapText = input
+        self._data = input.data
+        self.pos: int = pos
+        self.len: int = input.len
+        self.textstr = input.textstr
+
+    def clone(self) -> Self:
+        return type(self)(self.input, pos=self.pos)
+
+    def __copy__(self) -> Self:
+        return type(self)(self.input, pos=self.pos)
+
+    @property
+    def input(self) -> MmapText:
+        return self._input
+
+    @property
+    def source(self) -> str:
+        return self.input.source
+
+    @property
+    def line(self) -> int:
+        return self.lineat(self.pos)
+
+    @property
+    def linecount(self) -> int:
+        return self.input.linecount
+
+    @property
+    def col(self) -> int:
+        return self.poscol(self.pos)
+
+    @cached_property
+    def namechars(self) -> set[str]:
+        return self.input._namechar_set
+
+    def goto(self, pos: int):
+        self.pos = max(0, min(self.len, pos))
+
+    def move(self, n: int):
+        # NOTE: forward by characters, backward by bytes
+        if n <= 0:
+            self.goto(self.pos + n)
+            return
+        for _ in range(n):
+            if self.pos >= self.len:
+                break
+            self.pos += self.input.charat(self.pos)[1]
+
+    def atend(self) -> bool:
+        return self.pos >= self.len
+
+    def ateol(self) -> bool:
+        return self.atend() or self.current in {'\r', '\n', None}
+
+    @property
+    def current(self) -> str | None:
+        if self.pos >= self.len:
+            return None
+        return self.input.charat(self.pos)[0]
+
+    def next(self) -> str | None:
+        if self.atend():
+            return None
+        c, n = self.input.charat(self.pos)
+        self.pos += n
+        return c
+
+    def next_token(self) -> None:
+        # NOTE: where the next token starts is memoized per input position
+        skips = self._input.skips
+        if (end := skips.get(self.pos)) is None:
+            start = self.pos
+            if (skip_re := self._input.skip_re) is not None:
+                match = skip_re.match(self._data, start)
+                assert match is not None
+                end = match.end()
+            else:
+                self._eat_separators()
+                end = self.pos
+            skips[start] = end
+        self.pos = end
+
+    def _eat_separators(self) -> None:
+        p = -1
+        while self.pos != p:
+            p = self.pos
+            self.eat_whitespace()
+            while self.eat_eol_comments():
+                self.eat_whitespace()
+            self.eat_comments()
+
+    def eat_spaces_no_newlines(self):
+        p = None
+        while self.pos != p:
+            p = self.pos
+            self._matchre_fast(_SPACES_NO_NEWLINE_RE)
+            if self.eat_eol_comments():
+                self._matchre_fast(_SPACES_NO_NEWLINE_RE)
+            self.eat_comments()
+
+    def matcheol(self) -> bool:
+        mark = self.pos
+        self.eat_spaces_no_newlines()
+        if (eol := _EOL_RE.match(self._data, self.pos)) is None:
+            self.pos = mark
+            return False
+        self.goto(eol.end())
+        self.eat_spaces_no_newlines()
+        return True
+
+    def match(self, token: str) -> str | None:
+        if not token:
+            return None
+
+        p = self.pos
+        encoded = self.input.encode(token)
+        end = p + len(encoded)
+
+        if self.input.ignorecase:
+            text = self.input.decode(self._data[p:end])
+            is_match = text.lower() == token.lower()
+        else:
+            # NOTE: no copy of the input is made to compare
+            is_match = end <= self.len and self._data.find(encoded, p, end) == p
+
+        if not is_match:
+            return None
+
+        self.goto(end)
+        partial_match = (
+            self.input.nameguard
+            and self.is_name_char(self.current)
+            and self.is_name(token)
+        )
+        if partial_match:
+            self.goto(p)
+            return None
+
+        return token
+
+    def matchre(self, pattern: str | re.Pattern) -> str | None:
+        if (cre := self.input.str_re(pattern)) is not None:
+            if not (decoded := self.input.matchdecoded(cre, self.pos)):
+                return None
+            self.goto(decoded[1])
+            return str_from_match(decoded[0])
+        if not (match := self._scanre(pattern)):
+            return None
+        token = str_from_match(match)
+        self.goto(match.end())
+        if isinstance(token, bytes):
+            return self.input.decode(token)
+        return token
+
+    def matchname(self) -> str | None:
+        if self.atend():
+            return None
+        c, n = self.input.charat(self.pos)
+        if not (c == '_' or c.isalpha() or c in self.namechars):
+            return None
+
+        chars = [c]
+        p = self.pos + n
+        while p < self.len:
+            c, n = self.input.charat(p)
+            if not (c == '_' or c.isalnum() or c in self.namechars):
+                break
+            chars.append(c)
+            p += n
+        self.pos = p
+        return ''.join(chars)
+
+    def matchint(self) -> int | None:
+        if (s := self._matchliteral(match_int)) is not None:
+            return int(s)
+        return None
+
+    def matchuint(self) -> int | None:
+        if (s := self._matchliteral(match_uint)) is not None:
+            return int(s)
+        return None
+
+    def matchfloat(self) -> float | None:
+        if (s := self._matchliteral(match_float)) is not None:
+            return float(s)
+        return None
+
+    def matchbool(self) -> bool | None:
+        if (s := self._matchliteral(match_bool)) is not None:
+            return s.lower() == 'true'
+        return None
+
+    def _matchliteral(self, match: Callable[[str, int], int]) -> str | None:
+        # NOTE: numbers and booleans are ASCII, so bytes and characters agree
+        literal = _LITERAL_RE.match(self._data, self.pos)
+        assert literal is not None
+        s = literal.group().decode('ascii')
+        if (p := match(s, 0)) <= 0:
+            return None
+        self.pos += p
+        return s[:p]
+
+    def is_name_char(self, c: str | None) -> bool:
+        return c is not None and (c.isalnum() or c in self.namechars)
+
+    def is_name(self, s: str) -> bool:
+        if not s:
+            return False
+
+        goodstart = s[0].isalpha() or s[0] in self.namechars
+        return goodstart and all(self.is_name_char(c) for c in s[1:])
+
+    def lineinfo(self, pos: int | None = None) -> LineInfo:
+        return self.input.lineinfo(notnone(pos, self.pos) or 0)
+
+    def lookahead_pos(self) -> str:
+        if self.atend():
+            return ''
+        info = self.lineinfo(self.pos)
+        return '[%d:%d]' % (info.line + 1, info.col + 1)
+
+    def lookahead(self) -> str:
+        if self.atend():
+            return ''
+        info = self.lineinfo(self.pos)
+        return info.text[info.col : info.col + 1 + 80].rstrip()
+
+    def lineat(self, pos: int | None = None) -> int:
+        return self.input.lineat(notnone(pos, self.pos) or 0)
+
+    def poscol(self, pos: int | None = None) -> int:
+        return self.lineinfo(pos).col
+
+    def get_line(self, n: int | None = None) -> str:
+        return self.input.get_line(notnone(n, self.line))
+
+    def eat_whitespace(self) -> bool:
+        return self._eat_regex(self.input.whitespace_re)
+
+    def eat_comments(self) -> bool:
+        return self._eat_regex(self.input.config.comments)
+
+    def eat_eol_comments(self) -> bool:
+        return self._eat_regex(self.input.config.eol_comments)
+
+    def _eat_regex(self, regex: str | re.Pattern | None) -> bool:
+        if not regex:
+            return False
+        res = False
+        while self._matchre_fast(regex):
+            res = True
+        return res
+
+    def _matchre_fast(self, pattern: str | re.Pattern | None) -> bool:
+        if not (match := self._scanre(pattern)) or match.end() == self.pos:
+            return False
+        self.goto(match.end())
+        return True
+
+    def _scanre(self, pattern: str | re.Pattern | None) -> re.Match[Any] | None:
+        if not (cre := self.input.bytes_re(pattern)):
+            return None
+        return cre.match(self._data, self.pos)
+
+    def __len__(self) -> int:
+        return self.len
+
+    def __repr__(self) -> str:
+        pos = self.pos
+        return f'{typename(self)}({pos=})'
+
+
+class MmapText(Text):
+    """
+    The text of a file, mapped to memory instead of read.
+
+    The text takes the whitespace, comments and other settings of the
+    grammar only through `config`, as in
+    ``MmapText(path, config=model.config)``.
+    """
+
+    def __init__(
+        self,
+        filename: str | Path,
+        *,
+        encoding: str = 'utf-8',
+        config: ParserConfig | None = None,
+        **settings: Any,
+    ):
+        config = ParserConfig.new(config=config, **settings)
+        assert isinstance(config, ParserConfig)
+        if not config.source:
+            config = config.override(source=str(filename))
+        self.config = config
+
+        if 'a\n'.encode(encoding) != b'a\n':
+            raise ValueError(f'encoding {encoding!r} is not compatible with ASCII')
+        self.encoding = encoding
+        self.filename = Path(filename)
+
+        self.data: mmap.mmap | bytes = b''
+        with self.filename.open('rb') as f:
+            # NOTE: empty files cannot be mapped
+            if self.filename.stat().st_size:
+                self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.len = len(self.data)
+
+        self._patterns: dict[str | re.Pattern, re.Pattern[bytes]] = {}
+        self._strpatterns: dict[str | re.Pattern, re.Pattern[str] | None] = {}
+
+        whitespace_re = TextLines.build_whitespace_re(config.whitespace)
+        self.whitespace_re = self.bytes_re(whitespace_re)
+        self.nameguard = (
+            config.nameguard
+            if config.nameguard is not None
+            else bool(whitespace_re) or bool(config.namechars)
+        )
+        self._namechar_set = set(config.namechars or '')
+
+        # NOTE: one pass over whitespace and comments, memoized by position
+        self.skip_re = self.bytes_re(
+            repeated_union_re(whitespace_re, config.eol_comments, config.comments),
+        )
+        self.skips: dict[int, int] = {}
+
+        self._starts = array('q', [0])
+        self._scanned = 0
+        self.textstr = MmapTextView(self)
+
+    def newcursor(self) -> Cursor:
+        return MmapCursor(self)
+
+    def close(self) -> None:
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_args: Any) -> None:
+        self.close()
+
+    @property
+    def source(self) -> str:
+        return str(self.config.source or '')
+
+    @property
+    def ignorecase(self) -> bool:
+        return bool(self.config.ignorecase)
+
+    @cached_property
+    def linecount(self) -> int:
+        count = 1
+        for i in range(0, self.len, SCAN_CHUNK):
+            count += self.data[i : i + SCAN_CHUNK].count(_NEWLINE)
+        return count
+
+    def encode(self, s: str) -> bytes:
+        return s.encode(self.encoding)
+
+    def decode(self, b: bytes) -> str:
+        return b.decode(self.encoding, errors='replace')
+
+    def bytes_re(self, pattern: str | re.Pattern | None) -> re.Pattern[bytes] | None:
+        if not pattern:
+            return None
+        if (cre := self._patterns.get(pattern)) is not None:
+            return cre
+
+        if isinstance(pattern, re.Pattern):
+            source, flags = pattern.pattern, pattern.flags
+        else:
+            source, flags = str(pattern), 0
+        if isinstance(source, str):
+            if not source.isascii():
+                raise ValueError(
+                    f'pattern {source!r} has non-ASCII characters, '
+                    'which would be matched byte by byte',
+                )
+            source = self.encode(source)
+            flags &= ~re.UNICODE
+        cre = re.compile(source, flags)
+        self._patterns[pattern] = cre
+        return cre
+
+    def str_re(self, pattern: str | re.Pattern) -> re.Pattern[str] | None:
+        # NOTE: the pattern if it has non-ASCII characters, to match it decoded
+        if pattern in self._strpatterns:
+            return self._strpatterns[pattern]
+        source = pattern.pattern if isinstance(pattern, re.Pattern) else str(pattern)
+        if isinstance(source, str) and not source.isascii():
+            cre = cached_re_compile(pattern)
+        else:
+            cre = None
+        self._strpatterns[pattern] = cre
+        return cre
+
+    def matchdecoded(
+        self,
+        cre: re.Pattern[str],
+        pos: int,
+    ) -> tuple[re.Match[str], int] | None:
+        """Match `cre` on the text decoded at `pos`, with where it ends."""
+        size = DECODE_CHUNK
+        while True:
+            end = min(self.len, pos + size)
+            decoder = codecs.getincrementaldecoder(self.encoding)('surrogateescape')
+            text = decoder.decode(self.data[pos:end], final=end == self.len)
+            match = cre.match(text)
+            if end == self.len or (text and (not match or match.end() < len(text))):
+                break
+            size *= 2
+        if not match:
+            return None
+        matched = text[: match.end()].encode(self.encoding, 'surrogateescape')
+        return match, pos + len(matched)
+
+    def charat(self, pos: int) -> tuple[str, int]:
+        # NOTE: the character at pos and its length in bytes
+        data = self.data
+        if (b := data[pos]) < 0x80:
+            return chr(b), 1
+        for n in range(1, 5):
+            try:
+                c = data[pos : pos + n].decode(self.encoding)
+            except UnicodeDecodeError:
+                continue
+            if len(c) == 1:
+                return c, n
+        return self.decode(data[pos : pos + 1]), 1
+
+    def _scan_lines(self, pos: int, lines: int = 0) -> None:
+        # NOTE: the starts of lines are found up to pos, or the first lines
+        data, starts = self.data, self._starts
+        while self._scanned < self.len and (
+            self._scanned <= pos or len(starts) <= lines
+        ):
+            end = min(self.len, self._scanned + SCAN_CHUNK)
+            i = data.find(_NEWLINE, self._scanned, end)
+            while i != -1:
+                starts.append(i + 1)
+                i = data.find(_NEWLINE, i + 1, end)
+            self._scanned = end
+
+    def lineat(self, pos: int) -> int:
+        pos = max(0, min(self.len, pos))
+        self._scan_lines(pos)
+        return bisect_right(self._starts, pos) - 1
+
+    def _line_span(self, n: int) -> tuple[int, int]:
+        self._scan_lines(-1, lines=n + 1)
+        start = self._starts[n]
+        end = self.data.find(_NEWLINE, start)
+        return start, self.len if end < 0 else end + 1
+
+    def lineinfo(self, pos: int) -> LineInfo:
+        pos = max(0, min(self.len, pos))
+        line = self.lineat(pos)
+        start, end = self._line_span(line)
+        return LineInfo(
+            source=self.source,
+            line=line,
+            col=len(self.decode(self.data[start:pos])),
+            start=start,
+            end=end,
+            text=self.decode(self.data[start:end]),
+        )
+
+    def get_line(self, n: int) -> str:
+        start, end = self._line_span(n)
+        return self.decode(self.data[start:end])
+
+
+class MmapTextView:
+    """
+    The text of an `MmapText` where a string is expected.
+
+    Slices are decoded when taken, and `splitlines()` decodes only the lines
+    that are asked for.
+    """
+
+    __slots__ = ('_input',)
+
+    def __init__(self, input: MmapText):
+        self._input = input
+
+    def __len__(self) -> int:
+        return self._input.len
+
+    @overload
+    def __getitem__(self, key: int) -> str: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> str: ...
+
+    def __getitem__(self, key: int | slice) -> str:
+        if isinstance(key, slice):
+            return self._input.decode(self._input.data[key])
+        return self._input.charat(key)[0]
+
+    def splitlines(self) -> MmapLines:
+        return MmapLines(self._input)
+
+    def __str__(self) -> str:
+        return self._input.decode(self._input.data[:])
+
+    def __repr__(self) -> str:
+        return f'{typename(self)}({self._input.filename!r})'
+
+
+class MmapLines(Sequence[str]):
+    __slots__ = ('_input',)
+
+    def __init__(self, input: MmapText):
+        self._input = input
+
+    def __len__(self) -> int:
+        return self._input.linecount
+
+    @overload
+    def __getitem__(self, key: int) -> str: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> Sequence[str]: ...
+
+    def __getitem__(self, key: int | slice) -> str | Sequence[str]:
+        if isinstance(key, slice):
+            return [self[i] for i in range(*key.indices(len(self)))]
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError(f'line {key} out of range')
+        return self._input.get_line(key).rstrip('\r\n')
+
+    def __iter__(self) -> Iterator[str]:
+        return (self[i] for i in range(len(self)))
@@ -0,0 +1,545 @@
+# Copyright (c) 2017-2026 Juancarlo Añez (apalala@gmail.com)
+# SPDX-License-Identifier: BSD-4-Clause
+"""
+Input read from a stream as the parser asks for it.
+
+The text is pulled in chunks from a file-like object or an iterable of
+strings, and is kept only from the last position the parser released with
+`release()`. Positions are offsets from the start of the stream.
+
+The parser is kept at least `chunksize` characters ahead of every position
+it looks at, and a pattern that matches up to the end of what was read is
+matched again over more text. A single token may only fail to match if it
+would need more than `chunksize` characters to be seen whole.
+Lines end at ``\\n``.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from functools import cached_property, partial
+from typing import Any, Protocol, Self, overload
+
+from ..config import ParserConfig
+from ..util import notnone, str_from_match, typename
+from ..util.regextools import cached_re_compile, repeated_union_re
+from .cursor import Cursor, Text, matchbool, matchfloat, matchint, matchname, matchuint
+from .infos import LineInfo
+from .textlines import TextLines
+
+
+DEFAULT_CHUNKSIZE = 1 << 16
+
+_EOL_RE = re.compile(r'[^\S\r\n]*(?:\r?\n|\r|\Z)')
+_SPACES_NO_NEWLINE_RE = re.compile(r'[^\S\r\n]*')
+
+
+class SupportsRead(Protocol):
+    def read(self, n: int, /) -> str: ...
+
+
+class StreamCursor(Cursor):
+    __slots__ = ('_input', 'pos', 'textstr')
+
+    def __init__(self, input: StreamText, pos: int = 0):
+        self._input: StreamText = input
+        self.pos: int = pos
+        self.textstr = input.textstr
+
+    def clone(self) -> Self:
+        return type(self)(self.input, pos=self.pos)
+
+    def __copy__(self) -> Self:
+        return type(self)(self.input, pos=self.pos)
+
+    @property
+    def input(self) -> StreamText:
+        return self._input
+
+    @property
+    def source(self) -> str:
+        return self.input.source
+
+    @property
+    def len(self) -> int:
+        return self.input.len
+
+    @property
+    def line(self) -> int:
+        return self.lineat(self.pos)
+
+    @property
+    def linecount(self) -> int:
+        return self.input.linecount
+
+    @property
+    def col(self) -> int:
+        return self.poscol(self.pos)
+
+    @cached_property
+    def namechars(self) -> set[str]:
+        return self.input._namechar_set
+
+    def goto(self, pos: int):
+        self.input.fill(pos)
+        self.pos = max(0, min(self.input.len, pos))
+
+    def move(self, n: int):
+        self.goto(self.pos + n)
+
+    def atend(self) -> bool:
+        return self.input.atend(self.pos)
+
+    def ateol(self) -> bool:
+        return self.atend() or self.current in {'\r', '\n', None}
+
+    @property
+    def current(self) -> str | None:
+        return self.input.charat(self.pos)
+
+    def peek(self, n: int = 1) -> str | None:
+        if (p := self.pos + n) < 0:
+            return None
+        return self.input.charat(p)
+
+    def next(self) -> str | None:
+        if (c := self.current) is not None:
+            self.pos += 1
+        return c
+
+    def next_token(self) -> None:
+        # NOTE: where the next token starts is memoized per input position
+        skips = self._input.skips
+        if (end := skips.get(self.pos)) is None:
+            start = self.pos
+            if (skip_re := self._input.skip_re) is not None:
+                end = self._input.matchend(skip_re, start)
+                assert end is not None
+            else:
+                self._eat_separators()
+                end = self.pos
+            skips[start] = end
+        self.pos = end
+
+    def _eat_separators(self) -> None:
+        p = -1
+        while self.pos != p:
+            p = self.pos
+            self.eat_whitespace()
+            while self.eat_eol_comments():
+                self.eat_whitespace()
+            self.eat_comments()
+
+    def eat_spaces_no_newlines(self):
+        p = None
+        while self.pos != p:
+            p = self.pos
+            self._matchre_fast(_SPACES_NO_NEWLINE_RE)
+            if self.eat_eol_comments():
+                self._matchre_fast(_SPACES_NO_NEWLINE_RE)
+            self.eat_comments()
+
+    def matcheol(self) -> bool:
+        mark = self.pos
+        self.eat_spaces_no_newlines()
+        if (end := self.input.matchend(_EOL_RE, self.pos)) is None:
+            self.pos = mark
+            return False
+        self.pos = end
+        self.eat_spaces_no_newlines()
+        return True
+
+    def match(self, token: str) -> str | None:
+        if not token:
+            return None
+
+        p = self.pos
+        text = self.input.substr(p, p + len(token))
+
+        if self.input.ignorecase:
+            is_match = text.lower() == token.lower()
+        else:
+            is_match = text == token
+
+        if not is_match:
+            return None
+
+        self.move(len(token))
+        partial_match = (
+            self.input.nameguard
+            and self.is_name_char(self.current)
+            and self.is_name(token)
+        )
+        if partial_match:
+            self.goto(p)
+            return None
+
+        return token
+
+    def matchre(self, pattern: str | re.Pattern) -> str | None:
+        if not (match := self._scanre(pattern)):
+            return None
+        token = str_from_match(match)
+        self.pos = self.input.offset + match.end()
+        return token
+
+    def matchname(self) -> str | None:
+        self.input.fill(self.pos)
+        return matchname(self)
+
+    def matchint(self) -> int | None:
+        self.input.fill(self.pos)
+        return matchint(self)
+
+    def matchuint(self) -> int | None:
+        self.input.fill(self.pos)
+        return matchuint(self)
+
+    def matchfloat(self) -> float | None:
+        self.input.fill(self.pos)
+        return matchfloat(self)
+
+    def matchbool(self) -> bool | None:
+        self.input.fill(self.pos)
+        return matchbool(self)
+
+    def is_name_char(self, c: str | None) -> bool:
+        return c is not None and (c.isalnum() or c in self.namechars)
+
+    def is_name(self, s: str) -> bool:
+        if not s:
+            return False
+
+        goodstart = s[0].isalpha() or s[0] in self.namechars
+        return goodstart and all(self.is_name_char(c) for c in s[1:])
+
+    def lineinfo(self, pos: int | None = None) -> LineInfo:
+        return self.input.lineinfo(notnone(pos, self.pos) or 0)
+
+    def lookahead_pos(self) -> str:
+        if self.atend():
+            return ''
+        info = self.lineinfo(self.pos)
+        return '[%d:%d]' % (info.line + 1, info.col + 1)
+
+    def lookahead(self) -> str:
+        if self.atend():
+            return ''
+        text = self.input.substr(self.pos, self.pos + 1 + 80)
+        return text.splitlines()[0].rstrip() if text else ''
+
+    def lineat(self, pos: int | None = None) -> int:
+        return self.input.lineat(notnone(pos, self.pos) or 0)
+
+    def poscol(self, pos: int | None = None) -> int:
+        return self.lineinfo(pos).col
+
+    def get_line(self, n: int | None = None) -> str:
+        return self.input.get_line(notnone(n, self.line))
+
+    def eat_whitespace(self) -> bool:
+        return self._eat_regex(self.input.whitespace_re)
+
+    def eat_comments(self) -> bool:
+        return self._eat_regex(self.input.config.comments)
+
+    def eat_eol_comments(self) -> bool:
+        return self._eat_regex(self.input.config.eol_comments)
+
+    def _eat_regex(self, regex: str | re.Pattern | None) -> bool:
+        if not regex:
+            return False
+        res = False
+        while self._matchre_fast(regex):
+            res = True
+        return res
+
+    def _matchre_fast(self, pattern: str | re.Pattern | None) -> bool:
+        if not pattern:
+            return False
+        end = self.input.matchend(cached_re_compile(pattern), self.pos)
+        if end is None or end == self.pos:
+            return False
+        self.pos = end
+        return True
+
+    def _scanre(self, pattern: str | re.Pattern | None) -> re.Match[Any] | None:
+        if not (cre := cached_re_compile(pattern)):
+            return None
+        return self.input.scan(cre, self.pos)
+
+    def __len__(self) -> int:
+        return self.len
+
+    def __repr__(self) -> str:
+        pos = self.pos
+        return f'{typename(self)}({pos=})'
+
+
+class StreamText(Text):
+    """
+    The text of a stream, read as far as the parser gets.
+
+    `source` may be a file-like object, which is read `chunksize` characters
+    at a time, or any iterable of strings, like the lines of a file or a
+    generator. The text takes the whitespace, comments and other settings of
+    the grammar only through `config`.
+    """
+
+    def __init__(
+        self,
+        source: SupportsRead | Iterable[str],
+        *,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        config: ParserConfig | None = None,
+        **settings: Any,
+    ):
+        if chunksize <= 0:
+            raise ValueError('chunksize must be positive')
+        config = ParserConfig.new(config=config, **settings)
+        assert isinstance(config, ParserConfig)
+        self.config = config
+
+        self.chunksize = chunksize
+        self._chunks: Iterator[str]
+        if isinstance(source, str):
+            self._chunks = iter((source,))
+        elif hasattr(source, 'read'):
+            self._chunks = iter(partial(source.read, chunksize), '')
+        else:
+            self._chunks = iter(source)
+
+        # NOTE:
+        #   `buffer` holds the text from `offset` on. The text before
+        #   `released` will not be asked for again, and is dropped from the
+        #   buffer only once there is enough of it to be worth the copy.
+        self.buffer: str = ''
+        self.offset: int = 0
+        self.released: int = 0
+        self.eof: bool = False
+
+        # NOTE: the starts of the lines in the buffer, the first being `firstline`
+        self._starts: list[int] = [0]
+        self._firstline: int = 0
+
+        self.whitespace_re = TextLines.build_whitespace_re(config.whitespace)
+        self.nameguard = (
+            config.nameguard
+            if config.nameguard is not None
+            else bool(self.whitespace_re) or bool(config.namechars)
+        )
+        self._namechar_set = set(config.namechars or '')
+
+        # NOTE: one pass over whitespace and comments, memoized by position
+        self.skip_re = repeated_union_re(
+            self.whitespace_re,
+            config.eol_comments,
+            config.comments,
+        )
+        self.skips: dict[int, int] = {}
+
+        self.textstr = StreamTextView(self)
+
+    def newcursor(self) -> Cursor:
+        return StreamCursor(self)
+
+    @property
+    def source(self) -> str:
+        return str(self.config.source or '')
+
+    @property
+    def ignorecase(self) -> bool:
+        return bool(self.config.ignorecase)
+
+    @property
+    def len(self) -> int:
+        # NOTE: the length of the text read so far
+        return self.offset + len(self.buffer)
+
+    @property
+    def linecount(self) -> int:
+        # NOTE: the lines read so far
+        return self._firstline + len(self._starts)
+
+    def read(self) -> bool:
+        while (chunk := next(self._chunks, None)) is not None:
+            if not isinstance(chunk, str):
+                raise TypeError(f'expected text from the stream, got {typename(chunk)}')
+            if not chunk:
+                continue
+            start = self.len
+            i = chunk.find('\n')
+            while i >= 0:
+                self._starts.append(start + i + 1)
+                i = chunk.find('\n', i + 1)
+            self.buffer += chunk
+            return True
+        self.eof = True
+        return False
+
+    def fill(self, pos: int, n: int = 0) -> None:
+        # NOTE: have at least max(n, chunksize) characters read after pos
+        end = pos + max(n, self.chunksize)
+        while not self.eof and self.len < end:
+            self.read()
+
+    def atend(self, pos: int) -> bool:
+        self.fill(pos, 1)
+        return pos >= self.len
+
+    def index(self, pos: int) -> int:
+        if (i := pos - self.offset) < 0:
+            raise ValueError(f'the text before {self.offset} was released, not {pos}')
+        return i
+
+    def charat(self, pos: int) -> str | None:
+        self.fill(pos, 1)
+        i = self.index(pos)
+        return self.buffer[i] if i < len(self.buffer) else None
+
+    def substr(self, start: int, end: int) -> str:
+        self.fill(start, end - start)
+        return self.buffer[self.index(start) : self.index(end)]
+
+    def scan(self, cre: re.Pattern, pos: int) -> re.Match[str] | None:
+        self.fill(pos)
+        i = self.index(pos)
+        while True:
+            match = cre.match(self.buffer, i)
+            # NOTE: a match that reaches the end of what was read may go further
+            if match is None or match.end() < len(self.buffer) or not self.read():
+                return match
+
+    def matchend(self, cre: re.Pattern, pos: int) -> int | None:
+        if (match := self.scan(cre, pos)) is None:
+            return None
+        return self.offset + match.end()
+
+    def release(self, pos: int) -> None:
+        """Let go of the text before `pos`, which will not be asked for again."""
+        pos = min(pos, self.len)
+        if pos <= self.released:
+            return
+        self.released = pos
+
+        # NOTE:
+        #   The start of the line at pos is kept, so errors on it can still
+        #   be shown whole, unless the line is too long.
+        n = bisect_right(self._starts, pos) - 1
+        start = max(self._starts[n], pos - self.chunksize)
+        if start - self.offset < self.chunksize:
+            return
+
+        self.buffer = self.buffer[start - self.offset :]
+        self.offset = start
+        del self._starts[:n]
+        self._firstline += n
+        self.skips = {p: end for p, end in self.skips.items() if p >= start}
+
+    def lineat(self, pos: int) -> int:
+        pos = max(self.offset, min(self.len, pos))
+        return self._firstline + bisect_right(self._starts, pos) - 1
+
+    def _line_span(self, n: int) -> tuple[int, int]:
+        # NOTE: lines are not read past what was read already
+        n -= self._firstline
+        if n < 0:
+            return self.offset, self.offset
+        n = min(n, len(self._starts) - 1)
+        start = max(self.offset, self._starts[n])
+        if n + 1 < len(self._starts):
+            return start, self._starts[n + 1]
+        return start, self.len
+
+    def lineinfo(self, pos: int) -> LineInfo:
+        self.fill(pos)
+        pos = max(self.offset, min(self.len, pos))
+        line = self.lineat(pos)
+        start, end = self._line_span(line)
+        linestart = self._starts[line - self._firstline]
+        return LineInfo(
+            source=self.source,
+            line=line,
+            col=pos - linestart,
+            start=linestart,
+            end=end,
+            text=self.buffer[start - self.offset : end - self.offset],
+        )
+
+    def get_line(self, n: int) -> str:
+        start, end = self._line_span(n)
+        return self.buffer[start - self.offset : end - self.offset]
+
+
+class StreamTextView:
+    """
+    The text of a `StreamText` where a string is expected.
+
+    Positions are those of the stream. The text that was released, or that
+    was not read yet, reads as empty.
+    """
+
+    __slots__ = ('_input',)
+
+    def __init__(self, input: StreamText):
+        self._input = input
+
+    def __len__(self) -> int:
+        return self._input.len
+
+    @overload
+    def __getitem__(self, key: int) -> str: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> str: ...
+
+    def __getitem__(self, key: int | slice) -> str:
+        input = self._input
+        if isinstance(key, slice):
+            start, stop, step = key.indices(input.len)
+            start = max(start, input.offset) - input.offset
+            stop = max(stop, input.offset) - input.offset
+            return input.buffer[start:stop:step]
+        if (c := input.charat(key)) is None:
+            raise IndexError(f'position {key} is past the end of the text')
+        return c
+
+    def splitlines(self) -> StreamLines:
+        return StreamLines(self._input)
+
+    def __str__(self) -> str:
+        return self._input.buffer
+
+    def __repr__(self) -> str:
+        input = self._input
+        return f'{typename(self)}(offset={input.offset}, len={input.len})'
+
+
+class StreamLines(Sequence[str]):
+    __slots__ = ('_input',)
+
+    def __init__(self, input: StreamText):
+        self._input = input
+
+    def __len__(self) -> int:
+        return self._input.linecount
+
+    @overload
+    def __getitem__(self, key: int) -> str: ...
+
+    @overload
+    def __getitem__(self, key: slice) -> Sequence[str]: ...
+
+    def __getitem__(self, key: int | slice) -> str | Sequence[str]:
+        if isinstance(key, slice):
+            return [self[i] for i in range(*key.indices(len(self)))]
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError(f'line {key} out of range')
+        return self._input.get_line(key).rstrip('\r\n')
+
+    def __iter__(self) -> Iterator[str]:
+        return (self[i] for i in range(len(self)))
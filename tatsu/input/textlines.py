@@ -15,9 +15,9 @@ from ..util import (
     typename,
 )
 from ..util.newlines import take_linebreak_len, take_non_newline_whitespace_len
-from ..util.regextools import cached_re_compile
+from ..util.regextools import cached_re_compile, repeated_union_re
 from .cursor import Cursor, Text, matchbool, matchfloat, matchint, matchname, matchuint
-from .infos import LineIndexInfo, LineInfo, PosLine
+from .infos import LineCache, LineIndexInfo, LineInfo, PosLine
 
 
 DEFAULT_WHITESPACE_RE = re.compile(r'(?m)\s+')
@@ -97,6 +97,21 @@ class TextLinesCursor(Cursor):
         return c
 
     def next_token(self) -> None:
+        # NOTE: where the next token starts is memoized per input position
+        skips = self._input.skips
+        if (end := skips.get(self.pos)) is None:
+            start = self.pos
+            if (skip_re := self._input.skip_re) is not None:
+                match = skip_re.match(self.textstr, start)
+                assert match is not None
+                end = match.end()
+            else:
+                self._eat_separators()
+                end = self.pos
+            skips[start] = end
+        self.pos = end
+
+    def _eat_separators(self) -> None:
         p = -1
         while self.pos != p:
             p = self.pos
@@ -235,14 +250,13 @@ class TextLinesCursor(Cursor):
         pos = notnone(pos, self.pos) or 0
         if not self.input.line_cache:
             return 0
-        return self.input.line_cache[pos].lineno
+        return self.input.line_cache.lineno(pos)
 
     def poscol(self, pos: int | None = None) -> int:
         pos = notnone(pos, self.pos) or 0
         if not self.input.line_cache:
             return 0
-        start = self.input.line_cache[pos].startpos
-        return pos - start
+        return pos - self.input.line_cache.startpos(pos)
 
     def get_line(self, n: int | None = None) -> str:
         return self.input.get_line(notnone(n, self.line))
@@ -318,11 +332,19 @@ class TextLines(Text):
         )
         self._namechar_set = set(config.namechars or '')
 
+        # NOTE: one pass over whitespace and comments, memoized by position
+        self.skip_re = repeated_union_re(
+            self.whitespace_re,
+            config.eol_comments,
+            config.comments,
+        )
+        self.skips: dict[int, int] = {}
+
         # Structural data
         self.textstr = ""
         self.lines: list[str] = []
         self.line_index: list[LineIndexInfo] = []
-        self.line_cache: list[PosLine] = []
+        self.line_cache: LineCache | list[PosLine] = []
 
         self._preprocess()
         self._postprocess()
@@ -4,7 +4,21 @@ from __future__ import annotations
 
 from .grammar_gen import parsermodel_gen as parsergen
 from .ngmodel_gen import modelgen
-from .ngparser_gen import pythongen, pythongen as codegen
+from .ngparser_gen import (
+    pythoncode,
+    pythongen,
+    pythongen as codegen,
+    pythonmodule,
+    pythonparser,
+)
 
 
-__all__ = ['codegen', 'parsergen', 'pythongen', 'modelgen']
+__all__ = [
+    'codegen',
+    'parsergen',
+    'pythoncode',
+    'pythongen',
+    'pythonmodule',
+    'pythonparser',
+    'modelgen',
+]
@@ -37,6 +37,11 @@ IMPORTS: str = """
     """.rstrip()
 
 
+FAST_IMPORTS: str = """
+        from tatsu.exceptions import FailedLookahead, FailedParse, ParseException
+    """.rstrip()
+
+
 def PARSER_BODY(rules_name: str) -> str:
     return f"""\
         config = ParserConfig.new(config, **settings)
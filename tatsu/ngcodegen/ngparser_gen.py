@@ -2,7 +2,11 @@
 # SPDX-License-Identifier: BSD-4-Clause
 from __future__ import annotations
 
+import ast as stdlib_ast
+import builtins
+import io
 import itertools
+import linecache
 import string
 import types
 from collections.abc import Callable, Iterator
@@ -11,26 +15,84 @@ from typing import Any
 from .. import peg as g
 from ..config import ParserConfig
 from ..contexts.ctx import Ctx
+from ..contexts.state import _AT_
 from ..exceptions import CodegenError
 from ..objectmodel import Node
-from ..util import Undefined, regexpp, safe_name, typename
+from ..util import Undefined, hasha, regexpp, safe_name, typename
 from ..util.indent import IndentPrintMixin
 from ..walkers import NodeWalker
-from .boilerplt import FOOTER, HEADER, IMPORTS, PARSER_BODY
+from .boilerplt import FAST_IMPORTS, FOOTER, HEADER, IMPORTS, PARSER_BODY
 
 
 GREEKTOME = "αβδεζηθικλμνξοπρστυφχψωΑΒΓΔΕΖΗΘΙΚΛΜΝΞΟΠΡΣΤΥΦΧΨΩ"
 ANON = '_'
 
+# NOTE: how many of the generated sources are kept in linecache
+LINECACHE_SIZE = 64
+_linecached: dict[str, None] = {}
 
-def pythongen(model: Node, parser_name: str = '') -> str:
+
+def pythongen(model: Node, parser_name: str = '', fast: bool = False) -> str:
     if isinstance(model, g.Model):
         model = model.optimized()
-    generator = PythonParserGenerator(parser_name=parser_name)
+    cls = FastPythonParserGenerator if fast else PythonParserGenerator
+    generator = cls(parser_name=parser_name)
     generator.walk(model)
     return generator.printed_text()
 
 
+def pythoncode(
+    model: g.Grammar,
+    parser_name: str = '',
+    filename: str = '',
+    fast: bool = False,
+) -> types.CodeType:
+    # NOTE: the parser is rendered as text and then compiled, as when it is
+    #   written to a file, so generating it takes just as long
+    source = pythongen(model, parser_name=parser_name, fast=fast)
+    basename = parser_name or model.name
+    filename = filename or f'<tatsu-{basename}-{hasha(source)[:12]}>'
+
+    _linecache(filename, source)
+    return builtins.compile(source, filename, 'exec', dont_inherit=True)
+
+
+def _linecache(filename: str, source: str) -> None:
+    # NOTE: lets tracebacks and debuggers show the generated lines
+    linecache.cache[filename] = (
+        len(source),
+        None,
+        source.splitlines(keepends=True),
+        filename,
+    )
+    _linecached.pop(filename, None)
+    _linecached[filename] = None
+    while len(_linecached) > LINECACHE_SIZE:
+        oldest = next(iter(_linecached))
+        del _linecached[oldest]
+        linecache.cache.pop(oldest, None)
+
+
+def pythonmodule(
+    model: g.Grammar,
+    parser_name: str = '',
+    modulename: str = '',
+    fast: bool = False,
+) -> types.ModuleType:
+    code = pythoncode(model, parser_name=parser_name, fast=fast)
+    basename = parser_name or model.name or 'grammar'
+    module = types.ModuleType(modulename or f'{safe_name(basename)}_parser')
+    module.__file__ = code.co_filename
+    exec(code, module.__dict__)  # noqa: S102
+    return module
+
+
+def pythonparser(model: g.Grammar, parser_name: str = '', fast: bool = False) -> type:
+    basename = parser_name or model.name
+    module = pythonmodule(model, parser_name=parser_name, fast=fast)
+    return getattr(module, f'{basename}Parser')
+
+
 def textinputgen(model: g.Grammar, basename: str) -> str:
     generator = PythonParserGenerator(parser_name=basename)
     generator.gen_buffering(model, basename)
@@ -94,7 +156,7 @@ class PythonParserGenerator(IndentPrintMixin, NodeWalker):
         basename = self.parser_name or grammar.name
         self.print(HEADER)
         self.print()
-        self.print(IMPORTS)
+        self._gen_imports()
         self.print()
 
         self.gen_keywords(grammar)
@@ -103,6 +165,9 @@ class PythonParserGenerator(IndentPrintMixin, NodeWalker):
 
         self.print(FOOTER(name=basename))
 
+    def _gen_imports(self):
+        self.print(IMPORTS)
+
     def walk_Rule(self, rule: g.Rule):
         def param_repr(p):
             if isinstance(p, int | float):
@@ -144,7 +209,10 @@ class PythonParserGenerator(IndentPrintMixin, NodeWalker):
                 \ndef {name}(self, {self.ctx_stack[0]}: Ctx) -> Any:
             """)
         with self.indent():
-            self.print(self.walk(rule.exp))
+            self._gen_rule_body(rule)
+
+    def _gen_rule_body(self, rule: g.Rule):
+        self.print(self.walk(rule.exp))
 
     def walk_BasedRule(self, rule: g.BasedRule):
         self.walk_Rule(rule)
@@ -220,6 +288,14 @@ class PythonParserGenerator(IndentPrintMixin, NodeWalker):
             with self.indent():
                 elements = choice.lookaheadlist
                 self.pfold(f'{var}.expecting', tuple(elements))
+                firsts = [opt.firstchars() for opt in choice.options]
+                if any(f is not None for f in firsts):
+                    self.pfold(
+                        f'{var}.firstchars',
+                        tuple(
+                            None if f is None else ''.join(sorted(f)) for f in firsts
+                        ),
+                    )
                 self.print()
 
                 for opt in choice.options:
@@ -231,6 +307,9 @@ class PythonParserGenerator(IndentPrintMixin, NodeWalker):
             # self.pop_ctx()
             self.prev_choice_number()
 
+    def walk_TokenChoice(self, choice: g.TokenChoice):
+        self.pfold(f'{self.ctx}.tokens', choice._tokens)
+
     def walk_Option(self, _option: g.Option):
         pass  # handled by walk_Choice
 
@@ -492,3 +571,243 @@ class PythonParserGenerator(IndentPrintMixin, NodeWalker):
                 self._gen_anon_block(exp, decor=f'{var}.exp', ctx=ctx, echeck=echeck)
             elif exp:
                 self.walk(exp)
+
+
+# NOTE:
+#   CPython refuses to compile functions with more than 20 nested blocks,
+#   so deeper constructs are moved to helper methods
+MAX_NESTED_BLOCKS = 16
+
+
+class FastPythonParserGenerator(PythonParserGenerator):
+    """
+    Generates parsers in which rules are straight-line code.
+
+    Choices, options, lookaheads, and named elements are expanded in place
+    into explicit pushes, merges and undos of the parse states, instead of
+    context managers and nested functions. The bodies of closures, joins,
+    gathers and skips become helper methods of the rules class, which are
+    passed to the same runtime primitives the legacy parsers use, so the
+    results of both kinds of parser are the same.
+    """
+
+    def __init__(self, parser_name: str = ''):
+        super().__init__(parser_name=parser_name)
+        self._rule_name: str = ''
+        self._helpers: list[tuple[str, g.Model]] = []
+        self._helper_counter: Iterator[int] = itertools.count()
+        self._nesting: int = 0
+
+    def _gen_imports(self):
+        super()._gen_imports()
+        self.print(FAST_IMPORTS)
+
+    def _gen_rule_body(self, rule: g.Rule):
+        self._rule_name = safe_name(rule.name)
+        self._helpers = []
+        self._helper_counter = itertools.count()
+
+        self._gen_function_body(rule.exp)
+        self.print()
+
+        i = 0
+        while i < len(self._helpers):
+            name, exp = self._helpers[i]
+            i += 1
+            with self.indent(levels=-1):
+                self.print(f'def {name}(self, ctx: Ctx) -> Any:')
+            self._gen_function_body(exp)
+            self.print()
+
+    def _gen_function_body(self, exp: g.Model):
+        body = self._printed_apart(exp)
+        if not body.strip():
+            self.print('pass')
+            return
+        if 'states.' in body:
+            self.print('states = ctx.states')
+        self.output_stream.write(body)
+
+    def _printed_apart(self, exp: g.Model, nesting: int = 0) -> str:
+        stream, self.output_stream = self.output_stream, io.StringIO()
+        outer, self._nesting = self._nesting, nesting
+        try:
+            self.walk(exp)
+            return self.output_stream.getvalue()
+        finally:
+            self.output_stream = stream
+            self._nesting = outer
+
+    def _gen_nested(self, exp: g.Model, blocks: int = 1):
+        with self.indent():
+            body = self._printed_apart(exp, nesting=self._nesting + blocks)
+            if body.strip():
+                self.output_stream.write(body)
+            else:
+                self.print('pass')
+
+    def _helper(self, exp: g.Model, kind: str, echeck: bool = True) -> str:
+        if echeck and () in exp.lookaheadlist:
+            raise CodegenError(
+                f'{exp!r} may repeat empty sequence @{exp.line} {exp.lookahead!r}',
+            )
+        name = f'{self._rule_name}__{kind}{next(self._helper_counter)}'
+        self._helpers.append((name, exp))
+        return f'self.{name}'
+
+    def _too_deep(self, exp: g.Model, blocks: int) -> bool:
+        if self._nesting + blocks <= MAX_NESTED_BLOCKS:
+            return False
+        self.print(f'{self._helper(exp, "exp", echeck=False)}(ctx)')
+        return True
+
+    def walk_Group(self, group: g.Group):
+        self.walk(group.exp)
+
+    def walk_SkipGroup(self, skip: g.SkipGroup):
+        if self._too_deep(skip, 1):
+            return
+        self.print('states.push()')
+        self.print('try:')
+        self._gen_nested(skip.exp)
+        self.print('''
+            except FailedParse:
+                states.undo()
+                raise
+            else:
+                states.pop()
+        ''')
+
+    def walk_Choice(self, choice: g.Choice):
+        if self._too_deep(choice, 2):
+            return
+
+        c = ''
+        firsts = [opt.firstchars() for opt in choice.options]
+        if any(f is not None for f in firsts):
+            c = f'c{self.blockn}'
+            self.print(f'{c} = ctx.nextchar()')
+
+        # NOTE: the elements as the legacy parsers print them in `expecting()`
+        expected = ' '.join(
+            stdlib_ast.literal_eval(repr(e)) for e in choice.lookaheadlist
+        )
+        message = f'Expected one of: {expected}' if expected else 'Failed'
+
+        self.print('while True:')
+        with self.indent():
+            for opt, first in zip(choice.options, firsts, strict=True):
+                exp: g.Model = opt.exp if isinstance(opt, g.Option) else opt
+                if c and first is not None:
+                    chars = ''.join(sorted(first))
+                    self.print(f'if {c} is None or {c} in {chars!r}:')
+                    with self.indent():
+                        self._gen_option(exp)
+                else:
+                    self._gen_option(exp)
+            self.print(f'raise ctx.newexcept({message!r})')
+
+    def _gen_option(self, exp: g.Model):
+        self.print('states.push()')
+        self.print('try:')
+        self._gen_nested(exp, blocks=2)
+        self.print('''
+            except FailedParse:
+                if states.undo().cutseen:
+                    raise
+            else:
+                states.merge()
+                break
+        ''')
+
+    def walk_Optional(self, optional: g.Optional):
+        if self._too_deep(optional, 1):
+            return
+        self.print('states.push()')
+        self.print('try:')
+        self._gen_nested(optional.exp)
+        self.print('''
+            except FailedParse:
+                if states.undo().cutseen:
+                    raise
+            else:
+                states.merge()
+        ''')
+
+    def walk_Lookahead(self, lookahead: g.Lookahead):
+        if self._too_deep(lookahead, 1):
+            return
+        self.print('states.push()')
+        self.print('try:')
+        self._gen_nested(lookahead.exp)
+        self._gen_finally_undo()
+
+    def _gen_finally_undo(self):
+        self.print('finally:')
+        with self.indent():
+            self.print('states.undo()')
+
+    def walk_NegativeLookahead(self, lookahead: g.NegativeLookahead):
+        if self._too_deep(lookahead, 2):
+            return
+        self.print('states.push()')
+        self.print('try:')
+        with self.indent():
+            self.print('try:')
+            self._gen_nested(lookahead.exp, blocks=2)
+            self._gen_finally_undo()
+        self.print('''
+            except ParseException:
+                pass
+            else:
+                raise ctx.newexcept('', excls=FailedLookahead)
+        ''')
+
+    def walk_Closure(self, closure: g.Closure):
+        self.print(f'ctx.closure({self._helper(closure.exp, "cl")})')
+
+    def walk_PositiveClosure(self, closure: g.PositiveClosure):
+        self.print(f'ctx.positive_closure({self._helper(closure.exp, "cl")})')
+
+    def _gen_with_sep(self, method: str, exp: g.Model, sep: g.Model):
+        # NOTE: the separator first, as in the legacy parsers
+        sepfunc = self._helper(sep, 'sep')
+        expfunc = self._helper(exp, 'cl')
+        self.print(f'ctx.{method}({expfunc}, {sepfunc})')
+
+    def walk_Join(self, join: g.Join):
+        self._gen_with_sep('join', join.exp, join.sep)
+
+    def walk_PositiveJoin(self, join: g.PositiveJoin):
+        self._gen_with_sep('positive_join', join.exp, join.sep)
+
+    def walk_LeftJoin(self, join: g.LeftJoin):
+        self._gen_with_sep('left_join', join.exp, join.sep)
+
+    def walk_RightJoin(self, join: g.RightJoin):
+        self._gen_with_sep('right_join', join.exp, join.sep)
+
+    def walk_Gather(self, gather: g.Gather):
+        self._gen_with_sep('gather', gather.exp, gather.sep)
+
+    def walk_PositiveGather(self, gather: g.PositiveGather):
+        self._gen_with_sep('positive_gather', gather.exp, gather.sep)
+
+    def walk_SkipTo(self, skipto: g.SkipTo):
+        self.print(f'ctx.skip_to({self._helper(skipto.exp, "sk", echeck=False)})')
+
+    def walk_Named(self, named: g.Named):
+        self.walk(named.exp)
+        self.print(f'states.state.nameset({named.name!r})')
+
+    def walk_NamedList(self, named: g.Named):
+        self.walk(named.exp)
+        self.print(f'states.state.nameadd({named.name!r})')
+
+    def walk_Override(self, o: g.Override):
+        self.walk(o.exp)
+        self.print(f'states.state.nameset({_AT_!r})')
+
+    def walk_OverrideList(self, override: g.OverrideList):
+        self.walk(override.exp)
+        self.print(f'states.state.nameadd({_AT_!r})')
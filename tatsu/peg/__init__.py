@@ -35,6 +35,7 @@ from .basic import (
 from .choice import (
     Choice,
     Option,
+    TokenChoice,
 )
 from .closure import (
     Closure,
@@ -118,6 +119,7 @@ __all__ = [
     'SkipTo',
     'GrammarSemantics',
     'Token',
+    'TokenChoice',
     'Void',
     'model_classes',
     '_ref',
@@ -4,23 +4,36 @@ from __future__ import annotations
 
 import weakref
 from collections import defaultdict
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from copy import copy
 from dataclasses import field
 from functools import cached_property
 from pathlib import Path
 from types import SimpleNamespace
-from typing import Any, Self
+from typing import TYPE_CHECKING, Any, Self
 
 from ..config import ParserConfig
-from ..contexts import AST, CanParse, Ctx, Func, ParseContext, RuleInfo
+from ..contexts import (
+    AST,
+    CanParse,
+    Ctx,
+    Func,
+    ParseContext,
+    RuleInfo,
+)
 from ..exceptions import GrammarError
 from ..input import Text
 from ..objectmodel import ModelBuilderSemantics, Node, nodedataclass
 from ..util import indent, trim, typename
 from ..util.strtools import slicetowidth
 from ..util.undefined import UndefinedType
-from .math import ffset, kdot
+from .math import NOCHARS, fchars, ffset, kdot
+
+
+if TYPE_CHECKING:
+    from ..contexts.session import ParseSession
+    from .firstfollow import FirstFollow
+    from .optimizer import Optimization
 
 
 PEP8_LLEN = 72
@@ -105,6 +118,8 @@ class Model(Node, CanParse):
         ctx.define(keys_single, keys_list)
 
     def lookahead(self, k: int = 1) -> ffset:
+        if k != 1:
+            return kdot(self.firstset(k), self.followset(k), k)
         if not getattr(self, '_lookahead', None):
             self._lookahead = kdot(self.firstset(k), self.followset(k), k)
         return self._lookahead
@@ -122,15 +137,41 @@ class Model(Node, CanParse):
         return f'expecting one of {' '.join(repr(s) for s in self.expecting)}'
 
     def firstset(self, k: int = 1) -> ffset:
+        if (ff := self._firstfollow(k)) is not None:
+            return ff.firstset(self)
+        if k != 1:
+            return self._first(k, defaultdict(set))
         if not getattr(self, '_firstset', None):
             self._firstset = self._first(k, defaultdict(set))
         return self._firstset
 
-    def followset(self, _k: int = 1) -> ffset:
+    def followset(self, k: int = 1) -> ffset:
+        if k != 1:
+            ff = self._firstfollow(k)
+            return ff.followset(self) if ff is not None else set()
         if not getattr(self, '_follow_set', None):
             self._follow_set = set()
         return self._follow_set
 
+    def _firstfollow(self, k: int) -> FirstFollow | None:
+        grammar = self._grammar_ref() if self._grammar_ref is not None else None
+        if not isinstance(grammar, Grammar):
+            return None
+        return grammar.firstfollow(k)
+
+    def firstchars(self) -> frozenset[str] | None:
+        # NOTE: None when any character may start a match
+        fc = self._firstchars(False, frozenset())
+        if fc is None or fc[1]:
+            return None
+        return fc[0]
+
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        # NOTE: skipped tells if whitespace was already skipped
+        _ = skipped
+        _ = seen
+        return None
+
     def missing_rules(self, rulenames: set[str]) -> set[str]:
         assert rulenames
         return set()
@@ -205,6 +246,11 @@ class Void(Leaf):
     def _parse(self, ctx: Ctx) -> Any:
         return ctx.void()
 
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        _ = skipped
+        _ = seen
+        return NOCHARS
+
     def _pretty(self, lean=False):
         _ = lean
         return '()'
@@ -255,6 +301,9 @@ class Box(Model):
     def _follow(self, k, fl, a):
         return self.exp._follow(k, fl, a)
 
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        return self.exp._firstchars(skipped, seen)
+
     def nodecount(self) -> int:
         return 1 + self.exp.nodecount()
 
@@ -276,7 +325,10 @@ class Box(Model):
 class Synth(Box):
     """A synthetic placeholder for an unresolved rule."""
 
-    pass
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        _ = skipped
+        _ = seen
+        return None
 
 
 @nodedataclass
@@ -317,6 +369,8 @@ class Rule(NamedBox):
         self.is_name = bool(self.is_name) or 'name' in self.decorators
         # pyrefly: ignore [unnecessary-type-conversion]
         self.is_name = bool(self.is_name) or 'isname' in self.decorators
+        # pyrefly: ignore [unnecessary-type-conversion]
+        self.no_memo = bool(self.no_memo) or 'nomemo' in self.decorators
 
         if not self.kwparams:
             self.kwparams = {}
@@ -342,12 +396,20 @@ class Rule(NamedBox):
         return ctx.call(ri)
 
     def _first(self, k, f) -> ffset:
-        self._firstset = self.exp._first(k, f) | f[self.name]
-        return self._firstset
+        return self.exp._first(k, f) | f[self.name]
 
     def _follow(self, k, fl, a):
-        _ = a
-        return self.exp._follow(k, fl, fl[self.name])
+        # NOTE: a is the part of fl[self.name] not yet passed on to the callees
+        return self.exp._follow(k, fl, a)
+
+    def followset(self, k: int = 1) -> ffset:
+        if k != 1 and (ff := self._firstfollow(k)) is not None:
+            return ff.follow[self.name]
+        return super().followset(k)
+
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        # NOTE: rules other than token rules skip whitespace on entry
+        return self.exp._firstchars(skipped or not self.is_tokn, seen)
 
     @cached_property
     def _nullable(self) -> bool:
@@ -468,6 +530,8 @@ class Grammar(Model):
     keywords: tuple[str, ...] = field(default_factory=tuple)
     rules: tuple[Rule, ...] = field(default_factory=tuple)
     _optimized: Grammar | None = None
+    _optimizations: tuple[Optimization, ...] = ()
+    _basis: Grammar | None = None
 
     def __init__(
         self,
@@ -509,10 +573,8 @@ class Grammar(Model):
         self.initialize()
 
     def initialize(self) -> None:
-        rulemap = {rule.name: rule for rule in self.rules}
-        self._rule = SimpleNamespace(**rulemap)
-        self._rulemap = self._rule.__dict__
-        self.link(self)
+        self._firstfollow_k: dict[int, FirstFollow] = {}
+        self._link_rules()
         self._calc_lookahead_sets()
         self._mark_left_recursion()
 
@@ -521,6 +583,62 @@ class Grammar(Model):
             msg = ' '.join(missing)
             raise GrammarError('unknown rules, no parser generated: ' + msg)
 
+    def _link_rules(self) -> None:
+        rulemap = {rule.name: rule for rule in self.rules}
+        self._rule = SimpleNamespace(**rulemap)
+        self._rulemap = self._rule.__dict__
+        self.link(self)
+
+    def analysis(self) -> dict[str, tuple[ffset, ffset]]:
+        return {rule.name: (rule._firstset, rule._follow_set) for rule in self.rules}
+
+    def relink(self, analysis: dict[str, tuple[ffset, ffset]]) -> None:
+        """Link a grammar restored from storage with its previous `analysis()`."""
+        from .firstfollow import FirstFollow
+
+        self._link_rules()
+        for rule in self.rules:
+            rule._firstset, rule._follow_set = analysis[rule.name]
+        self._firstfollow_k = {
+            1: FirstFollow(
+                self.rules,
+                first={name: first for name, (first, _) in analysis.items()},
+                follow={name: follow for name, (_, follow) in analysis.items()},
+            ),
+        }
+
+    def firstfollow(self, k: int = 1) -> FirstFollow:
+        """The FIRST(k) and FOLLOW(k) sets of the rules, computed once per `k`."""
+        from .firstfollow import FirstFollow
+
+        analyses = getattr(self, '_firstfollow_k', None)
+        if analyses is None:
+            analyses = self._firstfollow_k = {}
+        if (ff := analyses.get(k)) is None:
+            ff = FirstFollow(self.rules, k)
+            # NOTE: follow sets ask for the first sets of nodes through here
+            analyses[k] = ff
+            ff.calc()
+        return ff
+
+    @property
+    def optimizations(self) -> tuple[Optimization, ...]:
+        """What `optimized()` changed in this grammar."""
+        return self.optimized()._optimizations
+
+    def with_semantics(self, semantics: Any) -> Grammar:
+        """
+        A shallow copy of this grammar with its own configuration and
+        `semantics`. The rules and the optimized grammar are shared.
+        """
+        optimized = self.optimized()
+        new = copy(self)
+        new._config = self.config.override(semantics=semantics)
+        new._optimized = optimized
+        # NOTE: the rules are linked to this grammar, so keep it alive
+        new._basis = self
+        return new
+
     def configure(self, config: ParserConfig | None = None, **settings: Any):
         self._config.merge_config(config)
         self._config.merge(**settings)
@@ -614,35 +732,15 @@ class Grammar(Model):
         return used
 
     def _calc_lookahead_sets(self, k: int = 1):
-        self._calc_first_sets(k=k)
-        self._calc_follow_sets(k=k)
-        for rule in self.rules:
-            if rule.lookaheadlist is None:
-                raise GrammarError(f'Impossible lookahead in rule {rule.name}')
-
-    def _calc_first_sets(self, k: int = 1):
-        f: dict[str, ffset] = defaultdict(set)
-        f1 = None
-        while f1 != f:
-            f1 = copy(f)
-            for rule in self.rules:
-                f[rule.name] |= rule._first(k, f)
+        ff = self.firstfollow(k)
 
         # cache results
         for rule in self.rules:
-            rule._firstset = f[rule.name]
-
-    def _calc_follow_sets(self, k: int = 1):
-        fl: dict[str, ffset] = defaultdict(set)
-        fl1 = None
-        while fl1 != fl:
-            fl1 = copy(fl)
-            for rule in self.rules:
-                rule._follow(k, fl, set())
-
-        # cache results
+            rule._firstset = ff.first[rule.name]
+            rule._follow_set = ff.follow[rule.name]
         for rule in self.rules:
-            rule._follow_set = fl[rule.name]
+            if rule.lookaheadlist is None:
+                raise GrammarError(f'Impossible lookahead in rule {rule.name}')
 
     def parse(
         self,
@@ -654,10 +752,44 @@ class Grammar(Model):
         asmodel: bool = False,
         **settings: Any,
     ) -> Any:
-        self = self.optimized()  # noqa: PLW0642
-        return self._do_parse(
-            text, start=start, config=config, asmodel=asmodel, **settings
-        )
+        # NOTE: the configuration is this grammar's, which may be a copy
+        config = self.new_parse_config(start=start, config=config, **settings)
+        grammar = self.optimized()
+        return grammar._do_parse(text, config=config, asmodel=asmodel)
+
+    def parse_stream(
+        self,
+        text: Any,
+        /,
+        *,
+        start: str | None = None,
+        config: Any = None,
+        asmodel: bool = False,
+        **settings: Any,
+    ) -> Iterator[Any]:
+        config = self.new_parse_config(start=start, config=config, **settings)
+        grammar = self.optimized()
+        ctx = grammar.newctx(asmodel=asmodel)
+        assert isinstance(ctx, ParseContext)
+        return ctx.parse_stream(text, config=config)
+
+    def session(
+        self,
+        text: str,
+        /,
+        *,
+        start: str | None = None,
+        config: Any = None,
+        asmodel: bool = False,
+        **settings: Any,
+    ) -> ParseSession:
+        from ..contexts.session import ParseSession
+
+        config = self.new_parse_config(start=start, config=config, **settings)
+        grammar = self.optimized()
+        ctx = grammar.newctx(asmodel=asmodel)
+        assert isinstance(ctx, ParseContext)
+        return ParseSession(ctx, text, config=config)
 
     def _do_parse(
         self,
@@ -747,12 +879,15 @@ class Grammar(Model):
         return f"{directives}{keywords}{rules}"
 
     def optimized(self) -> Grammar:
+        from .optimizer import optimize
+
         if isinstance(self._optimized, Grammar):
             return self._optimized
 
         optrules: tuple[Rule, ...] = tuple(r.optimized() for r in self.rules)
+        start = self.config.effective_start_rule_name()
         new = copy(self)
-        new.rules = optrules
+        new.rules, new._optimizations = optimize(optrules, start=start)
         new.initialize()
 
         self._optimized = new  # NOTE cache optimized grammar
@@ -6,9 +6,10 @@ from functools import cached_property
 from typing import Any
 
 from ..contexts import Ctx
+from ..contexts.constants import CompiledConstant, compile_constant
 from ..objectmodel import nodedataclass
-from .base import Leaf
-from .math import ffset
+from .base import Grammar, Leaf
+from .math import NOCHARS, fchars, ffset
 
 
 EOF_SYM = '$'
@@ -44,6 +45,11 @@ class Fail(Leaf):
 class Comment(Leaf):
     comment: str = ''
 
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        _ = skipped
+        _ = seen
+        return NOCHARS
+
     def _pretty(self, lean: bool = False):
         _ = lean
         return f'(* {self.comment} *)'
@@ -109,6 +115,13 @@ class Token(Leaf):
         _ = f
         return {(self.token,)}
 
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        _ = skipped
+        _ = seen
+        if not self.token:
+            return None
+        return frozenset(self.token[0]), False
+
     def _pretty(self, lean=False):
         _ = lean
         return repr(self.token)
@@ -122,14 +135,29 @@ class Constant(Leaf):
         super().__post_init__()
         self.literal = self.literal or self.ast
 
+    def link(self, grammar: Grammar) -> None:
+        super().link(grammar)
+        _ = self._compiled
+
+    @cached_property
+    def _compiled(self) -> CompiledConstant:
+        return compile_constant(self.literal)
+
     def _parse(self, ctx: Ctx) -> Any:
-        return ctx.constant(self.literal)
+        if not isinstance(self.literal, str):
+            return ctx.constant(self.literal)
+        return ctx.constant(self._compiled)
 
     def _first(self, k: int, f: dict[str, ffset]) -> ffset:
         _ = k
         _ = f
         return {()}
 
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        _ = skipped
+        _ = seen
+        return NOCHARS
+
     def _pretty(self, lean=False):
         _ = lean
         return f'`{self.literal!s}`'
@@ -150,7 +178,7 @@ class Alert(Constant):
             self.level = len(self.ast.level)
 
     def _parse(self, ctx: Ctx) -> Any:
-        return ctx.alert(message=self.literal, level=self.level)
+        return ctx.alert(message=self._compiled, level=self.level)
 
     def _pretty(self, lean=False):
         _ = lean
@@ -171,6 +199,11 @@ class Cut(Leaf):
         _ = f
         return {()}
 
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        _ = skipped
+        _ = seen
+        return NOCHARS
+
     def _pretty(self, lean=False):
         _ = lean
         return '~'
@@ -10,7 +10,12 @@ from ..contexts import Ctx
 from ..exceptions import FailedParse
 from ..objectmodel import nodedataclass
 from .base import PEP8_LLEN, Box, Model
-from .math import ffset
+from .basic import Token
+from .math import fchars, ffset
+from .pattern import Pattern, fused_pattern
+
+
+type Alternatives = tuple[tuple[Model, Model], ...]
 
 
 @nodedataclass
@@ -35,10 +40,13 @@ class Choice(Model):
 
     def _parse(self, ctx: Ctx) -> Any:
         # ctx.expecting(*self.expecting)
-        for o in self.options:
+        alternatives = self._alternatives
+        if self._dispatch is not None and (c := ctx.nextchar()) is not None:
+            table, default = self._dispatch
+            alternatives = table.get(c, default)
+        for o, exp in alternatives:
             ctx.states.push()
             o._add_defined(ctx)
-            exp = o.exp if isinstance(o, Option) else o
             try:
                 value = exp._parse(ctx)
                 ctx.states.merge()
@@ -48,6 +56,27 @@ class Choice(Model):
                     raise
         raise ctx.newexcept(self.expectingstr)
 
+    @cached_property
+    def _alternatives(self) -> Alternatives:
+        return tuple((o, o.exp if isinstance(o, Option) else o) for o in self.options)
+
+    @cached_property
+    def _dispatch(self) -> tuple[dict[str, Alternatives], Alternatives] | None:
+        # NOTE:
+        #   Maps the character the next token starts with to the options
+        #   that may match there, in their original order. Options with
+        #   unknown first characters are always tried.
+        firsts = [o.firstchars() for o in self.options]
+        if all(f is None for f in firsts):
+            return None
+        pairs = list(zip(self._alternatives, firsts, strict=True))
+        table = {
+            c: tuple(a for a, f in pairs if f is None or c in f)
+            for c in set().union(*(f for f in firsts if f is not None))
+        }
+        default = tuple(a for a, f in pairs if f is None)
+        return table, default
+
     @cached_property
     def defines_single(self) -> list[str]:
         return list(set().union(*(o.defines_single for o in self.options)))
@@ -66,7 +95,6 @@ class Choice(Model):
         result = set()
         for o in self.options:
             result |= o._first(k, f)
-        self._firstset = result
         return result
 
     def _follow(self, k, fl, a):
@@ -74,6 +102,16 @@ class Choice(Model):
             o._follow(k, fl, a)
         return a
 
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        chars: set[str] = set()
+        nullable = False
+        for o in self.options:
+            if (fc := o._firstchars(skipped, seen)) is None:
+                return None
+            chars |= fc[0]
+            nullable = nullable or fc[1]
+        return frozenset(chars), nullable
+
     def nodecount(self) -> int:
         return 1 + sum(o.nodecount() for o in self.options)
 
@@ -99,4 +137,22 @@ class Choice(Model):
             assert isinstance(o, Model)
         if len(opt) == 1:
             return opt[0]
+        if all(isinstance(o, Token) and o.token for o in opt):
+            return TokenChoice(options=opt)
+        if all(isinstance(o, Pattern) for o in opt):
+            patterns = [o.pattern for o in opt if isinstance(o, Pattern)]
+            if (pattern := fused_pattern(patterns)) is not None:
+                return Pattern(pattern=pattern)
         return Choice(options=opt)
+
+
+@nodedataclass
+class TokenChoice(Choice):
+    # NOTE: a choice among plain tokens, as produced by Choice.optimized()
+
+    @cached_property
+    def _tokens(self) -> tuple[str, ...]:
+        return tuple(o.token for o in self.options if isinstance(o, Token))
+
+    def _parse(self, ctx: Ctx) -> Any:
+        return ctx.tokens(*self._tokens)
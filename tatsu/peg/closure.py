@@ -13,7 +13,7 @@ from ..contexts import Ctx
 from ..objectmodel import nodedataclass
 from ..util import indent
 from .base import Box, Func, Model
-from .math import ffset, kdot
+from .math import NOCHARS, fchars, ffset, kdot
 
 
 @nodedataclass
@@ -28,6 +28,11 @@ class Closure(Box):
             result = kdot(result, efirst, k)
         return {()} | result
 
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        if (fc := self.exp._firstchars(skipped, seen)) is None:
+            return None
+        return fc[0], True
+
     def _pretty(self, lean=False):
         sexp = str(self.exp._pretty(lean=lean))
         if len(sexp.splitlines()) <= 1:
@@ -49,6 +54,9 @@ class PositiveClosure(Closure):
     def _first(self, k, f) -> ffset:
         return self.exp._first(k, f)
 
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        return self.exp._firstchars(skipped, seen)
+
     def _pretty(self, lean=False):
         return super()._pretty(lean=lean) + '+'
 
@@ -73,6 +81,17 @@ class Join(Box):
     def _do_parse(self, ctx: Ctx, exp: Func, sep: Func) -> Any:
         return ctx.join(exp, sep)
 
+    def missing_rules(self, rulenames: set[str]) -> set[str]:
+        return super().missing_rules(rulenames) | self.sep.missing_rules(rulenames)
+
+    def _used_rule_names(self):
+        return super()._used_rule_names() | self.sep._used_rule_names()
+
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        if (fc := self.exp._firstchars(skipped, seen)) is None:
+            return None
+        return fc[0], True
+
     def _pretty(self, lean=False):
         ssep = self.sep._pretty(lean=lean)
         sexp = str(self.exp._pretty(lean=lean))
@@ -90,6 +109,9 @@ class PositiveJoin(Join):
     def _first(self, k, f) -> ffset:
         return self.exp._first(k, f)
 
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        return self.exp._firstchars(skipped, seen)
+
     def _do_parse(self, ctx, exp, sep):
         return ctx.positive_join(exp, sep)
 
@@ -112,6 +134,9 @@ class PositiveGather(Gather):
     def _first(self, k, f) -> ffset:
         return self.exp._first(k, f)
 
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        return self.exp._firstchars(skipped, seen)
+
     def _do_parse(self, ctx, exp, sep):
         return ctx.positive_gather(exp, sep)
 
@@ -137,6 +162,11 @@ class EmptyClosure(Model):
         _ = f
         return {()}
 
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        _ = skipped
+        _ = seen
+        return NOCHARS
+
     def _pretty(self, lean=False):
         _ = lean
         return '{}'
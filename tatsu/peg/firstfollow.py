@@ -0,0 +1,171 @@
+# Copyright (c) 2017-2026 Juancarlo Añez (apalala@gmail.com)
+# SPDX-License-Identifier: BSD-4-Clause
+"""
+FIRST(k) and FOLLOW(k) sets of the rules of a grammar.
+
+The sets are computed with worklists driven by the rule call graph. A rule is
+evaluated again only when the set of a rule it depends on has grown, and the
+first evaluations follow the call graph, so rules that are not recursive are
+evaluated once. The sets of the nodes within rules are computed on demand and
+kept for each node, their follow sets in a single pass over all the rules.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict, deque
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING
+
+from .math import ffset, kdot
+
+
+if TYPE_CHECKING:
+    from .base import Model, Rule
+
+
+__all__ = ['FirstFollow']
+
+
+class FirstFollow:
+    def __init__(
+        self,
+        rules: Iterable[Rule],
+        k: int = 1,
+        *,
+        first: Mapping[str, ffset] | None = None,
+        follow: Mapping[str, ffset] | None = None,
+    ):
+        if k < 1:
+            raise ValueError(f'lookahead must be at least 1, not {k}')
+        self.k = k
+        self.rules: tuple[Rule, ...] = tuple(rules)
+        self.first: dict[str, ffset] = defaultdict(set)
+        self.follow: dict[str, ffset] = defaultdict(set)
+        self._nodesets: dict[int, ffset] = {}
+        self._nodefollow: dict[int, ffset] | None = None
+        self._calls: dict[str, set[str]] = {
+            rule.name: rule._used_rule_names() for rule in self.rules
+        }
+        if first is not None:
+            self.first.update(first)
+        if follow is not None:
+            self.follow.update(follow)
+
+    def calc(self) -> FirstFollow:
+        self.calc_first_sets()
+        self.calc_follow_sets()
+        return self
+
+    def firstset(self, node: Model) -> ffset:
+        # NOTE: valid only once the sets of the rules are computed
+        key = id(node)
+        if (result := self._nodesets.get(key)) is None:
+            result = node._first(self.k, self.first)
+            self._nodesets[key] = result
+        return result
+
+    def followset(self, node: Model) -> ffset:
+        # NOTE: valid only once the sets of the rules are computed
+        if self._nodefollow is None:
+            self._nodefollow = {}
+            for rule in self.rules:
+                self._node_follow(rule.exp, self.follow[rule.name])
+        return self._nodefollow.get(id(node), set())
+
+    def _node_follow(self, node: Model, a: ffset) -> None:
+        # NOTE: the same as what _follow() passes on to the nodes
+        from .base import Box
+        from .choice import Choice
+        from .syntax import Sequence
+
+        assert self._nodefollow is not None
+        self._nodefollow.setdefault(id(node), set()).update(a)
+        match node:
+            case Sequence():
+                fs = a
+                for x in reversed(node.sequence):
+                    self._node_follow(x, fs)
+                    fs = kdot(self.firstset(x), fs, self.k)
+            case Choice():
+                for o in node.options:
+                    self._node_follow(o, a)
+            case Box():
+                self._node_follow(node.exp, a)
+
+    def calc_first_sets(self) -> None:
+        callers: dict[str, set[str]] = defaultdict(set)
+        for name, calls in self._calls.items():
+            for callee in calls:
+                callers[callee].add(name)
+
+        rulemap = {rule.name: rule for rule in self.rules}
+        order = self._callees_first()
+        work = deque(order)
+        queued = set(order)
+        while work:
+            name = work.popleft()
+            queued.discard(name)
+            first = self.first[name]
+            size = len(first)
+            first |= rulemap[name]._first(self.k, self.first)
+            if len(first) == size:
+                continue
+            for caller in callers[name]:
+                if caller not in queued:
+                    queued.add(caller)
+                    work.append(caller)
+
+        self._nodesets.clear()
+
+    def calc_follow_sets(self) -> None:
+        # NOTE:
+        #   What a rule adds to the follow sets of its callees is the union
+        #   of what each prefix in its own follow set adds, so only the
+        #   prefixes added since the rule was last evaluated are passed on.
+        rulemap = {rule.name: rule for rule in self.rules}
+        passed: dict[str, ffset] = {}
+        order = self._callees_first()[::-1]
+        work = deque(order)
+        queued = set(order)
+        while work:
+            name = work.popleft()
+            queued.discard(name)
+            follow = self.follow[name]
+            if name not in passed:
+                delta = set(follow)
+                passed[name] = set(follow)
+            elif delta := follow - passed[name]:
+                passed[name] |= delta
+            else:
+                continue
+
+            calls = [c for c in self._calls[name] if c in rulemap]
+            sizes = [len(self.follow[c]) for c in calls]
+            rulemap[name]._follow(self.k, self.follow, delta)
+            for callee, size in zip(calls, sizes, strict=True):
+                if len(self.follow[callee]) != size and callee not in queued:
+                    queued.add(callee)
+                    work.append(callee)
+
+        self._nodefollow = None
+
+    def _callees_first(self) -> list[str]:
+        # NOTE: a depth-first postorder of the call graph, without recursion
+        order: list[str] = []
+        visited: set[str] = set()
+        for rule in self.rules:
+            if rule.name in visited:
+                continue
+            visited.add(rule.name)
+            stack = [(rule.name, iter(sorted(self._calls[rule.name])))]
+            while stack:
+                name, pending = stack[-1]
+                for callee in pending:
+                    if callee not in visited and callee in self._calls:
+                        visited.add(callee)
+                        stack.append((callee, iter(sorted(self._calls[callee]))))
+                        break
+                else:
+                    stack.pop()
+                    order.append(name)
+        return order
@@ -5,6 +5,14 @@ from __future__ import annotations
 
 type ffset = set[tuple[str, ...]]
 
+# NOTE:
+#   The characters a match may start with, and whether it may match
+#   without consuming input, or None when that cannot be known.
+type fchars = tuple[frozenset[str], bool] | None
+
+NOCHARS: fchars = (frozenset(), True)
+MAXFIRSTCHARS = 256
+
 
 def ref(name: str) -> tuple[str]:
     return (_ref(name),)
@@ -15,8 +23,27 @@ def kdot(x: ffset, y: ffset, k: int) -> ffset:
         return {a[:k] for a in x}
     elif not x:
         return {b[:k] for b in y}
-    else:
-        return {(a + b)[:k] for a in x for b in y}
+
+    # NOTE:
+    #   Prefixes that are already k long are not extended, and the shorter
+    #   ones are extended only with the distinct prefixes of y they may use.
+    #   No set of prefixes holds one longer than k.
+    result: ffset = {a for a in x if len(a) >= k}
+    if len(result) == len(x):
+        return result
+    cuts: dict[int, ffset] = {}
+    for a in x:
+        n = len(a)
+        if n >= k:
+            continue
+        if n == 0:
+            tails = y
+        elif n in cuts:
+            tails = cuts[n]
+        else:
+            tails = cuts[n] = {b[: k - n] for b in y}
+        result.update(a + b for b in tails)
+    return result
 
 
 class _ref(str):
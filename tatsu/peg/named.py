@@ -27,7 +27,7 @@ class Named(NamedBox):
 
     def _parse(self, ctx: Ctx) -> Any:
         value = self.exp._parse(ctx)
-        ctx.ast[self.name] = value
+        ctx.state.ownast()[self.name] = value
         return value
 
     @cached_property
@@ -44,7 +44,7 @@ class Named(NamedBox):
 class NamedList(Named):
     def _parse(self, ctx: Ctx) -> Any:
         value = self.exp._parse(ctx)
-        ctx.ast._setlist(self.name, value)
+        ctx.state.ownast()._setlist(self.name, value)
         return value
 
     @cached_property
@@ -61,7 +61,7 @@ class NamedList(Named):
 class Override(Box):
     def _parse(self, ctx: Ctx) -> Any:
         value = self.exp._parse(ctx)
-        ctx.ast[_AT_] = value
+        ctx.state.ownast()[_AT_] = value
         return {_AT_: value}
 
     def _pretty(self, lean=False):
@@ -74,9 +74,10 @@ class Override(Box):
 class OverrideList(Box):
     def _parse(self, ctx: Ctx) -> Any:
         value = self.exp._parse(ctx)
-        if _AT_ not in ctx.ast:
+        ast = ctx.state.ownast()
+        if _AT_ not in ast:
             value = [value]
-        ctx.ast[_AT_] = value
+        ast[_AT_] = value
         return {_AT_: value}
 
     def _pretty(self, lean=False):
@@ -0,0 +1,445 @@
+# Copyright (c) 2017-2026 Juancarlo Añez (apalala@gmail.com)
+# SPDX-License-Identifier: BSD-4-Clause
+"""
+Optimizations over the rules of a whole grammar.
+
+`Grammar.optimized()` applies the `optimized()` of each rule, and then these
+passes, in order:
+
+* folding: nested sequences are flattened, comments are dropped, and the
+  options of a choice that may never succeed or that may never be reached
+  are removed
+* inlining: calls to small rules that match a single terminal parse the
+  terminal in place when there are no semantics
+* factoring: options of a choice that start with the same elements share
+  them, so ``a b | a c`` becomes ``a (b | c)``. The options of the new
+  choice define their names again, before those already set, so a prefix
+  that names its elements is shared only if the rest of the options name none
+
+Each pass keeps the results and the names of a parse unchanged. Every change
+made is reported as an `Optimization`, and so are the rules unreachable from
+the start rule. Those are kept, because a parse may start at any rule, and
+the generated parsers are generated from the optimized grammar.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Collection, Iterable, Iterator
+from copy import copy
+from functools import cache, cached_property
+from typing import Any, NamedTuple
+
+from .base import Box, Model, Rule, Void
+from .basic import Comment, Constant, Cut, Dot, Fail, Token
+from .choice import Choice
+from .closure import Join
+from .pattern import Pattern
+from .rulelike import BasedRule, RuleInclude
+from .syntax import Call, Group, NegativeLookahead, Optional, Sequence
+
+
+__all__ = ['Optimization', 'optimize']
+
+
+# NOTE: the largest rule body that is inlined, counted in nodes
+INLINE_MAX_NODES = 8
+
+
+class Optimization(NamedTuple):
+    kind: str
+    rule: str
+    detail: str = ''
+
+    def __str__(self) -> str:
+        detail = f' {self.detail}' if self.detail else ''
+        return f'{self.rule}: {self.kind}{detail}'
+
+
+def optimize(
+    rules: Iterable[Rule],
+    start: str | None = None,
+) -> tuple[tuple[Rule, ...], tuple[Optimization, ...]]:
+    """
+    Apply the optimization passes to already `optimized()` rules.
+    Returns the new rules and the report of what changed.
+    """
+    rules = tuple(rules)
+    report: list[Optimization] = []
+    for opt in (_fold, _inline, _factor):
+        rules = opt(rules, report)
+    _report_unreachable(rules, report, start)
+    return rules, tuple(report)
+
+
+def _fold(rules: tuple[Rule, ...], report: list[Optimization]) -> tuple[Rule, ...]:
+    def fold(rule: Rule, exp: Model) -> Model:
+        match exp:
+            case Sequence() if (seq := _folded_sequence(exp.sequence)) is not None:
+                report.append(Optimization('folded', rule.name, 'sequence'))
+                return seq[0] if len(seq) == 1 else Sequence(sequence=seq)
+            case Choice() if (opts := _folded_options(exp.options)) is not None:
+                report.append(Optimization('folded', rule.name, 'choice'))
+                if not opts:
+                    return Fail()
+                if len(opts) == 1 and not _contains(opts[0], Cut):
+                    # NOTE: a choice keeps the cuts of its options to itself
+                    return opts[0]
+                return _renewed(exp, options=opts)
+            case _:
+                return exp
+
+    return tuple(_rewritten(rule, fold) for rule in rules)
+
+
+def _folded_sequence(sequence: list[Model]) -> list[Model] | None:
+    folded = []
+    for e in sequence:
+        inner = _ungrouped(e)
+        if isinstance(inner, Sequence):
+            # NOTE: groups leave no trace in the result
+            folded.extend(inner.sequence)
+        elif not isinstance(e, Comment):
+            folded.append(e)
+    if not folded or (
+        len(folded) == len(sequence)
+        and all(a is b for a, b in zip(folded, sequence, strict=True))
+    ):
+        return None
+    return folded
+
+
+def _folded_options(options: Collection[Model]) -> list[Model] | None:
+    folded = []
+    for o in options:
+        if _never_succeeds(o):
+            continue
+        folded.append(o)
+        if _never_fails(o):
+            break
+    if len(folded) == len(options):
+        return None
+    return folded
+
+
+def _never_succeeds(exp: Model) -> bool:
+    match exp:
+        case Fail():
+            return True
+        case NegativeLookahead():
+            return _never_fails(exp.exp)
+        case _:
+            return False
+
+
+def _never_fails(exp: Model) -> bool:
+    match exp:
+        case Void():
+            return True
+        case Optional():
+            return not _contains(exp, Cut)
+        case _:
+            return False
+
+
+def _inline(rules: tuple[Rule, ...], report: list[Optimization]) -> tuple[Rule, ...]:
+    inlinable = {rule.name: rule for rule in rules if _is_inlinable(rule)}
+    if not inlinable:
+        return rules
+
+    def inline(rule: Rule, exp: Model) -> Model:
+        if type(exp) is not Call or exp.name not in inlinable or exp._inline:
+            return exp
+        report.append(Optimization('inlined', rule.name, exp.name))
+        callee = inlinable[exp.name]
+        return _renewed(
+            exp,
+            _inline=_renewed(callee.exp),
+            # NOTE: rules other than token rules skip whitespace on entry
+            _inline_skips=not callee.is_tokn,
+        )
+
+    return tuple(_rewritten(rule, inline) for rule in rules)
+
+
+def _is_inlinable(rule: Rule) -> bool:
+    # NOTE:
+    #   A rule call opens a new AST scope, and appends its result as a
+    #   single node. A terminal does the same when it is the body of a rule
+    #   with no parameters, names, or base. The calls keep the rule to
+    #   invoke it when there are semantic actions.
+    if rule.params or rule.kwparams or rule.base or rule.is_name:
+        return False
+    if rule.exp.nodecount() > INLINE_MAX_NODES:
+        return False
+    return _is_terminal(rule.exp)
+
+
+def _is_recursive(rule: Rule) -> bool:
+    # NOTE: the rules in a left recursive cycle are not memoized
+    return rule.is_lrec or not (rule.is_memo or rule.no_memo)
+
+
+def _is_terminal(exp: Model) -> bool:
+    match exp:
+        case Token() | Pattern() | Dot():
+            return True
+        case Constant():
+            return type(exp) is Constant
+        case Choice():
+            return all(_is_terminal(o) for o in exp.options)
+        case _:
+            return False
+
+
+def _factor(rules: tuple[Rule, ...], report: list[Optimization]) -> tuple[Rule, ...]:
+    # NOTE: @nomemo rules may depend on their semantic actions
+    nomemo = frozenset(rule.name for rule in rules if rule.no_memo)
+
+    def factor(rule: Rule, exp: Model) -> Model:
+        if type(exp) is not Choice or _is_recursive(rule):
+            return exp
+        new, count = _factored(exp, nomemo)
+        if count:
+            report.append(Optimization('factored', rule.name, f'{count} prefixes'))
+        return new
+
+    return tuple(_rewritten(rule, factor) for rule in rules)
+
+
+def _factored(choice: Choice, nomemo: frozenset[str]) -> tuple[Model, int]:
+    options = list(choice.options)
+    elements = [_elements(o) for o in options]
+    keys = [_key(els[0]) for els in elements]
+
+    result: list[Model] = []
+    count = 0
+    i = 0
+    while i < len(options):
+        j = i + 1
+        if _is_factorable(options[i], nomemo):
+            defines = _defines(options[i])
+            while (
+                j < len(options)
+                and keys[j] == keys[i]
+                and _is_factorable(options[j], nomemo)
+                and _defines(options[j]) == defines
+            ):
+                j += 1
+        if j - i < 2:
+            result.append(options[i])
+            i += 1
+            continue
+
+        run = elements[i:j]
+        n = _common_prefix_length(run)
+        for k, els in enumerate(run):
+            if len(els) == n:
+                # NOTE: options after one that is all prefix are never tried
+                run = run[: k + 1]
+                break
+        n = _unnamed_prefix_length(run, n)
+        if len(run) < 2 or n == 0:
+            result.append(options[i])
+            i += 1
+            continue
+
+        option, inner = _factored_option(run, n, nomemo)
+        result.append(option)
+        count += 1 + inner
+        i += len(run)
+
+    if not count:
+        return choice, 0
+    if len(result) == 1 and not _contains(result[0], Cut):
+        return result[0], count
+    return _renewed(choice, options=result), count
+
+
+def _factored_option(
+    run: list[list[Model]],
+    n: int,
+    nomemo: frozenset[str],
+) -> tuple[Model, int]:
+    prefix = run[0][:n]
+    suffixes = [_sequenced(els[n:]) for els in run if len(els) > n]
+
+    count = 0
+    if not suffixes:
+        return _sequenced(prefix), count
+
+    inner = suffixes[0]
+    if len(suffixes) > 1:
+        inner = Choice(options=suffixes).optimized()
+        if type(inner) is Choice:
+            inner, count = _factored(inner, nomemo)
+
+    if len(run[-1]) == n:
+        inner = Optional(exp=inner)
+    elif isinstance(inner, Choice | Sequence):
+        inner = Group(exp=inner)
+    return _sequenced([*prefix, inner]), count
+
+
+def _common_prefix_length(run: list[list[Model]]) -> int:
+    n = 0
+    shortest = min(len(els) for els in run)
+    while n < shortest and all(_key(els[n]) == _key(run[0][n]) for els in run):
+        n += 1
+    return n
+
+
+def _unnamed_prefix_length(run: list[list[Model]], n: int) -> int:
+    # NOTE: the names of the prefix would be moved after those of the rest
+    if not any(_names(els[n:]) for els in run):
+        return n
+    k = 0
+    while k < n and not _names(run[0][k : k + 1]):
+        k += 1
+    return k
+
+
+def _names(elements: list[Model]) -> bool:
+    return any(e.defines_single or e.defines_list for e in elements)
+
+
+def _is_factorable(exp: Model, nomemo: frozenset[str]) -> bool:
+    return not any(
+        isinstance(e, Cut) or (isinstance(e, Call) and e.name in nomemo)
+        for e in _walk(exp)
+    )
+
+
+def _defines(exp: Model) -> tuple[frozenset[str], frozenset[str]]:
+    return frozenset(exp.defines_single), frozenset(exp.defines_list)
+
+
+def _elements(exp: Model) -> list[Model]:
+    exp = _ungrouped(exp)
+    if isinstance(exp, Sequence):
+        return list(exp.sequence)
+    return [exp]
+
+
+def _sequenced(elements: list[Model]) -> Model:
+    if len(elements) == 1:
+        return elements[0]
+    return Sequence(sequence=elements)
+
+
+def _key(exp: Model) -> tuple[type, str]:
+    # NOTE: models compare by identity, so compare their grammar text
+    return type(exp), str(exp._pretty())
+
+
+def _report_unreachable(
+    rules: tuple[Rule, ...],
+    report: list[Optimization],
+    start: str | None,
+) -> None:
+    if not rules:
+        return
+
+    rulemap = {rule.name: rule for rule in rules}
+    used = {'start', rules[0].name, start or 'start'} & rulemap.keys()
+    pending = list(used)
+    while pending:
+        rule = rulemap[pending.pop()]
+        for name in _referenced(rule) - used:
+            if name in rulemap:
+                used.add(name)
+                pending.append(name)
+
+    for rule in rules:
+        if rule.name not in used:
+            report.append(Optimization('unreachable', rule.name))
+
+
+def _referenced(rule: Rule) -> set[str]:
+    names = set(rule._used_rule_names())
+    names.update(e.name for e in _walk(rule.exp) if isinstance(e, RuleInclude))
+    if rule.base:
+        names.add(rule.base)
+    return names
+
+
+def _rewritten(rule: Rule, fn: Callable[[Rule, Model], Model]) -> Rule:
+    if isinstance(rule, BasedRule):
+        # NOTE: these parse a right hand side built from their base
+        return rule
+    exp = _transformed(rule.exp, lambda e: fn(rule, e))
+    if exp is rule.exp:
+        return rule
+    return _renewed(rule, exp=exp, _ruleinfo=None)
+
+
+def _transformed(exp: Model, fn: Callable[[Model], Model]) -> Model:
+    # NOTE: bottom-up, and copying only what changed
+    match exp:
+        case Sequence():
+            seq = [_transformed(e, fn) for e in exp.sequence]
+            if _changed(seq, exp.sequence):
+                exp = Sequence(sequence=seq)
+        case Choice():
+            options = [_transformed(o, fn) for o in exp.options]
+            if _changed(options, exp.options):
+                exp = _renewed(exp, options=options)
+        case Join():
+            sep = _transformed(exp.sep, fn)
+            inner = _transformed(exp.exp, fn)
+            if sep is not exp.sep or inner is not exp.exp:
+                exp = _renewed(exp, exp=inner, sep=sep)
+        case Box():
+            inner = _transformed(exp.exp, fn)
+            if inner is not exp.exp:
+                exp = _renewed(exp, exp=inner)
+    return fn(exp)
+
+
+def _changed(new: Collection[Model], old: Collection[Model]) -> bool:
+    return any(a is not b for a, b in zip(new, old, strict=True))
+
+
+def _contains(exp: Model, cls: type[Model]) -> bool:
+    return any(isinstance(e, cls) for e in _walk(exp))
+
+
+def _walk(exp: Model) -> Iterator[Model]:
+    yield exp
+    match exp:
+        case Sequence():
+            for e in exp.sequence:
+                yield from _walk(e)
+        case Choice():
+            for o in exp.options:
+                yield from _walk(o)
+        case Join():
+            yield from _walk(exp.sep)
+            yield from _walk(exp.exp)
+        case Box():
+            yield from _walk(exp.exp)
+
+
+def _ungrouped(exp: Model) -> Model:
+    while type(exp) is Group:
+        exp = exp.exp
+    return exp
+
+
+def _renewed[M: Model](node: M, **changes: Any) -> M:
+    new = copy(node)
+    # NOTE: what was computed for the old node may not hold for the new one
+    for name in _cached_names(type(node)):
+        new.__dict__.pop(name, None)
+    for name, value in changes.items():
+        setattr(new, name, value)
+    return new
+
+
+@cache
+def _cached_names(cls: type) -> frozenset[str]:
+    return frozenset(
+        name
+        for c in cls.__mro__
+        for name, value in vars(c).items()
+        if isinstance(value, cached_property)
+    )
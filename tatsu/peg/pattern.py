@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import re
+import re._constants as sre
+import re._parser as sre_parse
 from functools import cached_property
 from typing import Any
 
@@ -10,7 +12,7 @@ from ..contexts import Ctx
 from ..objectmodel import nodedataclass
 from ..util import regexpp, trim
 from .base import Leaf
-from .math import ffset
+from .math import MAXFIRSTCHARS, NOCHARS, fchars, ffset
 
 
 @nodedataclass
@@ -36,6 +38,19 @@ class Pattern(Leaf):
         else:
             return {(x,)}
 
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        # NOTE: patterns match right where they are, with no skipping
+        _ = seen
+        if not skipped:
+            return None
+        try:
+            parsed = sre_parse.parse(self.pattern)
+        except Exception:
+            return None
+        if parsed.state.flags & re.IGNORECASE:
+            return None
+        return _regex_firstchars(parsed)
+
     def _pretty(self, lean=False):
         _ = lean
         pat = self.pattern or ""
@@ -54,3 +69,76 @@ class Pattern(Leaf):
 
     def __str__(self) -> str:
         return regexpp(self.pattern)[2:-1]
+
+
+def fused_pattern(patterns: list[str]) -> str | None:
+    # NOTE:
+    #   Alternation tries the alternatives in order, as a choice does,
+    #   but groups and global flags would change what is matched.
+    for pattern in patterns:
+        try:
+            cre = re.compile(pattern)
+        except re.error:
+            return None
+        if cre.groups or cre.flags != re.UNICODE:
+            return None
+    return '|'.join(f'(?:{p})' for p in patterns)
+
+
+def _regex_firstchars(items: Any) -> fchars:
+    chars: set[str] = set()
+    for op, av in items:
+        if (first := _regex_opfirstchars(op, av)) is None:
+            return None
+        chars |= first[0]
+        if len(chars) > MAXFIRSTCHARS:
+            return None
+        if not first[1]:
+            return frozenset(chars), False
+    return frozenset(chars), True
+
+
+def _regex_opfirstchars(op: Any, av: Any) -> fchars:
+    first: fchars = None
+    if op is sre.LITERAL:
+        first = frozenset(chr(av)), False
+    elif op is sre.IN:
+        first = _regex_charset(av)
+    elif op is sre.SUBPATTERN:
+        _group, add_flags, _del_flags, sub = av
+        if not add_flags & re.IGNORECASE:
+            first = _regex_firstchars(sub)
+    elif op is sre.ATOMIC_GROUP:
+        first = _regex_firstchars(av)
+    elif op is sre.BRANCH:
+        first = _regex_branchfirstchars(av[1])
+    elif op in {sre.MAX_REPEAT, sre.MIN_REPEAT, sre.POSSESSIVE_REPEAT}:
+        lo, _hi, sub = av
+        if (first := _regex_firstchars(sub)) is not None:
+            first = first[0], first[1] or not lo
+    elif op in {sre.AT, sre.ASSERT, sre.ASSERT_NOT}:
+        first = NOCHARS
+    return first
+
+
+def _regex_branchfirstchars(branches: Any) -> fchars:
+    chars: frozenset[str] = frozenset()
+    nullable = False
+    for branch in branches:
+        if (first := _regex_firstchars(branch)) is None:
+            return None
+        chars |= first[0]
+        nullable = nullable or first[1]
+    return chars, nullable
+
+
+def _regex_charset(items: Any) -> fchars:
+    chars: set[str] = set()
+    for op, av in items:
+        if op is sre.LITERAL:
+            chars.add(chr(av))
+        elif op is sre.RANGE and av[1] - av[0] < MAXFIRSTCHARS:
+            chars.update(chr(c) for c in range(av[0], av[1] + 1))
+        else:
+            return None
+    return frozenset(chars), False
@@ -16,6 +16,7 @@ from ..exceptions import FailedUnlinkedRule
 from ..objectmodel import nodedataclass
 from ..util import typename
 from .base import Grammar, Leaf, Model, Rule
+from .math import fchars
 from .syntax import Sequence
 
 
@@ -53,6 +54,11 @@ class RuleInclude(Leaf):
             return {self.name}
         return set()
 
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        if self.exp is None:
+            return None
+        return self.exp._firstchars(skipped, seen)
+
     def _pretty(self, lean=False):
         _ = lean
         return f'>{self.name}'
@@ -98,6 +104,11 @@ class BasedRule(Rule):
     def _parse(self, ctx: Ctx) -> Any:
         return self._parse_rhs(ctx, self.rhs)
 
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        _ = skipped
+        _ = seen
+        return None
+
     @cached_property
     def defines_single(self) -> list[str]:
         return list(set(super().defines_single) | set(self.exp.defines_single))
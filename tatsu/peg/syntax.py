@@ -12,8 +12,8 @@ from ..contexts.cst import cstmerge
 from ..exceptions import FailedParse, FailedRef
 from ..objectmodel import nodedataclass
 from ..util import indent, trim, typename
-from .base import PEP8_LLEN, Box, Leaf, Model, Rule
-from .math import ffset, kdot, ref
+from .base import PEP8_LLEN, Box, Grammar, Leaf, Model, Rule
+from .math import NOCHARS, fchars, ffset, kdot, ref
 
 
 @nodedataclass
@@ -56,6 +56,11 @@ class Lookahead(Box):
         with ctx.if_():
             return self.exp._parse(ctx)
 
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        _ = skipped
+        _ = seen
+        return NOCHARS
+
     def _pretty(self, lean=False):
         return '&' + self.exp._pretty(lean=lean)
 
@@ -70,6 +75,11 @@ class NegativeLookahead(Box):
         with ctx.ifnot_():
             return self.exp._parse(ctx)
 
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        _ = skipped
+        _ = seen
+        return NOCHARS
+
     def _pretty(self, lean=False):
         return '!' + str(self.exp._pretty(lean=lean))
 
@@ -86,6 +96,11 @@ class SkipTo(Box):
     def _first(self, k, f) -> ffset:
         return {('.',)} | super()._first(k, f)
 
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        _ = skipped
+        _ = seen
+        return None
+
     def _pretty(self, lean=False):
         return '->' + self.exp._pretty(lean=lean)
 
@@ -107,6 +122,11 @@ class Optional(Box):
     def _first(self, k, f) -> ffset:
         return {()} | self.exp._first(k, f)
 
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        if (fc := self.exp._firstchars(skipped, seen)) is None:
+            return None
+        return fc[0], True
+
     def _pretty(self, lean=False):
         exp = self.exp._pretty(lean=lean)
         if len(exp.splitlines()) <= 1:
@@ -175,18 +195,31 @@ class Sequence(Model):
             assert isinstance(s, Model), f'{type(s)}:{s} is not a Model'
             x = s._first(k, f)
             result = kdot(result, x, k)
-        self._firstset = result
+            if all(len(a) >= k for a in result):
+                # NOTE: the rest of the sequence may not add to the prefixes
+                break
         return result
 
     def _follow(self, k, fl, a):
         fs = a
-        for x in reversed(self.sequence):
-            if isinstance(x, Call):
-                fl[x.name] |= fs
+        for i in range(len(self.sequence) - 1, -1, -1):
+            x = self.sequence[i]
             x._follow(k, fl, fs)
-            fs = kdot(x.firstset(k=k), fs, k)
+            if i:
+                fs = kdot(x.firstset(k=k), fs, k)
         return a
 
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        chars: set[str] = set()
+        for s in self.sequence:
+            if (fc := s._firstchars(skipped, seen)) is None:
+                return None
+            first, nullable = fc
+            chars |= first
+            if not nullable:
+                return frozenset(chars), False
+        return frozenset(chars), True
+
     def nodecount(self) -> int:
         return 1 + sum(s.nodecount() for s in self.sequence)
 
@@ -217,6 +250,9 @@ class Sequence(Model):
 class Call(Leaf):
     name: str = ''
     _rule: Rule | None = None
+    # NOTE: the body of a small rule, parsed in place when there are no semantics
+    _inline: Model | None = None
+    _inline_skips: bool = False
 
     def __post_init__(self):
         if not self.name:
@@ -231,7 +267,21 @@ class Call(Leaf):
     def follow_ref(self) -> Model:
         return self.grammar.rulemap.get(self.name, self)
 
+    def link(self, grammar: Grammar):
+        super().link(grammar)
+        if self._inline is not None:
+            self._inline.link(grammar)
+
     def _parse(self, ctx: Ctx) -> Any:
+        if self._inline is not None and ctx.semantics is None:
+            try:
+                if self._inline_skips:
+                    ctx.next_token()
+                return self._inline._parse(ctx)
+            except FailedParse as e:
+                # NOTE: as a failed rule call would
+                ctx.set_furthest_exception(e)
+                raise
         try:
             if self._rule:
                 return ctx.expcall(self._rule._parse)
@@ -255,7 +305,14 @@ class Call(Leaf):
     def _follow(self, k, fl, a):
         _ = k
         fl[self.name] |= a
-        return set(a) | {self.name}
+        return a
+
+    def _firstchars(self, skipped: bool, seen: frozenset[str]) -> fchars:
+        if self.name in seen or self._grammar_ref is None:
+            return None
+        if (rule := self._rule or self.grammar.rulemap.get(self.name)) is None:
+            return None
+        return rule._firstchars(skipped, seen | {self.name})
 
     def _pretty(self, lean=False):
         _ = lean
@@ -5,9 +5,7 @@
 from __future__ import annotations
 
 import argparse
-import importlib.util
 import sys
-import time
 from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
@@ -31,7 +29,7 @@ except ImportError:
     pass
 
 from .. import peg
-from ..api import compile, to_python_sourcecode
+from ..api import compile, to_python_parser
 from ..exceptions import FailedParse
 from ..parsing import Parser
 from ..util.common import try_read, typename
@@ -62,38 +60,13 @@ def _setup_mem_parser(grammar_src: str) -> tuple[peg.Grammar, float]:
 def _setup_gen_parser(
     grammar_src: str,
     grammar_name: str,
-) -> tuple[Parser, float, Path]:
-    parser_file = f"temp_parser_{int(time.time())}.py"
-    parser_path = Path(parser_file).resolve()
-
+) -> tuple[Parser, float]:
     with timer() as tgen:
-        python_source = to_python_sourcecode(grammar_src, name=grammar_name)
-        parser_path.write_text(python_source, encoding='utf-8')
-
-        spec = importlib.util.spec_from_file_location("temp_gen_parser", parser_path)
-        if not (spec and spec.loader):
-            raise ImportError("could not create module spec")
-
-        module = importlib.util.module_from_spec(spec)
-        sys.modules["temp_gen_parser"] = module
-        spec.loader.exec_module(module)
-
-        parser_class = getattr(module, f"{grammar_name}Parser", None)
-        if not parser_class:
-            for obj in vars(module).values():
-                if (
-                    isinstance(obj, type)
-                    and issubclass(obj, Parser)
-                    and obj is not Parser
-                ):
-                    parser_class = obj
-                    break
-        if not parser_class:
-            raise RuntimeError("could not find a generated parser class in the module.")
+        parser_class = to_python_parser(grammar_src, name=grammar_name)
         parser = parser_class()
 
     gen_time = tgen.delta
-    return parser, gen_time, parser_path
+    return parser, gen_time
 
 
 def _print_run_details(
@@ -329,7 +302,7 @@ def benchmark(
         # --- Loop 2: Generated Parser ---
         genrun = None
         if 'gen' in mode:
-            parser, gensetup, parserpath = _setup_gen_parser(gramsrc, gramname)
+            parser, gensetup = _setup_gen_parser(gramsrc, gramname)
             gensetup += memsetup  # Account for initial grammar compilation
             gentime = 0.0
             generrs = 0
@@ -357,7 +330,6 @@ def benchmark(
                 avg_parsing_time=gentime / nfiles if nfiles else 0,
                 avg_lines_sec=lines_parsed / gentime if gentime else 0,
             )
-            parserpath.unlink()
 
         tiexiu_run = None
         if 'tiexiu' in mode and have_tiexiu:
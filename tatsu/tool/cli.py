@@ -156,6 +156,11 @@ def parse_args():
         help='optimize grammar model before generating output',
         action='store_true',
     )
+    generation_opts.add_argument(
+        '--fast',
+        help='generate straight-line parser code that trades readability for speed',
+        action='store_true',
+    )
     generation_opts.add_argument(
         '-w',
         '--whitespace',
@@ -272,7 +277,7 @@ def tatsu_main():
             elif args.parser_model:
                 result = parsergen(model)
             else:
-                result = pythongen(model)
+                result = pythongen(model, fast=args.fast)
 
             if outfile:
                 save(outfile, result)
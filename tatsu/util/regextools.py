@@ -14,6 +14,16 @@ else:
     PatternError = re.error
 
 
+_SCOPED_FLAGS = (
+    (re.ASCII, 'a'),
+    (re.IGNORECASE, 'i'),
+    (re.MULTILINE, 'm'),
+    (re.DOTALL, 's'),
+    (re.VERBOSE, 'x'),
+)
+_GLOBAL_FLAGS_RE = re.compile(r'\(\?[aiLmsux]+\)')
+
+
 @cache
 def cached_re_compile(
     pattern: str | bytes | re.Pattern,
@@ -26,6 +36,32 @@ def cached_re_compile(
     return re.compile(pattern, flags=flags)
 
 
+def scoped_re(pattern: str | re.Pattern) -> str:
+    """
+    Returns the pattern as a group that carries its own flags,
+    so it can be combined with other patterns.
+    """
+    cre = cached_re_compile(pattern)
+    text = cre.pattern
+    while match := _GLOBAL_FLAGS_RE.match(text):
+        text = text[match.end() :]
+    flags = ''.join(c for flag, c in _SCOPED_FLAGS if cre.flags & flag)
+    return f'(?{flags}:{text})' if flags else f'(?:{text})'
+
+
+def repeated_union_re(*patterns: str | re.Pattern | None) -> re.Pattern | None:
+    """
+    Returns a regex that matches any sequence of the given patterns,
+    or None when there is nothing to match, or they cannot be combined.
+    """
+    if not (patterns := tuple(p for p in patterns if p)):
+        return None
+    try:
+        return re.compile(f'(?:{'|'.join(scoped_re(p) for p in patterns)})*')
+    except PatternError:
+        return None
+
+
 def regexpp(regex: Any) -> str:
     """
     Returns a printable version of the regexp pattern as a Python raw string.
@@ -5,7 +5,8 @@ from __future__ import annotations
 import ast
 import builtins
 from collections.abc import Iterable, Mapping
-from functools import lru_cache
+from functools import cache, lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from . import as_namedtuple
@@ -16,6 +17,7 @@ __all__ = [
     'SecurityError',
     'is_eval_safe',
     'safe_builtins',
+    'safe_builtins_view',
     'safe_eval',
     'check_safe_eval',
     'hashable',
@@ -72,7 +74,11 @@ def hashable(obj: Any) -> bool:
 @lru_cache(maxsize=1)
 def safe_builtins() -> dict[str, Any]:
     """Returns a subset of builtins that are not exceptions or private."""
+    return dict(safe_builtins_view())
 
+
+@cache
+def safe_builtins_view() -> Mapping[str, Any]:
     def is_unsafe_builtin_entry(entry: tuple[str, Any]) -> bool:
         name, value = entry
         return (
@@ -83,8 +89,12 @@ def safe_builtins() -> dict[str, Any]:
             or isinstance(value, type | BaseException)  # type: ignore
         )
 
-    return dict(
-        entry for entry in vars(builtins).items() if not is_unsafe_builtin_entry(entry)
+    return MappingProxyType(
+        dict(
+            entry
+            for entry in vars(builtins).items()
+            if not is_unsafe_builtin_entry(entry)
+        )
     )
 
 
@@ -257,7 +267,7 @@ def check_eval_context(context: dict[str, Any]) -> None:
     # by Gemini (2026-01-26)
     # by [apalala@gmail.com](https://github.com/apalala)
     """
-    sbuiltins = safe_builtins()
+    sbuiltins = safe_builtins_view()
     scan_for_exceptions(context, set())
 
     for name, obj in context.items():
@@ -0,0 +1,79 @@
+# Copyright (c) 2017-2026 Juancarlo Añez (apalala@gmail.com)
+# SPDX-License-Identifier: BSD-4-Clause
+from __future__ import annotations
+
+import pytest
+
+import tatsu
+from tatsu.exceptions import FailedParse
+
+
+GRAMMAR = r'''
+    @@grammar :: Assign
+
+    start = {stmt}* $ ;
+    stmt = name '=' ~ expr ';' ;
+    expr = term {('+' | '-') term} ;
+    term = number | name ;
+    number = /\d+/ ;
+    name = /[a-z_]+/ ;
+'''
+
+TEXTS = [f'x = {i} + y;\nz = x - {i};\n' for i in range(12)]
+
+
+@pytest.fixture
+def grammar():
+    return tatsu.compile(GRAMMAR)
+
+
+def test_parse_many_in_process(grammar):
+    results = list(tatsu.parse_many(grammar, TEXTS, parallel=False))
+    assert [r.number for r in results] == list(range(len(TEXTS)))
+    assert all(r.success and r.path is None for r in results)
+    assert results[3].ast == grammar.parse(TEXTS[3])
+
+
+def test_parse_many_paths(grammar, tmp_path):
+    paths = []
+    for i, text in enumerate(TEXTS):
+        path = tmp_path / f'input{i}.txt'
+        path.write_text(text)
+        paths.append(path)
+    (tmp_path / 'bad.txt').write_text('x = ;\n')
+    paths.append(tmp_path / 'bad.txt')
+
+    results = sorted(tatsu.parse_many(grammar, paths, max_workers=2))
+    assert [r.path for r in results] == paths
+    assert [r.ast for r in results[:-1]] == [grammar.parse(t) for t in TEXTS]
+
+    failure = results[-1].exception
+    assert isinstance(failure, FailedParse)
+    assert failure.info.line == 0
+    assert str(paths[-1]) in str(failure)
+
+
+def test_parse_many_grammar_text():
+    results = sorted(tatsu.parse_many(GRAMMAR, TEXTS[:4], max_workers=2))
+    assert [r.ast for r in results] == [tatsu.parse(GRAMMAR, t) for t in TEXTS[:4]]
+
+
+@pytest.mark.parametrize('parallel', [False, True])
+def test_parse_many_choice_failure(parallel):
+    grammar = tatsu.compile("start = ('a' | 'b') 'c' $ ;")
+    results = sorted(tatsu.parse_many(grammar, ['a c', 'x'], parallel=parallel))
+    assert results[0].ast == ['a', 'c']
+    failure = results[1].exception
+    assert isinstance(failure, FailedParse)
+    assert failure.pos == 0
+    assert "expecting one of 'a' 'b'" in str(failure)
+
+
+def test_parse_many_interleaved():
+    other = tatsu.compile("start = {'a'}+ $ ;")
+    first = tatsu.parse_many(GRAMMAR, TEXTS[:2], parallel=False)
+    second = tatsu.parse_many(other, ['a a', 'a'], parallel=False)
+    assert next(first).ast == tatsu.parse(GRAMMAR, TEXTS[0])
+    assert next(second).ast == ['a', 'a']
+    assert next(first).ast == tatsu.parse(GRAMMAR, TEXTS[1])
+    assert next(second).ast == ['a']
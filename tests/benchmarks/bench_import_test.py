@@ -0,0 +1,64 @@
+# Copyright (c) 2017-2026 Juancarlo Añez (apalala@gmail.com)
+# SPDX-License-Identifier: BSD-4-Clause
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+
+def run_python(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return result.stdout.strip()
+
+
+@pytest.mark.benchmark
+def test_bench_import_tatsu():
+    """Benchmark a cold `import tatsu` in a fresh interpreter."""
+    run_python('import tatsu')
+
+
+@pytest.mark.benchmark
+def test_bench_import_tatsu_compile():
+    """Benchmark a cold import of `tatsu.compile` in a fresh interpreter."""
+    run_python('from tatsu import compile')
+
+
+def test_import_is_lazy():
+    loaded = run_python(
+        'import sys, tatsu; '
+        'print(" ".join(m for m in sys.modules if m.startswith("tatsu.")))',
+    ).split()
+    assert 'tatsu.contexts' in loaded
+    for module in (
+        'tatsu.api',
+        'tatsu.peg',
+        'tatsu.ngcodegen',
+        'tatsu.tool',
+        'tatsu.contexts.session',
+        'tatsu.input.mmaptext',
+        'tatsu.input.streamtext',
+    ):
+        assert module not in loaded
+
+
+def test_submodules_import_alone():
+    for module in ('tatsu.exceptions', 'tatsu.ztyle', 'tatsu.objectmodel'):
+        run_python(f'import {module}')
+
+
+def test_legacy_module_aliases():
+    assert (
+        run_python(
+            'import tatsu.tokenizing.buffer as a, tatsu.input.buffer as b; '
+            'import tatsu.ast as c, tatsu.contexts.ast as d; '
+            'print(a is b and c is d, d.__spec__.name)',
+        )
+        == 'True tatsu.contexts.ast'
+    )
@@ -9,6 +9,8 @@ import pytest
 
 from tatsu import parse
 from tatsu.input.buffer import Buffer
+from tatsu.input.infos import PosLine
+from tatsu.input.textlines import TextLines
 
 
 @pytest.fixture
@@ -90,6 +92,27 @@ def test_line_info_consistency(text, buf):
     assert text_len == info.end
 
 
+@pytest.mark.parametrize('sample', ['', 'a', 'a\n', 'ab\ncd', 'ab\r\n\ncd\n'])
+def test_line_cache(sample):
+    lines = sample.splitlines(True)
+    cache, n = PosLine.build_line_cache(lines, len(sample))
+
+    expected = []
+    start = 0
+    for lineno, line in enumerate(lines):
+        expected += [PosLine(start, lineno, len(line))] * len(line)
+        start += len(line)
+    if lines:
+        expected.append(PosLine(start, n, 0))
+
+    assert len(cache) == len(expected)
+    assert bool(cache) == bool(expected)
+    for pos, pl in enumerate(expected):
+        assert cache[pos] == pl
+        assert cache.lineno(pos) == pl.lineno
+        assert cache.startpos(pos) == pl.startpos
+
+
 def test_linecount():
     b = Buffer('')
     assert b.linecount == 1
@@ -112,3 +135,25 @@ def test_namechars():
     """
     ast = parse(grammar, 'key-word-extra;')
     assert ast == ['key-word-extra', ';']
+
+
+def test_skip_memo():
+    text = TextLines(
+        '  a # one\n (* two *)\n b',
+        eol_comments=r'#[^\n]*',
+        comments=r'\(\*.*?\*\)',
+    )
+    assert text.skip_re is not None
+
+    cursor = text.newcursor()
+    cursor.next_token()
+    assert cursor.current == 'a'
+    cursor.next()
+    cursor.next_token()
+    assert cursor.current == 'b'
+    assert text.skips == {0: 2, 3: 22}
+
+    other = text.newcursor()
+    other.goto(3)
+    other.next_token()
+    assert other.pos == 22
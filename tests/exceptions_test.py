@@ -2,10 +2,13 @@
 # SPDX-License-Identifier: BSD-4-Clause
 from __future__ import annotations
 
+import pickle
+
 import pytest
 
 import tatsu
 from tatsu.exceptions import FailedParse
+from tatsu.input.textlines import TextLines
 
 
 class TestFailedParseRender:
@@ -30,3 +33,45 @@ class TestFailedParseRender:
         assert '│' in r
         assert 'start' in r
         assert isinstance(r, str)
+
+
+class TestFailedParseLazy:
+    def test_snapshot_at_failure(self):
+        text = TextLines('one\ntwo three\n')
+        cursor = text.newcursor()
+        cursor.goto(8)
+        e = FailedParse(cursor, [], lambda: 'thunk message')
+
+        cursor.goto(0)  # the parser moves on after the failure
+        assert e.pos == 8
+        assert e.cursor.pos == 8
+        assert e.info.line == 1
+        assert e.info.col == 4
+        assert e.stack == []
+        assert e.message == 'thunk message'
+
+    def test_pattern_message(self):
+        grammar = r'''
+            start = /\d+/ $ ;
+        '''
+        model = tatsu.compile(grammar=grammar)
+
+        with pytest.raises(FailedParse) as exc_info:
+            model.parse('abc')
+
+        e = exc_info.value
+        assert e.message.startswith('Expecting')
+        assert e.stack == ['start']
+
+    def test_pickle_thunk_message(self):
+        model = tatsu.compile("start = ('a' | 'b') 'c' ;")
+
+        with pytest.raises(FailedParse) as exc_info:
+            model.parse('x')
+
+        e = exc_info.value
+        assert callable(e.msg)
+        copy = pickle.loads(pickle.dumps(e))
+        assert copy.message == e.message
+        assert copy.pos == e.pos
+        assert str(copy) == str(e)
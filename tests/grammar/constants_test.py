@@ -2,7 +2,11 @@
 # SPDX-License-Identifier: BSD-4-Clause
 from __future__ import annotations
 
-from tatsu.api import parse
+import pytest
+
+from tatsu.api import compile, parse
+from tatsu.contexts.constants import compile_constant
+from tatsu.exceptions import FailedParse
 
 
 def test_constant_interpolation():
@@ -53,3 +57,27 @@ def test_evaluate_constant():
 
     ast = parse(grammar, 'a')
     assert ast == [42, True, 'Something', None, 'a']
+
+
+def test_compiled_constants():
+    static = compile_constant('[1, 2]')
+    assert static.is_static
+    assert static.value == [1, 2]
+
+    folded = compile_constant('"x" * 2 + "!"')
+    assert folded.is_static
+    assert folded.value == 'xx!'
+
+    dynamic = compile_constant('seen: {a}')
+    assert not dynamic.is_static
+    assert dynamic.evaluate(({'a': 1},)) == 'seen: 1'
+    assert dynamic.evaluate(({},)) == 'seen: {a}'
+
+
+def test_constant_error_at_parse_time():
+    grammar = """
+        start = 'a' `1 / 0` $ ;
+    """
+    model = compile(grammar)
+    with pytest.raises(FailedParse, match='Error evaluating constant'):
+        model.parse('a')
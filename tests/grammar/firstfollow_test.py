@@ -109,3 +109,86 @@ class FirstFollowTests(unittest.TestCase):
         print(p.lookahead())
         print(p.exp.lookahead())
         assert () in p.exp.lookahead()  # nullable
+
+    def test_first_chars(self):
+        grammar = r"""
+            start = stmt $ ;
+            stmt = 'if' cond | 'while' cond | ['do'] block | NAME | name | word ;
+            cond = '(' name ')' ;
+            block = '{' '}' ;
+            name = /[a-c]\w*/ ;
+            word = /\d+/ ;
+            NAME = /[A-C]\w*/ ;
+        """
+        model = compile(grammar, 'test')
+        stmt = model.rulemap['stmt'].exp
+        assert isinstance(stmt, g.Choice)
+
+        firsts = [o.firstchars() for o in stmt.options]
+        assert firsts == [
+            {'i'},
+            {'w'},
+            {'d', '{'},
+            None,  # a token rule does not skip whitespace
+            {'a', 'b', 'c'},
+            None,
+        ]
+
+        assert model.parse('while (a)') == ['while', ['(', 'a', ')']]
+        assert model.parse('  {}') == ['{', '}']
+        assert model.parse('bx') == 'bx'
+        assert model.parse('42') == '42'
+        assert model.parse('Cx') == 'Cx'
+
+    def test_first_sets_reach_fixpoint(self):
+        grammar = """
+            start = a $ ;
+            a = b ;
+            b = c ;
+            c = d ;
+            d = 'x' | e ;
+            e = 'y' ;
+        """
+        model = compile(grammar, 'test')
+        a = model.rulemap['a']
+
+        assert ('x',) in a.firstset()
+        assert ('y',) in a.firstset()
+        assert g.ref('e') in a.firstset()
+        assert model.firstfollow() is model.firstfollow(1)
+
+    def test_first_follow_k(self):
+        grammar = """
+            start = {stmt}+ $ ;
+            stmt = 'let' name '=' value ';' | name '(' ')' ';' ;
+            value = /\\d+/ | name ;
+            name = /[a-z]+/ ;
+        """
+        model = compile(grammar, 'test')
+        stmt = model.rulemap['stmt']
+        name = model.rulemap['name']
+
+        assert stmt.firstset(2) == {
+            ('let', '[a-z]+'),
+            ('let', g.ref('name')[0]),
+            ('[a-z]+', '('),
+            (g.ref('name')[0], '('),
+        }
+        assert stmt.firstset() == {('let',), ('[a-z]+',), g.ref('name')}
+        assert stmt.exp.firstset(2) == stmt.firstset(2)
+
+        follow = model.firstfollow(2).follow['name']
+        assert {('=', '\\d+'), ('(', ')'), (';',)} <= follow
+        assert name.followset(2) == follow
+        assert ('[a-z]+', '=') in name.lookahead(2)
+
+        call = stmt.exp.options[0].exp.sequence[1]
+        assert ('=', '\\d+') in call.followset(2)
+        assert ('=', '[a-z]+') in call.followset(2)
+        assert call.lookahead(2) == {('[a-z]+', '='), (g.ref('name')[0], '=')}
+        assert stmt.exp.options[0].exp.sequence[3].followset(3) == {(';',)}
+
+        first3 = model.firstfollow(3).first['stmt']
+        assert ('let', '[a-z]+', '=') in first3
+        assert ('[a-z]+', '(', ')') in first3
+        assert all(len(p) == 3 for p in first3)
@@ -34,3 +34,20 @@ class LookaheadTests(unittest.TestCase):
         m = compile(grammar, trace=trace)
         ast = m.parse('x xx yyy a b')
         self.assertEqual(['x', ['a', 'b']], ast)
+
+    def test_names_in_lookaheads(self):
+        m = compile("start = z:'q' &(x:'a') 'a' 'c' $ ;")
+        self.assertEqual({'z': 'q', 'x': None}, m.parse('q a c'))
+
+        m = compile("start = 'q' &(@:'a') 'a' 'c' $ ;")
+        self.assertEqual(['q', 'a', 'c'], m.parse('q a c'))
+
+        m = compile("start = 'q' !(@+:'b') 'a' 'c' $ ;")
+        self.assertEqual(['q', 'a', 'c'], m.parse('q a c'))
+
+    def test_names_in_skip_groups(self):
+        m = compile("start = 'q' (?: x:'a') 'c' $ ;")
+        self.assertEqual({'x': None}, m.parse('q a c'))
+
+        m = compile("start = 'q' (?: x+:'a') 'c' $ ;")
+        self.assertEqual({'x': []}, m.parse('q a c'))
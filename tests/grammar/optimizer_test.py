@@ -0,0 +1,189 @@
+# Copyright (c) 2017-2026 Juancarlo Añez (apalala@gmail.com)
+# SPDX-License-Identifier: BSD-4-Clause
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from tatsu.api import compile, to_python_parser, to_python_sourcecode
+from tatsu.exceptions import FailedParse
+
+
+GRAMMAR = r"""
+    start: {stmt} $ ;
+
+    stmt
+        =
+        | 'let' name '=' expr ';'
+        | 'let' name ';'
+        | 'print' expr ';'
+        | 'print' ';'
+        ;
+
+    expr: term '+' expr | term '-' expr | term ;
+
+    term: NUM | name | '(' expr ')' ;
+
+    @nomemo
+    NUM: /\d+/ ;
+
+    name: /[a-z]+/ ;
+
+    unused: 'x' other ;
+
+    other: 'y' ;
+"""
+
+
+def kinds(grammar) -> dict[str, set[str]]:
+    result: dict[str, set[str]] = {}
+    for opt in grammar.optimizations:
+        result.setdefault(opt.kind, set()).add(opt.rule)
+    return result
+
+
+def same_parse(grammar, text: str) -> None:
+    # NOTE: _do_parse() parses with the grammar as written
+    try:
+        expected = json.dumps(grammar._do_parse(text), default=str)
+    except FailedParse as e:
+        with pytest.raises(FailedParse) as info:
+            grammar.parse(text)
+        assert info.value.pos == e.pos
+    else:
+        assert json.dumps(grammar.parse(text), default=str) == expected
+
+
+def test_optimizations_report():
+    grammar = compile(GRAMMAR)
+    optimized = grammar.optimized()
+
+    assert kinds(grammar) == {
+        'factored': {'stmt', 'expr'},
+        'inlined': {'stmt', 'term', 'unused'},
+        'unreachable': {'unused', 'other'},
+    }
+    assert "'let' name ('=' expr ';' | ';')" in optimized.pretty()
+    assert "expr: term ['+' expr | '-' expr]" in optimized.pretty()
+    assert set(optimized.rulemap) == set(grammar.rulemap)
+
+
+def test_inlined_rules_keep_semantics():
+    class Semantics:
+        def NUM(self, ast):
+            return int(ast)
+
+    grammar = compile(GRAMMAR)
+    text = 'print 1 + x;'
+    assert grammar.parse(text) == [['print', ['1', '+', 'x'], ';']]
+    result = grammar.parse(text, semantics=Semantics())
+    assert result == [['print', [1, '+', 'x'], ';']]
+
+
+@pytest.mark.parametrize(
+    'text',
+    [
+        'let a = 1 + 2 - b; let c; print (3); print;',
+        '',
+        'let a = ;',
+        'print 1 +;',
+        'let 1',
+        'print (1 - ;',
+    ],
+)
+def test_optimized_parses_the_same(text):
+    same_parse(compile(GRAMMAR), text)
+
+
+def test_start_at_unreachable_rule():
+    grammar = compile(GRAMMAR)
+    assert grammar.parse('x y', start='unused') == ['x', 'y']
+
+    code = to_python_sourcecode("start = 'a' ; other = 'b' ;", name='Test')
+    assert 'def other(' in code
+    parser = to_python_parser("start = 'a' ; other = 'b' ;", name='Test')
+    assert parser().parse('b', start='other') == 'b'
+
+
+def test_no_factoring_across_names():
+    grammar = compile(
+        """
+        start: x:'a' 'b' | y:'a' 'c' | 'a' 'd' ;
+        """,
+    )
+    assert 'factored' not in kinds(grammar)
+    same_parse(grammar, 'a c')
+
+    grammar = compile(
+        """
+        start: x:'a' 'b' | x:'a' 'c' ;
+        """,
+    )
+    assert kinds(grammar) == {'factored': {'start'}}
+    assert grammar.parse('a c') == {'x': 'a'}
+
+
+def test_factoring_keeps_name_order():
+    grammar = compile("start = (x:'a' y:'b' | x:'a' y:'c' 'd') $ ;")
+    assert 'factored' not in kinds(grammar)
+    same_parse(grammar, 'a b')
+    same_parse(grammar, 'a c d')
+
+    grammar = compile("start = ('a' x:'b' y:'c' | 'a' x:'b' y:'d' 'e') $ ;")
+    assert kinds(grammar) == {'factored': {'start'}}
+    choice = grammar.optimized().rulemap['start'].exp.sequence[0]
+    assert choice._pretty() == "('a' (x='b' y='c' | x='b' y='d' 'e'))"
+    same_parse(grammar, 'a b c')
+    same_parse(grammar, 'a b d e')
+
+
+def test_no_factoring_with_cuts():
+    grammar = compile(
+        """
+        start: choice 'c' ;
+        choice: 'a' ~ 'b' | 'a' 'c' | 'a' ;
+        """,
+    )
+    choice = grammar.optimized().rulemap['choice']
+    assert choice.exp._pretty() == "'a' ~ 'b' | 'a' ['c']"
+    for text in ['a c', 'a b c', 'a c c', 'a']:
+        same_parse(grammar, text)
+
+
+def test_factored_suffixes_are_factored():
+    grammar = compile(
+        """
+        start: 'a' 'b' 'c' | 'a' 'b' 'd' | 'a' 'e' | 'f' ;
+        """,
+    )
+    assert kinds(grammar) == {'factored': {'start'}}
+    exp = grammar.optimized().rules[0].exp
+    assert exp._pretty() == "'a' ('b' ('c' | 'd') | 'e') | 'f'"
+    for text in ['a b c', 'a b d', 'a e', 'f', 'a b e', 'a']:
+        same_parse(grammar, text)
+
+
+def test_folding():
+    grammar = compile(
+        """
+        start: 'a' ('b' ('c' 'd')) | !() | 'e' | () | 'f' ;
+        """,
+    )
+    assert kinds(grammar) == {'folded': {'start'}}
+    exp = grammar.optimized().rules[0].exp
+    assert exp._pretty() == "'a' 'b' 'c' 'd' | 'e' | ()"
+    for text in ['a b c d', 'e', '', 'f']:
+        same_parse(grammar, text)
+
+
+def test_join_separator_is_used():
+    grammar = compile(
+        r"""
+        start: op%{number}+ $ ;
+        op: '+' | '-' ;
+        number: /\d+/ ;
+        """,
+    )
+    assert {r.name for r in grammar.used_rules()} == {'start', 'op', 'number'}
+    assert grammar.parse('1 + 2 - 3') == ['1', '+', '2', '-', '3']
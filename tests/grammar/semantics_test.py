@@ -2,7 +2,9 @@
 # SPDX-License-Identifier: BSD-4-Clause
 from __future__ import annotations
 
+import gc
 import sys
+import weakref
 
 import pytest
 
@@ -335,5 +337,41 @@ def test_cut_scope():
         assert ast == ['a', 'c', 'd']
 
 
+def test_semantic_action_conventions():
+    grammar = r"""
+        start = num add ;
+        num = /\d+/ ;
+        add(1, name='x') = '+' num ;
+    """
+
+    class Semantics:
+        def num(self, ast):
+            return int(ast)
+
+        def add(self, ast, a, name=None, parseinfo=None):
+            return (ast[1], a, name, parseinfo.pos)
+
+    model = compile(grammar)
+    assert model.parse('1 + 2', semantics=Semantics(), parseinfo=True) == [
+        1,
+        (2, 1, 'x', 2),
+    ]
+
+
+def test_semantic_actions_released():
+    class Semantics:
+        def start(self, ast):
+            return ast.upper()
+
+    model = compile('start = /\\w+/ ;')
+    semantics = Semantics()
+    ref = weakref.ref(semantics)
+    assert model.parse('abc', semantics=semantics) == 'ABC'
+
+    del semantics
+    gc.collect()
+    assert ref() is None
+
+
 if __name__ == '__main__':
     test_cut_scope()
@@ -0,0 +1,92 @@
+# Copyright (c) 2017-2026 Juancarlo Añez (apalala@gmail.com)
+# SPDX-License-Identifier: BSD-4-Clause
+from __future__ import annotations
+
+import gc
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from tatsu.api import CompiledGrammarCache, compile, compiled_grammar_cache
+
+
+GRAMMAR = r"""
+    start = word $ ;
+    word = /\w+/ ;
+"""
+
+
+class Upper:
+    def word(self, ast):
+        return ast.upper()
+
+
+def test_semantics_are_per_caller():
+    upper = compile(GRAMMAR, semantics=Upper())
+    plain = compile(GRAMMAR)
+
+    assert upper.parse('abc') == 'ABC'
+    assert plain.parse('abc') == 'abc'
+    assert plain.semantics is None
+    assert upper.rules is plain.rules
+
+
+def test_semantics_are_not_retained():
+    semantics = Upper()
+    ref = weakref.ref(semantics)
+    model = compile(GRAMMAR, semantics=semantics)
+    assert model.parse('abc') == 'ABC'
+
+    del model, semantics
+    gc.collect()
+    assert ref() is None
+
+
+def test_cache_is_bounded():
+    cache = CompiledGrammarCache(maxsize=2)
+    cache.put('a', compile(GRAMMAR))
+    cache.put('b', compile(GRAMMAR))
+    assert cache.get('a') is not None
+    cache.put('c', compile(GRAMMAR))
+
+    assert cache.get('b') is None
+    assert cache.get('c') is not None
+    assert cache.info() == (2, 1, 2, 2)
+
+    cache.maxsize = 1
+    assert len(cache) == 1
+
+
+class SlowDict(OrderedDict):
+    # NOTE: let other threads run between a lookup and its use
+    def get(self, key, default=None):
+        value = super().get(key, default)
+        time.sleep(0.0001)
+        return value
+
+
+def test_cache_is_thread_safe():
+    cache = CompiledGrammarCache(maxsize=1)
+    cache._grammars = SlowDict()
+    model = compile(GRAMMAR)
+
+    def work(n):
+        for i in range(200):
+            cache.put(str((n + i) % 2), model)
+            cache.get(str(i % 2))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(work, range(4)))
+
+    info = cache.info()
+    assert info.hits + info.misses == 4 * 200
+    assert info.currsize == 1
+
+
+def test_compile_counts_hits():
+    before = compiled_grammar_cache.info()
+    compile(GRAMMAR, name='Counted')
+    compile(GRAMMAR, name='Counted')
+    after = compiled_grammar_cache.info()
+    assert after.hits > before.hits
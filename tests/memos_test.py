@@ -0,0 +1,107 @@
+# Copyright (c) 2017-2026 Juancarlo Añez (apalala@gmail.com)
+# SPDX-License-Identifier: BSD-4-Clause
+from __future__ import annotations
+
+import tatsu
+from tatsu.contexts.infos import RuleResult, memokey, memopos
+from tatsu.contexts.memos import MemoTable
+from tatsu.exceptions import FailedLeftRecursion, FailedParse
+from tatsu.input.null import NullCursor
+
+
+def test_memokey_order():
+    assert memopos(memokey(42, 7)) == 42
+    assert memokey(1, 1000) < memokey(2, 0)
+    assert memokey(2, 0) < memokey(2, 1)
+
+
+def test_memo_table_bounded():
+    memos = MemoTable(capacity=2)
+    memos.set(memokey(0, 0), RuleResult('a', 1))
+    memos.set(memokey(1, 0), RuleResult('b', 2))
+    memos.set(memokey(2, 0), RuleResult('c', 3))
+    assert len(memos) == 2
+    assert memos.get(memokey(0, 0)) is None
+    assert memos.get(memokey(2, 0)) == RuleResult('c', 3)
+
+
+def test_memo_table_evicts_entries():
+    memos = MemoTable(capacity=2)
+    memos.set(memokey(0, 0), RuleResult('a', 1))
+    memos.set(memokey(1, 0), RuleResult('b', 2))
+    memos.set(memokey(0, 1), RuleResult('c', 3))
+    assert set(memos) == {memokey(1, 0), memokey(0, 1)}
+
+
+def test_one_line_grammar_is_memoized(monkeypatch):
+    calls = 0
+    set_ = MemoTable.set
+
+    def counted(self, key, value):
+        nonlocal calls
+        calls += 1
+        set_(self, key, value)
+
+    monkeypatch.setattr(MemoTable, 'set', counted)
+    model = tatsu.compile("start = ('a0' | !'b' [(?: 'c') 'x']) $ ;")
+    assert calls < 5000
+    assert model.parse('a0') == 'a0'
+
+
+def test_memo_table_prune_before():
+    memos = MemoTable(capacity=100)
+    lrec = FailedLeftRecursion(NullCursor(), [], 'lrec')
+    memos.set(memokey(0, 0), RuleResult('a', 1))
+    memos.set(memokey(0, 1), lrec)
+    memos.set(memokey(3, 0), RuleResult('b', 4))
+    memos.set(memokey(5, 2), FailedParse(NullCursor(), [], 'fail'))
+
+    memos.prune_before(4)
+    assert set(memos) == {memokey(0, 1), memokey(5, 2)}
+    assert memos.get(memokey(0, 1)) is lrec
+
+
+def test_memo_table_prune_is_incremental():
+    memos = MemoTable(capacity=100)
+    for pos in (7, 2, 5):
+        memos.set(memokey(pos, 0), RuleResult(pos, pos + 1))
+
+    memos.prune_before(6)
+    assert list(memos.buckets) == [7]
+    assert memos.positions == [7]
+    assert len(memos) == 1
+
+
+def test_rule_ids_are_stable():
+    grammar = r"""
+        start = expr $ ;
+        expr = term {('+' | '-') term} ;
+        term = /\d+/ ;
+    """
+    model = tatsu.compile(grammar)
+    ctx = model.newctx()
+    ctx.parse('1 + 2')
+    ids = dict(ctx._ruleids)
+    assert set(ids) >= {'start', 'expr', 'term'}
+    assert sorted(ids.values()) == list(range(len(ids)))
+
+    ctx.parse('3 - 4 + 5')
+    assert ctx._ruleids == ids
+
+
+def test_memo_table_tracks_guards():
+    memos = MemoTable(capacity=100)
+    outer = FailedLeftRecursion(NullCursor(), [], 'outer')
+    inner = FailedLeftRecursion(NullCursor(), [], 'inner')
+    memos.set(memokey(0, 0), outer)
+
+    memos.track()
+    memos.set(memokey(0, 1), inner)
+    memos.track()
+    memos.set(memokey(0, 2), inner)
+    memos.untrack()
+
+    memos.clear_tracked()
+    assert list(memos) == [memokey(0, 0)]
+    memos.untrack()
+    assert not memos.tracking
@@ -0,0 +1,102 @@
+# Copyright (c) 2017-2026 Juancarlo Añez (apalala@gmail.com)
+# SPDX-License-Identifier: BSD-4-Clause
+from __future__ import annotations
+
+import pytest
+
+import tatsu
+from tatsu.exceptions import FailedParse
+from tatsu.input import mmaptext
+from tatsu.input.mmaptext import MmapText
+
+
+GRAMMAR = r'''
+    @@grammar :: Assign
+    @@eol_comments :: /#[^\n]*/
+
+    start = {stmt}+ $ ;
+    stmt = name '=' expr ';' ;
+    expr = term {('+' | '-') term} ;
+    term = number | name | string ;
+    number = /\d+(\.\d+)?/ ;
+    name = /[a-zé_]+/ ;
+    string = /"[^"]*"/ ;
+'''
+
+SOURCE = 'x = 1 + 2;  # comment\ny = x - 3.5 ;\nz = "héllo";\n'
+
+
+@pytest.fixture
+def grammar():
+    return tatsu.compile(GRAMMAR)
+
+
+@pytest.fixture
+def srcfile(tmp_path):
+    path = tmp_path / 'source.txt'
+    path.write_text(SOURCE * 3, encoding='utf-8')
+    return path
+
+
+def test_parse_equals_str_parse(grammar, srcfile):
+    with MmapText(srcfile, config=grammar.config) as text:
+        result = grammar.parse(text)
+    assert result == grammar.parse(SOURCE * 3)
+
+
+def test_lineinfo(srcfile):
+    with MmapText(srcfile) as text:
+        assert text.linecount == 10
+        pos = len(SOURCE.encode()) + len('x = 1 + 2;  # comment\ny = ')
+        info = text.lineinfo(pos)
+        assert info.line == 4
+        assert info.col == 4
+        assert info.text == 'y = x - 3.5 ;\n'
+        assert text.lineat(pos) == 4
+
+
+def test_error_location(grammar, tmp_path):
+    path = tmp_path / 'bad.txt'
+    path.write_text(SOURCE + 'é = 3 $;\n', encoding='utf-8')
+    with MmapText(path, config=grammar.config) as text:
+        with pytest.raises(FailedParse) as e:
+            grammar.parse(text)
+        info = e.value.info
+        assert info.line == 3
+        assert info.text == 'é = 3 $;\n'
+        assert 'bad.txt' in str(e.value)
+
+
+def test_empty_file(grammar, tmp_path):
+    path = tmp_path / 'empty.txt'
+    path.write_bytes(b'')
+    with MmapText(path, config=grammar.config) as text:
+        assert text.newcursor().atend()
+        with pytest.raises(FailedParse):
+            grammar.parse(text)
+
+
+def test_encoding_must_be_ascii_compatible(srcfile):
+    with pytest.raises(ValueError):
+        MmapText(srcfile, encoding='utf-16')
+
+
+def test_non_ascii_patterns(tmp_path, monkeypatch):
+    path = tmp_path / 'accents.txt'
+    path.write_text('éé,àé', encoding='utf-8')
+    grammar = tatsu.compile("start = /é+/ ',' /[éà]+/ $ ;")
+    assert grammar.parse('éé,àé') == ['éé', ',', 'àé']
+    with MmapText(path, config=grammar.config) as text:
+        assert grammar.parse(text) == ['éé', ',', 'àé']
+    monkeypatch.setattr(mmaptext, 'DECODE_CHUNK', 1)
+    with MmapText(path, config=grammar.config) as text:
+        assert grammar.parse(text) == ['éé', ',', 'àé']
+
+    grammar = tatsu.compile('start = /[éà]/ $ ;')
+    with MmapText(path, config=grammar.config) as text, pytest.raises(FailedParse):
+        grammar.parse(text)
+
+
+def test_non_ascii_comments(srcfile):
+    with pytest.raises(ValueError, match='non-ASCII'):
+        MmapText(srcfile, eol_comments='§.*')
@@ -2,12 +2,14 @@
 # SPDX-License-Identifier: BSD-4-Clause
 from __future__ import annotations
 
+import linecache
 import types
 
 import pytest
 
 import tatsu
 from tatsu.exceptions import FailedParse, KeywordError
+from tatsu.ngcodegen import ngparser_gen, pythongen, pythonparser
 
 
 INPUT = """
@@ -44,8 +46,8 @@ GRAMMAR = r"""
 """
 
 
-def generate_and_load_parser(name, grammar):
-    code = tatsu.to_python_sourcecode(grammar, name='Test')
+def generate_and_load_parser(name, grammar, fast=False):
+    code = tatsu.to_python_sourcecode(grammar, name='Test', fast=fast)
     # print(code)
     module = types.ModuleType(name)
     module.__file__ = '<generated>'
@@ -58,8 +60,9 @@ def test_model_parse():
     assert model.parse(INPUT) == OUTPUT
 
 
-def test_codegen_parse():
-    parser = generate_and_load_parser('test_codegen_parse', GRAMMAR)
+@pytest.mark.parametrize('fast', [False, True])
+def test_codegen_parse(fast):
+    parser = generate_and_load_parser('test_codegen_parse', GRAMMAR, fast=fast)
     output = parser.parse(INPUT, parseinfo=False)
     assert output == OUTPUT
 
@@ -85,7 +88,8 @@ def test_error_messages():
         )
 
 
-def test_name_checked():
+@pytest.mark.parametrize('fast', [False, True])
+def test_name_checked(fast):
     grammar = r"""
         @@grammar :: Test
         @@ignorecase :: True
@@ -107,11 +111,12 @@ def test_name_checked():
 
     parser = tatsu.compile(grammar, 'Test')
     subtest(parser)
-    parser = generate_and_load_parser('test_name_checked', grammar)
+    parser = generate_and_load_parser('test_name_checked', grammar, fast=fast)
     subtest(parser)
 
 
-def test_first_rule():
+@pytest.mark.parametrize('fast', [False, True])
+def test_first_rule(fast):
     grammar = """
         @@grammar :: Test
 
@@ -121,7 +126,7 @@ def test_first_rule():
     parser = tatsu.compile(grammar, 'Test')
     ast = parser.parse('test')
     assert ast is True
-    parser = generate_and_load_parser('test_first_rule', grammar)
+    parser = generate_and_load_parser('test_first_rule', grammar, fast=fast)
     ast = parser.parse('test')
     assert ast is True
 
@@ -157,7 +162,8 @@ def test_dynamic_compiled_ast():
     assert dynamic_ast == compiled_ast
 
 
-def test_none_whitespace():
+@pytest.mark.parametrize('fast', [False, True])
+def test_none_whitespace(fast):
     grammar = """
         @@whitespace:: None
 
@@ -170,12 +176,13 @@ def test_none_whitespace():
     output = parser.parse(input)
     assert output == ['This is a', ' test']
 
-    parser = generate_and_load_parser('W', grammar)
+    parser = generate_and_load_parser('W', grammar, fast=fast)
     output = parser.parse(input, parseinfo=False)
     assert output == ['This is a', ' test']
 
 
-def test_sep_join():
+@pytest.mark.parametrize('fast', [False, True])
+def test_sep_join(fast):
     grammar = r"""
     @@grammar::numbers
 
@@ -189,5 +196,173 @@ def test_sep_join():
 
     digit = /\d+/ ;
     """
-    parser = generate_and_load_parser('W', grammar)
+    parser = generate_and_load_parser('W', grammar, fast=fast)
     parser.parse('1,2,3,4', nameguard=False)
+
+
+@pytest.mark.parametrize('fast', [False, True])
+@pytest.mark.parametrize('ignorecase', [False, True])
+def test_first_char_dispatch(ignorecase, fast):
+    grammar = r"""
+        start = {stmt}+ $ ;
+        stmt = 'if' name | 'else' | 'end' | ['do'] '{' '}' | name ;
+        name = /[a-z]+/ ;
+    """
+    text = 'if x else  do {} end {} y'
+    expected = [['if', 'x'], 'else', ['do', '{', '}'], 'end', ['{', '}'], 'y']
+    model = tatsu.compile(grammar, name='Test')
+    parser = generate_and_load_parser('test_first_char_dispatch', grammar, fast=fast)
+
+    assert model.parse(text, ignorecase=ignorecase) == expected
+    assert parser.parse(text, ignorecase=ignorecase) == expected
+    if ignorecase:
+        assert model.parse('IF x', ignorecase=True) == [['if', 'x']]
+
+
+@pytest.mark.parametrize('fast', [False, True])
+def test_fused_tokens(fast):
+    grammar = r"""
+        start = {tok}+ $ ;
+        tok = 'if' | 'ifx' | '==' | '=' | word ;
+        word = /\d+/ | /[a-z]+/ ;
+    """
+    model = tatsu.compile(grammar, name='Test')
+    optimized = model.optimized()
+    tok = optimized.rulemap['tok'].exp
+    assert isinstance(tok, tatsu.peg.Choice)
+    assert isinstance(optimized.rulemap['word'].exp, tatsu.peg.Pattern)
+
+    parser = generate_and_load_parser('test_fused_tokens', grammar, fast=fast)
+    text = 'ifx if == = 12 iff'
+    expected = ['ifx', 'if', '==', '=', '12', 'iff']
+    assert model.parse(text) == expected
+    assert parser.parse(text) == expected
+    assert model.parse('IFX', ignorecase=True) == ['ifx']
+
+    with pytest.raises(FailedParse):
+        model.parse('if !')
+
+
+def test_fused_token_choice():
+    model = tatsu.compile("start = tok $ ; tok = 'a' | 'bb' | 'b' ;").optimized()
+    choice = model.rulemap['tok'].exp
+    assert isinstance(choice, tatsu.peg.TokenChoice)
+    assert choice._tokens == ('a', 'bb', 'b')
+    assert model.parse('bb') == 'bb'
+    assert model.parse('b') == 'b'
+
+
+@pytest.mark.parametrize('fast', [False, True])
+@pytest.mark.parametrize(
+    ('grammar', 'expected'),
+    [
+        ("start = x:['a' 'b'] 'c' $ ;", {'x': ['a', 'b']}),
+        ("start = @:['a' 'b'] 'c' $ ;", ['a', 'b']),
+        ("start = x+:['a' 'b'] 'c' $ ;", {'x': [['a', 'b']]}),
+    ],
+)
+def test_named_results_are_not_grown(grammar, expected, fast):
+    parser = generate_and_load_parser('test_named_results', grammar, fast=fast)
+    assert parser.parse('a b c') == expected
+    assert tatsu.parse(grammar, 'a b c') == expected
+
+
+def test_in_memory_parser():
+    model = tatsu.compile(GRAMMAR, name='Test')
+    parser_class = pythonparser(model)
+    assert parser_class.__name__ == 'TestParser'
+
+    parser = parser_class()
+    assert parser.parse(INPUT, parseinfo=False) == OUTPUT
+
+    filename = parser_class.__init__.__code__.co_filename
+    assert filename.startswith('<tatsu-Test-')
+    assert linecache.getlines(filename)
+
+    parser_class = tatsu.to_python_parser(GRAMMAR, name='Other')
+    assert parser_class.__name__ == 'OtherParser'
+    assert parser_class().parse(INPUT, parseinfo=False) == OUTPUT
+
+
+def test_in_memory_parser_linecache(monkeypatch):
+    monkeypatch.setattr(ngparser_gen, 'LINECACHE_SIZE', 1)
+    first = pythonparser(tatsu.compile(GRAMMAR, name='First'))
+    second = pythonparser(tatsu.compile(GRAMMAR, name='Second'))
+
+    assert not linecache.getlines(first.__init__.__code__.co_filename)
+    assert linecache.getlines(second.__init__.__code__.co_filename)
+
+
+def nested_choices(depth):
+    exp = "'z'"
+    for i in range(depth):
+        exp = f"('a{i}' {exp} | 'b{i}')"
+    return exp
+
+
+FAST_GRAMMAR = r"""
+    @@grammar :: Test
+    @@keyword :: let print
+
+    start = {stmt}+ $ ;
+
+    stmt
+        =
+        | 'let' ~ name:name '=' value:expr ';'
+        | 'print' args:','.{expr}+ ';'
+        | 'list' items:','%{expr} ';'
+        | 'left' @:'+'<{atom}+ ';'
+        | 'right' @:'^'>{atom}+ ';'
+        | 'tags' {tags+:tag}+ ';'
+        | 'skip' ->';'
+        | 'peek' &'(' (?: '(') @+:atom @+:atom ')' ';'
+        | 'opt' ['!' ~ bang:`True`] done:`done` ';'
+        | 'deep' deep:DEEP ';'
+        | !'end' expr ';'
+        ;
+
+    expr = a:atom {op:('*' | '/') ~ b:atom}* ;
+    atom = /\d+/ | name | '(' ~ @:expr ')' ;
+    tag = '#' @:name ;
+
+    @name
+    name = /[a-z]+/ ;
+""".replace('DEEP', nested_choices(8))
+
+FAST_INPUT = """
+    let x = 1 * 2;
+    print 1, 2, (3 / 4);
+    list 1, 2 , 3;
+    left 1 + 2 + 3;
+    right 1 ^ 2 ^ 3;
+    tags #a #b;
+    peek (1 2 );
+    opt ! ;
+    opt ;
+    deep a7 a6 a5 a4 a3 a2 a1 a0 z;
+    deep a7 a6 b5;
+    y;
+"""
+
+
+def test_fast_codegen():
+    model = tatsu.compile(FAST_GRAMMAR, name='Test')
+    code = pythongen(model, fast=True)
+    assert 'with ctx.' not in code
+    assert 'def stmt__exp' in code  # the deep nesting was moved to a helper
+
+    legacy = generate_and_load_parser('test_fast_codegen', FAST_GRAMMAR)
+    parser = generate_and_load_parser('test_fast_codegen', FAST_GRAMMAR, fast=True)
+    expected = legacy.parse(FAST_INPUT, parseinfo=False)
+    assert parser.parse(FAST_INPUT, parseinfo=False) == expected
+
+    for text in ('let let = 1;', 'print ;', 'opt ! x;', 'peek 1;'):
+        errors = []
+        for p in (legacy, parser):
+            with pytest.raises(FailedParse) as e:
+                p.parse(text)
+            errors.append((type(e.value), e.value.pos, str(e.value)))
+        assert errors[0] == errors[1]
+
+    text = 'skip whatever ! we : find ;'
+    assert parser.parse(text) == model.parse(text) == [['skip', ';']]
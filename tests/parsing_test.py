@@ -11,7 +11,8 @@ import pytest
 
 import tatsu
 from tatsu.boot import TatSuBuffer
-from tatsu.exceptions import FailedExpectingEndOfLine
+from tatsu.contexts import ParseContext
+from tatsu.exceptions import FailedExpectingEndOfLine, FailedParse
 from tatsu.util import asjson, eval_escapes, trim
 
 
@@ -220,3 +221,19 @@ class ParsingTests(unittest.TestCase):
         model = tatsu.compile(grammar, asmodel=True)
         out = model.parse('a b b b c')
         assert out == ['a', ['b', 'b', 'b'], 'c']
+
+    def test_optionexp(self):
+        def cutfail(ctx):
+            ctx.token('a')
+            ctx.cut()
+            ctx.token('x')
+
+        ctx = ParseContext()
+        with ctx.bound('a b') as c:
+            assert not c.optionexp(lambda ctx: ctx.token('b'))
+            assert c.pos == 0
+            with pytest.raises(FailedParse):
+                c.optionexp(cutfail)
+            assert c.optionexp(lambda ctx: ctx.token('a'))
+            assert c.cst == 'a'
+            assert c.pos == 1
@@ -5,6 +5,7 @@ from __future__ import annotations
 import pickle
 
 from tatsu.api import compile
+from tatsu.api.diskcache import GrammarCache
 from tatsu.objectmodel import ModelBuilderSemantics, Node
 from tatsu.util import asjson
 
@@ -64,3 +65,29 @@ def test_nested_class_synth_model():
     #       str()/repr()/JSON and compare that. The latter as it is easier.
     print(f'{type(model)=}')
     assert asjson(model.ast) == asjson(new_model.ast), type(model)
+
+
+def test_grammar_disk_cache(tmp_path):
+    grammar = r"""
+        @@grammar :: Cached
+        start = expr $ ;
+        expr = expr '+' term | term ;
+        term = /\d+/ ;
+    """
+    model = compile(grammar, cachedir=tmp_path)
+
+    store = GrammarCache(tmp_path)
+    key = store.key(grammar, None)
+    assert store.path(key).is_file()
+
+    cached = store.load(key)
+    assert cached is not None and cached is not model
+    assert cached.pretty() == model.pretty()
+    assert cached.rulemap['expr'].is_lrec
+    assert cached.rulemap['expr']._firstset == model.rulemap['expr']._firstset
+    assert cached.parse('1 + 2 + 3') == model.parse('1 + 2 + 3')
+
+    assert store.load(store.key(grammar, 'Other')) is None
+    store.path(key).write_bytes(b'garbage')
+    assert store.load(key) is None
+    assert not store.path(key).exists()
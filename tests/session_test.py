@@ -0,0 +1,124 @@
+# Copyright (c) 2017-2026 Juancarlo Añez (apalala@gmail.com)
+# SPDX-License-Identifier: BSD-4-Clause
+from __future__ import annotations
+
+import random
+
+import pytest
+
+import tatsu
+from tatsu.contexts.session import MemoEntry
+from tatsu.exceptions import FailedParse
+from tatsu.input.edittext import EditText
+
+
+GRAMMAR = r'''
+    @@grammar :: Assign
+    @@eol_comments :: /#[^\n]*/
+    @@left_recursion :: True
+
+    start = {stmt}* $ ;
+    stmt = name '=' ~ expr ';' ;
+    expr = expr ('+' | '-') ~ term | term ;
+    term = number | name | '(' ~ expr ')' ;
+    number = /\d+/ ;
+    name = /[a-z_]+/ ;
+'''
+
+SOURCE = ''.join(f'x = {i} + (y - 3);  # comment\n' for i in range(200))
+
+
+@pytest.fixture
+def grammar():
+    return tatsu.compile(GRAMMAR)
+
+
+def outcome(parse):
+    try:
+        return parse()
+    except FailedParse as e:
+        return e.pos
+
+
+def test_reparse_equals_parse(grammar):
+    session = grammar.session(SOURCE)
+    assert session.parse() == grammar.parse(SOURCE)
+
+    pos = SOURCE.index('42 +')
+    session.edit(pos, pos + 2, '(a - b)')
+    assert session.textstr == SOURCE[:pos] + '(a - b)' + SOURCE[pos + 2 :]
+    result = session.parse()
+    assert result == grammar.parse(session.textstr)
+    assert result[42][2][0] == ['(', ['a', '-', 'b'], ')']
+
+
+def test_reparse_reuses_memos(grammar):
+    session = grammar.session(SOURCE)
+    session.parse()
+    pos = SOURCE.index('42 +')
+    session.edit(pos, pos + 2, '4200')
+
+    calls = []
+    func = session.ctx.func_call
+
+    def func_call(ri):
+        calls.append(ri.name)
+        return func(ri)
+
+    session.ctx.func_call = func_call
+    session.parse()
+    assert calls.count('stmt') == 1
+    assert 0 < len(calls) < 20
+
+
+def test_edits_move_memos(grammar):
+    session = grammar.session(SOURCE)
+    session.parse()
+    session.edit(0, 0, 'a = b;\n')
+    stmt = session.ctx._ruleids['stmt']
+    pos = len('a = b;\n') + SOURCE.index('x = 1 ')
+    entry = session.text.getmemo(pos, stmt)
+    assert isinstance(entry, MemoEntry)
+    assert entry.pos == pos - len('a = b;\n')
+
+    result = session.parse()
+    assert result[2] == ['x', '=', ['1', '+', ['(', ['y', '-', '3'], ')']], ';']
+    assert entry.pos == pos
+    assert entry.value.newpos == pos + len('x = 1 + (y - 3);')
+
+
+def test_edits_invalidate_memos(grammar):
+    session = grammar.session('x = a;')
+    session.parse()
+    # NOTE: the name `a` looked past its end
+    session.edit(5, 5, 'bc')
+    assert session.parse() == [['x', '=', 'abc', ';']]
+
+
+def test_random_edits(grammar):
+    rng = random.Random(42)  # noqa: S311
+    session = grammar.session(SOURCE[:1000])
+    session.parse()
+    chars = 'xy= +-();#\n0123456789'
+    for _ in range(200):
+        size = len(session.textstr)
+        start = rng.randrange(size + 1)
+        end = min(size, start + rng.randrange(4))
+        text = ''.join(rng.choices(chars, k=rng.randrange(4)))
+        session.edit(start, end, text)
+        expected = outcome(lambda: grammar.parse(session.textstr))
+        assert outcome(session.parse) == expected
+
+
+def test_edittext_lines():
+    text = EditText('a\nbb\nccc\n')
+    text.edit(2, 4, 'x\ny\nz')
+    assert text.textstr == 'a\nx\ny\nz\nccc\n'
+    assert text.linecount == 6
+    assert text.get_lines(0, 6) == ['a\n', 'x\n', 'y\n', 'z\n', 'ccc\n', '']
+
+    info = text.lineinfo(text.textstr.index('cc'))
+    assert (info.line, info.col, info.text) == (4, 0, 'ccc\n')
+
+    with pytest.raises(ValueError):
+        text.edit(3, 100, '')
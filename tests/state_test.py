@@ -0,0 +1,84 @@
+# Copyright (c) 2017-2026 Juancarlo Añez (apalala@gmail.com)
+# SPDX-License-Identifier: BSD-4-Clause
+from __future__ import annotations
+
+from tatsu.contexts.cst import closedlist
+from tatsu.contexts.state import ParseState, ParseStateStack
+from tatsu.input.textlines import TextLines
+
+
+def newstack(text: str = 'abc') -> ParseStateStack:
+    return ParseStateStack(cursor=TextLines(text).newcursor())
+
+
+def test_append_does_not_grow_foreign_lists():
+    shared = ['a']
+    state = ParseState(TextLines('').newcursor())
+    state.append(shared)
+    state.append('b')
+    state.append('c')
+    assert shared == ['a']
+    assert state.cst == ['a', 'b', 'c']
+
+
+def test_merge_grows_in_place():
+    states = newstack()
+    states.state.append('x')
+    states.state.append('y')
+    own = states.state.cst
+
+    states.push()
+    states.state.append(closedlist(['z']))
+    states.merge()
+
+    assert states.state.cst is own
+    assert own == ['x', 'y', ['z']]
+
+
+def test_undo_leaves_parent_cst():
+    states = newstack()
+    states.state.append('x')
+    states.state.append('y')
+
+    states.push()
+    states.state.append('z')
+    states.undo()
+
+    assert states.state.cst == ['x', 'y']
+    assert states.state.fold() == ['x', 'y']
+    assert isinstance(states.state.fold(), closedlist)
+
+
+def test_push_shares_ast_until_written():
+    states = newstack()
+    states.state.append('x')
+    states.state.nameset('a')
+    parent = states.state.ast
+
+    states.push()
+    assert states.state.ast is parent
+
+    states.state.append('y')
+    states.state.nameset('b')
+    assert states.state.ast is not parent
+    assert parent == {'a': 'x'}
+
+    states.merge()
+    assert states.state.ast == {'a': 'x', 'b': 'y'}
+
+
+def test_undo_restores_shared_cursor():
+    states = newstack()
+    cursor = states.state.cursor
+    cursor.goto(1)
+
+    states.push()
+    assert states.state.cursor is cursor
+    cursor.goto(3)
+    states.undo()
+    assert cursor.pos == 1
+
+    states.push()
+    cursor.goto(2)
+    states.merge()
+    assert cursor.pos == 2
@@ -0,0 +1,109 @@
+# Copyright (c) 2017-2026 Juancarlo Añez (apalala@gmail.com)
+# SPDX-License-Identifier: BSD-4-Clause
+from __future__ import annotations
+
+import io
+
+import pytest
+
+import tatsu
+from tatsu.exceptions import FailedParse
+from tatsu.input.streamtext import StreamText
+from tatsu.ztyle import Color
+
+
+GRAMMAR = r'''
+    @@grammar :: Assign
+    @@eol_comments :: /#[^\n]*/
+
+    start = stmt ;
+    stmt = name '=' ~ expr ';' ;
+    expr = term {('+' | '-') term} ;
+    term = number | name | string ;
+    number = /\d+/ ;
+    name = /[a-zé_]+/ ;
+    string = /"[^"]*"/ ;
+'''
+
+SOURCE = 'x = 1 + 2;  # comment\ny = x - 35 ;\nz = "héllo";\n'
+
+
+@pytest.fixture
+def grammar():
+    return tatsu.compile(GRAMMAR)
+
+
+def expected(grammar):
+    return [grammar.parse(line) for line in SOURCE.splitlines()]
+
+
+def test_parse_stream_file(grammar):
+    results = list(grammar.parse_stream(io.StringIO(SOURCE)))
+    assert results == expected(grammar)
+
+
+def test_parse_stream_chunks(grammar):
+    # NOTE: tokens and comments are split across chunks
+    chunks = [SOURCE[i : i + 3] for i in range(0, len(SOURCE), 3)]
+    text = StreamText(chunks, chunksize=8, config=grammar.config)
+    assert list(grammar.parse_stream(text)) == expected(grammar)
+
+
+def test_parse_stream_empty(grammar):
+    assert list(grammar.parse_stream(iter(['  # only a comment\n']))) == []
+
+
+def test_parse_stream_releases_text(grammar):
+    def lines():
+        for i in range(1000):
+            yield f'x = {i} + y;\n'
+
+    text = StreamText(lines(), chunksize=64, config=grammar.config)
+    for count, result in enumerate(grammar.parse_stream(text)):
+        assert result[2][0] == str(count)
+        assert len(text.buffer) < 4 * 64
+    assert count == 999
+    assert text.linecount == 1001
+
+
+def test_parse_stream_stops_early(grammar):
+    lines = iter(SOURCE.splitlines(True) * 3)
+    text = StreamText(lines, chunksize=16, config=grammar.config)
+    for result in grammar.parse_stream(text):
+        assert result[0] == 'x'
+        break
+    assert len(list(lines)) > 3
+
+
+def test_parse_stream_error(grammar):
+    source = io.StringIO(SOURCE * 20 + 'é = 3 $;\n')
+    with pytest.raises(FailedParse) as e:
+        list(grammar.parse_stream(source))
+    info = e.value.info
+    assert info.line == 60
+    assert info.col == 6
+    assert info.text == 'é = 3 $;\n'
+    assert 'é = 3 $;' in str(e.value)
+
+
+def test_parse_stream_error_context(grammar):
+    source = io.StringIO(SOURCE * 2000 + 'é = 3 $;\n')
+    text = StreamText(source, chunksize=64, config=grammar.config)
+    with pytest.raises(FailedParse) as e:
+        list(grammar.parse_stream(text))
+    rendered = e.value.render(color=Color(enable=False))
+    numbered = [ln for ln in rendered.splitlines() if ln.lstrip()[:1].isdigit()]
+    assert numbered
+    assert all(ln.split('│', 1)[1].strip() for ln in numbered)
+    assert numbered[-1].endswith('é = 3 $;')
+
+
+def test_lineinfo():
+    text = StreamText(io.StringIO(SOURCE), chunksize=16)
+    cursor = text.newcursor()
+    pos = SOURCE.index('y = ')
+    cursor.goto(pos + 4)
+    info = cursor.lineinfo()
+    assert (info.line, info.col) == (1, 4)
+    assert info.text == 'y = x - 35 ;\n'
+    assert cursor.matchre(r'\w+') == 'x'